@@ -10,6 +10,8 @@ const CATEGORIES_KEY = 'baw_blog_categories';
 const TAGS_KEY = 'baw_blog_tags';
 const JSON_SOURCE = '/data/blog-posts.json';
 const DATA_LOADED_KEY = 'baw_data_loaded_from_json';
+// Sharded listing written into dist/ by scripts/shard-blog-data.py
+const LISTING_INDEX = '/data/blog/index.json';
 
 // Cache for loaded data
 let dataCache = {
@@ -69,6 +71,23 @@ async function loadDataFromSupabase() {
     }
 }
 
+// Give a post from the JSON file an id, category_id and tags
+function normalizePost(p, categories) {
+    const id = p.id || p.legacy_wp_id || p.slug || generateId();
+    let category_id = p.category_id;
+    if (!category_id && p.category_slug && categories?.length) {
+        const cat = categories.find(c => (c.slug || c.id) === p.category_slug);
+        if (cat) category_id = cat.id;
+    }
+    if (!category_id && p.category_slug) category_id = p.category_slug;
+    return {
+        ...p,
+        id,
+        category_id: category_id || null,
+        tags: p.tags || p.tag_slugs || []
+    };
+}
+
 // Load data from JSON file (fallback when Supabase not configured or failed)
 async function loadDataFromJSON() {
     try {
@@ -81,21 +100,7 @@ async function loadDataFromJSON() {
         const rawPosts = jsonData.posts || [];
 
         // Normalize: ensure id, category_id, tags for each post
-        const posts = rawPosts.map(p => {
-            const id = p.id || p.legacy_wp_id || p.slug || generateId();
-            let category_id = p.category_id;
-            if (!category_id && p.category_slug && jsonData.categories?.length) {
-                const cat = jsonData.categories.find(c => (c.slug || c.id) === p.category_slug);
-                if (cat) category_id = cat.id;
-            }
-            if (!category_id && p.category_slug) category_id = p.category_slug;
-            return {
-                ...p,
-                id,
-                category_id: category_id || null,
-                tags: p.tags || p.tag_slugs || []
-            };
-        });
+        const posts = rawPosts.map(p => normalizePost(p, jsonData.categories));
 
         dataCache.posts = posts;
         dataCache.categories = jsonData.categories && jsonData.categories.length > 0 ? jsonData.categories : [];
@@ -121,6 +126,73 @@ async function loadDataFromJSON() {
     }
 }
 
+// Supabase is fetched at most once per page load, by loadListing() or ensureDataLoaded()
+let supabaseAttempt = null;
+function loadSupabaseOnce() {
+    if (!supabaseAttempt) supabaseAttempt = loadDataFromSupabase();
+    return supabaseAttempt;
+}
+
+// Load the sharded listing (published posts without content, newest first).
+// The shards are written at build time, so when Supabase is configured it is tried first
+// (it has posts published since the last build) and the shards are only used if it fails.
+// Resolves to null when Supabase loaded or the shards are missing (dev server, or the
+// stage was not run); callers then use ensureDataLoaded(). Only the first page is fetched
+// up front: posts holds its entries, loadPages(n) resolves to the entries of the first n
+// pages and findEntry(slug) to one post's entry (or null), each fetching a page at most once.
+export async function loadListing() {
+    if (isSupabaseConfigured() && await loadSupabaseOnce()) return null;
+    try {
+        const response = await fetch(LISTING_INDEX);
+        if (!response.ok) return null;
+        const index = await response.json();
+        const pages = new Map();
+        const fetchPage = number => {
+            if (!pages.has(number)) {
+                const url = index.pages[number];
+                const page = fetch(url).then(async res => {
+                    if (!res.ok) throw new Error(`Could not load ${url}`);
+                    return (await res.json()).map(p => normalizePost(p, index.categories));
+                });
+                // A failed page is fetched again next time
+                page.catch(() => pages.delete(number));
+                pages.set(number, page);
+            }
+            return pages.get(number);
+        };
+        const loadPages = async count => {
+            const numbers = [...Array(Math.min(count, index.pages.length)).keys()];
+            return [].concat(...await Promise.all(numbers.map(fetchPage)));
+        };
+        const findEntry = async slug => {
+            for (let number = 0; number < index.pages.length; number++) {
+                const entry = (await fetchPage(number)).find(p => p.slug === slug);
+                if (entry) return entry;
+            }
+            return null;
+        };
+        const posts = await loadPages(1);
+        return {
+            posts,
+            total: index.total,
+            pageSize: index.page_size,
+            pageCount: index.pages.length,
+            categories: index.categories,
+            loadPages,
+            findEntry
+        };
+    } catch (error) {
+        return null;
+    }
+}
+
+// Full record of a listing entry's post, from its content-hashed shard
+export async function loadPostContent(entry) {
+    const response = await fetch(entry.url);
+    if (!response.ok) throw new Error(`Could not load ${entry.url}`);
+    return normalizePost({ ...(await response.json()), category_id: entry.category_id });
+}
+
 // Initialize: Supabase first (when configured), then JSON, then localStorage
 let initializationPromise = null;
 function ensureDataLoaded() {
@@ -128,7 +200,7 @@ function ensureDataLoaded() {
         initializationPromise = (async () => {
             let loaded = false;
             if (isSupabaseConfigured()) {
-                loaded = await loadDataFromSupabase();
+                loaded = await loadSupabaseOnce();
             }
             if (!loaded) {
                 loaded = await loadDataFromJSON();
@@ -156,6 +228,7 @@ function ensureDataLoaded() {
 // Reset and reload (e.g. after Import JSON to Supabase) so next ensureDataLoaded() fetches again
 export function resetDataCache() {
     initializationPromise = null;
+    supabaseAttempt = null;
     dataCache.posts = null;
     dataCache.categories = null;
     dataCache.tags = null;
@@ -455,8 +528,11 @@ export function saveTag(tagData) {
 
 // Search posts
 export function searchPosts(query, filters = {}) {
-    let posts = getAllPostsSyncInternal();
-    
+    return filterPosts(getAllPostsSyncInternal(), query, filters);
+}
+
+// Filter and sort any list of posts the way searchPosts does (listing entries have no content)
+export function filterPosts(posts, query, filters = {}) {
     // Filter by status
     if (filters.status) {
         posts = posts.filter(p => p.status === filters.status);
@@ -477,13 +553,13 @@ export function searchPosts(query, filters = {}) {
         const searchLower = query.toLowerCase();
         posts = posts.filter(p => 
             p.title.toLowerCase().includes(searchLower) ||
-            p.excerpt.toLowerCase().includes(searchLower) ||
-            p.content.toLowerCase().includes(searchLower)
+            (p.excerpt || '').toLowerCase().includes(searchLower) ||
+            (p.content || '').toLowerCase().includes(searchLower)
         );
     }
     
     // Sort by published_at (newest first) or created_at
-    posts.sort((a, b) => {
+    posts = [...posts].sort((a, b) => {
         const dateA = a.published_at || a.created_at;
         const dateB = b.published_at || b.created_at;
         return new Date(dateB) - new Date(dateA);
@@ -0,0 +1,193 @@
+// Blog full-text search over the prebuilt index in /data/search/
+// (scripts/build-search-index.py). The tokenizer, stemmer and ranking mirror
+// scripts/sitegen/search.py - change them together.
+
+const INDEX_URL = '/data/search';
+
+let indexPromise = null;
+const shardCache = new Map();
+
+// Load index.json once; resolves to null when the index was not built (e.g. on the dev server)
+export function loadSearchIndex() {
+    if (!indexPromise) {
+        indexPromise = fetch(`${INDEX_URL}/index.json`)
+            .then(res => (res.ok ? res.json() : null))
+            .then(index => (index ? { ...index, stopWords: new Set(index.stop_words) } : null))
+            .catch(() => null);
+    }
+    return indexPromise;
+}
+
+function words(text) {
+    return text
+        .toLowerCase()
+        .normalize('NFKD')
+        .replace(/\p{Mn}/gu, '')
+        .replace(/(?<=[\p{L}\p{N}_])['’](?=[\p{L}\p{N}_])/gu, '')
+        .match(/[a-z0-9]+/g) || [];
+}
+
+// Porter stemmer, steps 1a-1c and 5 (plurals, -ed/-ing, -y, trailing e/ll)
+function consonant(word, i) {
+    if ('aeiou'.includes(word[i])) return false;
+    if (word[i] === 'y') return i === 0 || !consonant(word, i - 1);
+    return true;
+}
+
+function measure(stem) {
+    let pattern = '';
+    for (let i = 0; i < stem.length; i++) pattern += consonant(stem, i) ? 'c' : 'v';
+    return (pattern.replace(/(.)\1+/g, '$1').match(/vc/g) || []).length;
+}
+
+function hasVowel(stem) {
+    for (let i = 0; i < stem.length; i++) if (!consonant(stem, i)) return true;
+    return false;
+}
+
+function doubleConsonant(word) {
+    return word.length >= 2 && word.at(-1) === word.at(-2) && consonant(word, word.length - 1);
+}
+
+function cvc(word) {
+    const n = word.length;
+    return n >= 3 && consonant(word, n - 3) && !consonant(word, n - 2) && consonant(word, n - 1) && !'wxy'.includes(word[n - 1]);
+}
+
+export function stem(word) {
+    if (word.length <= 2 || !/^[a-z]+$/.test(word)) return word;
+
+    if (word.endsWith('sses') || word.endsWith('ies')) {
+        word = word.slice(0, -2);
+    } else if (word.endsWith('s') && !word.endsWith('ss')) {
+        word = word.slice(0, -1);
+    }
+
+    if (word.endsWith('eed')) {
+        if (measure(word.slice(0, -3)) > 0) word = word.slice(0, -1);
+    } else {
+        for (const suffix of ['ed', 'ing']) {
+            if (word.endsWith(suffix) && hasVowel(word.slice(0, -suffix.length))) {
+                word = word.slice(0, -suffix.length);
+                if (word.endsWith('at') || word.endsWith('bl') || word.endsWith('iz')) {
+                    word += 'e';
+                } else if (doubleConsonant(word) && !'lsz'.includes(word.at(-1))) {
+                    word = word.slice(0, -1);
+                } else if (measure(word) === 1 && cvc(word)) {
+                    word += 'e';
+                }
+                break;
+            }
+        }
+    }
+
+    if (word.endsWith('y') && hasVowel(word.slice(0, -1))) word = word.slice(0, -1) + 'i';
+
+    if (word.endsWith('e')) {
+        const m = measure(word.slice(0, -1));
+        if (m > 1 || (m === 1 && !cvc(word.slice(0, -1)))) word = word.slice(0, -1);
+    }
+    if (word.endsWith('ll') && measure(word) > 1) word = word.slice(0, -1);
+    return word;
+}
+
+// [position, stem] pairs; stop words are skipped but keep their position
+function terms(index, text) {
+    const found = [];
+    words(text).forEach((word, position) => {
+        if (!index.stopWords.has(word) && word.length <= index.max_word_length) found.push([position, stem(word)]);
+    });
+    return found;
+}
+
+function parseQuery(index, text) {
+    const phrases = [];
+    for (const match of text.matchAll(/"([^"]*)"/g)) {
+        const found = terms(index, match[1]);
+        if (found.length > 1) phrases.push(found.map(([position, term]) => [position - found[0][0], term]));
+    }
+    const loose = terms(index, text.replace(/"([^"]*)"/g, ' ').replace(/"/g, ' '));
+    const unique = [...new Set([...loose.map(([, term]) => term), ...phrases.flat().map(([, term]) => term)])];
+    return { queryTerms: unique, phrases };
+}
+
+async function loadShard(index, key) {
+    if (!shardCache.has(key)) {
+        const digest = index.shards[key];
+        shardCache.set(key, digest
+            ? fetch(`${INDEX_URL}/terms/${key}.${digest}.json`).then(res => (res.ok ? res.json() : {})).catch(() => ({}))
+            : Promise.resolve({}));
+    }
+    return shardCache.get(key);
+}
+
+function positionsOf(posting) {
+    const positions = [];
+    let total = 0;
+    for (let i = 1; i < posting.length; i++) {
+        total += posting[i];
+        positions.push(total);
+    }
+    return positions;
+}
+
+function rank(index, queryTerms, phrases, postings) {
+    const documents = index.documents;
+    const count = documents.length;
+    const { k1, b } = index;
+    const average = index.average_length || 1;
+    const [titleWeight, excerptWeight, contentWeight] = index.field_weights;
+
+    const scores = new Map();
+    const matched = new Map();
+    const positions = new Map();
+    for (const term of queryTerms) {
+        const termPostings = postings[term] || [];
+        if (termPostings.length === 0) continue;
+        const idf = Math.log(1 + (count - termPostings.length + 0.5) / (termPostings.length + 0.5));
+        for (const posting of termPostings) {
+            const doc = posting[0];
+            const [, titleEnd, excerptEnd, length] = documents[doc];
+            const places = positionsOf(posting);
+            positions.set(`${term} ${doc}`, places);
+            let weighted = 0;
+            for (const place of places) {
+                weighted += place < titleEnd ? titleWeight : place < excerptEnd ? excerptWeight : contentWeight;
+            }
+            const norm = k1 * (1 - b + b * length / average);
+            scores.set(doc, (scores.get(doc) || 0) + idf * weighted * (k1 + 1) / (weighted + norm));
+            matched.set(doc, (matched.get(doc) || 0) + 1);
+        }
+    }
+
+    const hasPhrase = (doc, phrase) => {
+        const [[, first], ...rest] = phrase;
+        const following = rest.map(([offset, term]) => [offset, new Set(positions.get(`${term} ${doc}`) || [])]);
+        return (positions.get(`${first} ${doc}`) || []).some(start =>
+            following.every(([offset, places]) => places.has(start + offset)));
+    };
+
+    const results = [];
+    for (const [doc, score] of scores) {
+        if (phrases.every(phrase => hasPhrase(doc, phrase))) {
+            results.push([score * matched.get(doc) / queryTerms.length, doc]);
+        }
+    }
+    results.sort((x, y) => y[0] - x[0] || x[1] - y[1]);
+    return results;
+}
+
+// Ranked [{ slug, score }] for a query (use "double quotes" for phrases);
+// null when the search index is unavailable
+export async function searchBlog(text, { limit = 50 } = {}) {
+    const index = await loadSearchIndex();
+    if (!index) return null;
+    const { queryTerms, phrases } = parseQuery(index, text);
+    if (queryTerms.length === 0) return [];
+    const keys = [...new Set(queryTerms.map(term => term.slice(0, index.prefix_length)))];
+    const shards = Object.fromEntries(await Promise.all(keys.map(async key => [key, await loadShard(index, key)])));
+    const postings = Object.fromEntries(queryTerms.map(term => [term, shards[term.slice(0, index.prefix_length)][term] || []]));
+    return rank(index, queryTerms, phrases, postings)
+        .slice(0, limit)
+        .map(([score, doc]) => ({ slug: index.documents[doc][0], score }));
+}
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark the page generation pipeline on synthetic corpora.
+
+Builds corpora of 100, 1,000 and 10,000 pages by cloning the real structure,
+sector and advisory records, then times each stage - load (parse and
+validate the data files, compile templates), render, patch (the site-wide
+rewrite rules) and write - and measures peak traced memory. Results can be
+saved as JSON and compared against a saved baseline; any stage slower than
+the baseline by more than the threshold fails the comparison.
+
+Usage:
+    python3 scripts/bench-pages.py [--sizes 100 1000 10000] [--repeat 3]
+                                   [--save results.json] [--baseline baseline.json] [--threshold 0.1]
+"""
+import argparse
+import copy
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen import content
+from sitegen.output import OutputWriter
+from sitegen.pipeline import FAMILIES, compile_template, load_template
+from sitegen.rewrite import RULES, rewrite
+from sitegen import rules  # noqa: F401 - registers the rewrite rules
+
+STAGES = ('load', 'render', 'patch', 'write')
+
+# Families with data to clone (topics has no records yet)
+BENCH_FAMILIES = ('structures', 'sectors', 'advisory')
+
+# Differences smaller than this are timer noise, never regressions
+NOISE_MS = 5.0
+
+
+def write_corpus(count, directory):
+    """Write `count` cloned data files; return [(family name, path)]"""
+    seeds = {name: FAMILIES[name].load() for name in BENCH_FAMILIES}
+    corpus = []
+    for i in range(count):
+        name = BENCH_FAMILIES[i % len(BENCH_FAMILIES)]
+        record = copy.deepcopy(seeds[name][(i // len(BENCH_FAMILIES)) % len(seeds[name])])
+        if 'slug' in record:
+            record['slug'] = f'bench-{i}'
+        else:
+            record['filename'] = f'bench-{i}.html'
+        record['title'] = f'{record["title"]} {i}'
+
+        path = os.path.join(directory, name, f'bench-{i:05d}.json')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, indent=4)
+        corpus.append((name, path))
+    return corpus
+
+
+def run_once(corpus, out_dir):
+    """One cold pass over the corpus; returns {stage: seconds}"""
+    content._cache.clear()
+    content._sources.clear()
+    if os.path.exists(out_dir):
+        shutil.rmtree(out_dir)
+    times = {}
+
+    start = time.perf_counter()
+    pages = [(name, content.load_record(path, FAMILIES[name].SCHEMA)) for name, path in corpus]
+    templates = {
+        name: compile_template(FAMILIES[name], load_template(FAMILIES[name]))
+        for name in BENCH_FAMILIES
+    }
+    times['load'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rendered = [(name, page, FAMILIES[name].render(page, templates[name])) for name, page in pages]
+    times['render'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    names = list(RULES)
+    patched = [(name, page, rewrite(html, names)) for name, page, html in rendered]
+    times['patch'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with OutputWriter() as out:
+        for name, page, html in patched:
+            out.write(os.path.join(out_dir, FAMILIES[name].output_path(page)), html)
+    times['write'] = time.perf_counter() - start
+    return times
+
+
+def bench(size, repeat, workdir):
+    """Best-of-`repeat` stage times (ms) and peak traced memory (MB) for one corpus size"""
+    corpus = write_corpus(size, os.path.join(workdir, f'data-{size}'))
+    out_dir = os.path.join(workdir, f'out-{size}')
+
+    runs = [run_once(corpus, out_dir) for _ in range(repeat)]
+    result = {stage: round(min(run[stage] for run in runs) * 1000, 3) for stage in STAGES}
+    result['total'] = round(sum(result[stage] for stage in STAGES), 3)
+
+    # Separate pass - tracing allocations slows everything down
+    tracemalloc.start()
+    run_once(corpus, out_dir)
+    result['peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 2)
+    tracemalloc.stop()
+    return result
+
+
+def compare(results, baseline, threshold):
+    """Regressions: (size, stage, current ms, baseline ms) slower than baseline by over threshold"""
+    regressions = []
+    for size, stages in results['sizes'].items():
+        previous = baseline.get('sizes', {}).get(size)
+        if not previous:
+            continue
+        for stage in STAGES + ('total',):
+            current, before = stages[stage], previous.get(stage)
+            if before is None:
+                continue
+            if current > before * (1 + threshold) and current - before > NOISE_MS:
+                regressions.append((size, stage, current, before))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark page generation on synthetic corpora.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=3, help='runs per size (the fastest is kept)')
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='compare against results saved with --save')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='allowed slowdown per stage before failing, as a fraction (default 0.10)')
+    args = parser.parse_args()
+
+    results = {'python': platform.python_version(), 'repeat': args.repeat, 'sizes': {}}
+    print(f'{"pages":>7} ' + ' '.join(f'{stage + " ms":>10}' for stage in STAGES + ('total',)) + f' {"peak MB":>8}')
+    with tempfile.TemporaryDirectory(prefix='sitegen-bench-') as workdir:
+        for size in args.sizes:
+            result = bench(size, args.repeat, workdir)
+            results['sizes'][str(size)] = result
+            print(f'{size:>7} ' + ' '.join(f'{result[stage]:>10.1f}' for stage in STAGES + ('total',))
+                  + f' {result["peak_mb"]:>8.1f}')
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f'\n✅ Saved results to {args.save}')
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for size, stage, current, before in regressions:
+            print(f'❌ {size} pages, {stage}: {current:.1f} ms vs {before:.1f} ms baseline '
+                  f'(+{(current / before - 1) * 100:.0f}%)')
+        if regressions:
+            return 1
+        print(f'✅ No regressions against {args.baseline} (threshold {args.threshold:.0%})')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Build the blog full-text search index in dist/data/search/ (run after npm run build), optionally running test queries.
+
+Usage: python3 scripts/build-search-index.py [--dist DIR] [--source FILE] [-q QUERY ...] [--limit N]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import search_index_main
+
+sys.exit(search_index_main())
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Write precompressed .gz and .br sidecars for the text assets in dist/ (run after npm run build).
+
+Usage: python3 scripts/compress-dist.py [--dist DIR] [--jobs N] [--force]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import compress_main
+
+sys.exit(compress_main())
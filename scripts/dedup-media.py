@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Cluster near-duplicate images in data/wp-media-cache and write the duplicate -> canonical mapping.
+
+Usage: python3 scripts/dedup-media.py [--jobs N] [--apply] [--prune] [--dry-run]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import dedup_main
+
+sys.exit(dedup_main())
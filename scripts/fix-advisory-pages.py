@@ -4,6 +4,11 @@ Fix all advisory pages to replace template content with proper advisory content
 """
 import os
 import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.output import OutputWriter
 
 advisory_services = [
     {
@@ -162,6 +167,9 @@ service_data = {
     }
 }
 
+# Pages are written in one batch at the end, skipping any that are unchanged
+output = OutputWriter()
+
 for service in advisory_services:
     filepath = f'services-advisory/{service["filename"]}'
     if not os.path.exists(filepath):
@@ -209,9 +217,9 @@ for service in advisory_services:
         content
     )
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
+    output.write(filepath, content)
+
+for filepath in output.flush():
     print(f'Fixed {filepath}')
 
-print('\nAll advisory pages fixed!')
+print(f'\nAll advisory pages fixed! ({len(output.written)} written, {len(output.unchanged)} unchanged)')
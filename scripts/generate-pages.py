@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Generate site pages (structures, sectors, advisory, topics, blog) in one run.
+
+Usage: python3 scripts/generate-pages.py [family ...] [--jobs N] [--dry-run]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import main
+
+sys.exit(main())
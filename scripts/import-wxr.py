@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Stream a WordPress WXR export into blog-posts.json records without loading it into memory.
+
+Usage: python3 scripts/import-wxr.py [--file EXPORT.xml] [--output FILE] [--dry-run] [--memory]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import wxr_import_main
+
+sys.exit(wxr_import_main())
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Index the image references in the site's HTML, CSS, script.js and blog posts, and write the used/unused report.
+
+Usage: python3 scripts/index-images.py [--output FILE] [--force] [--show IMAGE ...]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import image_refs_main
+
+sys.exit(image_refs_main())
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Inline each built page's above-the-fold CSS and load the full stylesheet asynchronously (run after npm run build).
+
+Usage: python3 scripts/inline-critical-css.py [--dist DIR] [--dry-run]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import critical_main
+
+sys.exit(critical_main())
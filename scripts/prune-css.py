@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Write a pruned copy of styles.css containing only rules the site's pages can use (run after npm run build).
+
+Usage: python3 scripts/prune-css.py [--input styles.css] [--output dist/styles.css] [--safelist PATTERN ...] [--dry-run]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import prune_main
+
+sys.exit(prune_main())
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Work out each blog post's related posts into data/blog-related.json (run after editing or importing posts).
+
+Usage: python3 scripts/related-posts.py [--source FILE] [--full] [--show SLUG]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import related_main
+
+sys.exit(related_main())
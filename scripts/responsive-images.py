@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Generate responsive WebP/AVIF variants of the images the built pages use and add srcset/sizes to their <img> tags (run after npm run build).
+
+Usage: python3 scripts/responsive-images.py [--dist DIR] [--jobs N] [--force] [--dry-run]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import images_main
+
+sys.exit(images_main())
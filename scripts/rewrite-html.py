@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Apply site-wide rewrite rules (nav items, scroll animations) in one pass per file.
+
+Usage: python3 scripts/rewrite-html.py [rule ...] [--dry-run]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import rewrite_main
+
+sys.exit(rewrite_main())
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Split data/blog-posts.json into a paginated listing index and content-hashed per-post files in dist/data/blog/ (run after npm run build).
+
+Usage: python3 scripts/shard-blog-data.py [--dist DIR] [--source FILE] [--page-size N]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sitegen.cli import shard_blog_main
+
+sys.exit(shard_blog_main())
@@ -0,0 +1,13 @@
+"""
+Page generation engine for the Black and White Accounting site.
+
+Each page family (structures, sectors, advisory, topics, blog) is a module
+that knows how to load its records, render one page and name its output
+file. The pipeline runs any of them through the same load -> render ->
+write steps.
+"""
+
+import os
+
+# Repository root - generated paths and templates are relative to this
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
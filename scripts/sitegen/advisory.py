@@ -0,0 +1,117 @@
+"""
+Advisory service pages derived from the Management Accounts page
+"""
+
+import os
+import re
+
+from . import content, layout
+from .template import CompiledTemplate, between, element, literal, pattern
+
+NAME = 'advisory'
+TEMPLATE = 'services-accounts/management-accounts.html'
+
+# One data/content/advisory/<service>.json per page; who and benefits are (title, description) pairs
+SCHEMA = {
+    'filename': str,
+    'title': str,
+    'intro': str,
+    'what': str,
+    'who': [(str, str)],
+    'what_we_do': [str],
+    'benefits': [(str, str)],
+}
+
+
+def load():
+    """Return the advisory service records"""
+    return content.load_family(NAME, SCHEMA)
+
+
+def output_path(service):
+    """Path of the generated page, relative to the site root"""
+    return os.path.join('services-advisory', service['filename'])
+
+
+def compile_template(template):
+    """Split the Management Accounts page into literals and the slots each service fills"""
+    centred_intro = 'max-width: 600px; margin-left: auto; margin-right: auto;">'
+    return CompiledTemplate.compile(template, {
+        'title': between('<title>', '</title>'),
+        'header': element('<header class="site-header">'),
+        'breadcrumb_parent': pattern(r'<a href="/services-accounts"[^>]*>Accounts Services</a>'),
+        'breadcrumb_current': literal('<span style="color: var(--text-primary);">Management Accounts</span>'),
+        'heading': literal('<h1>Management Accounts</h1>'),
+        'intro': pattern(r'<p class="service-page-intro">.*?</p>'),
+        'what': pattern(r'<h2 style="margin-bottom: var\(--spacing-md\);">What are Management Accounts\?</h2>.*?<p style="font-size: var\(--font-size-lg\); line-height: 1\.7; color: var\(--text-secondary\); margin-bottom: var\(--spacing-lg\);">.*?</p>', re.DOTALL),
+        'who_title': literal('<h2 style="margin-bottom: var(--spacing-lg); text-align: center;">Who Needs Management Accounts?</h2>'),
+        'who_desc': between(centred_intro, '</p>', after='Who Needs Management Accounts?</h2>'),
+        'who_grid': element('<div class="grid grid-2"', after='Who Needs Management Accounts?</h2>'),
+        'what_we_do_desc': between('font-size: var(--font-size-lg);">', '</p>', after='<!-- What We Provide -->'),
+        'what_we_do_list': element('<ul style="list-style: none', after='<!-- What We Provide -->'),
+        'frequency': pattern(r'<!-- Frequency -->.*?</section>', re.DOTALL),
+        'benefits_title': literal('Benefits of Management Accounts', after='<!-- Benefits -->'),
+        'benefits_desc': between(centred_intro, '</p>', after='<!-- Benefits -->'),
+        'benefits_grid': element('<div class="grid grid-2"', after='<!-- Benefits -->'),
+        'cta_title': literal('Ready to get management accounts?'),
+        'cta_text': literal("We'll provide clear, timely financial information to help you steer your business."),
+        'back_link': literal('<a href="/services-accounts" class="btn btn-secondary">← Back to Accounts Services</a>'),
+        'footer': element('<footer class="site-footer">'),
+    })
+
+
+def render(service, template):
+    """Generate an advisory service page from the compiled template"""
+    # Who items
+    who_items_html = '<div class="grid grid-2" style="gap: var(--spacing-lg); max-width: 1000px; margin: 0 auto;">'
+    for title, desc in service['who']:
+        who_items_html += f'''
+                    <div style="background: var(--bg-white); padding: var(--spacing-xl); border-radius: var(--radius-lg); box-shadow: var(--shadow-sm);">
+                        <h3 style="font-size: var(--font-size-lg); margin-bottom: var(--spacing-sm); color: var(--text-primary);">{title}</h3>
+                        <p style="color: var(--text-secondary); line-height: 1.6; margin: 0;">{desc}</p>
+                    </div>'''
+    who_items_html += '\n                </div>'
+
+    # What We Do items
+    what_we_do_html = '<ul style="list-style: none; padding: 0; margin: 0;">'
+    for i, item in enumerate(service['what_we_do']):
+        border = 'border-bottom: 1px solid rgba(0, 0, 0, 0.06);' if i < len(service['what_we_do']) - 1 else ''
+        what_we_do_html += f'''
+                            <li style="padding: var(--spacing-md) 0; {border}">
+                                <span style="color: var(--text-secondary);">{item}</span>
+                            </li>'''
+    what_we_do_html += '\n                        </ul>'
+
+    # Benefits items
+    benefits_html = '<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: var(--spacing-md);">'
+    for title, desc in service['benefits']:
+        benefits_html += f'''
+                    <div style="background: var(--bg-white); padding: var(--spacing-lg); border-radius: var(--radius-md); box-shadow: var(--shadow-sm); text-align: center;">
+                        <h3 style="font-size: var(--font-size-base); margin-bottom: var(--spacing-xs); color: var(--text-primary);">{title}</h3>
+                        <p style="color: var(--text-secondary); line-height: 1.5; margin: 0; font-size: var(--font-size-sm);">{desc}</p>
+                    </div>'''
+    benefits_html += '\n                </div>'
+
+    return template.render({
+        'title': f'{service["title"]} Services - Black and White Accounting',
+        'header': layout.render('header'),
+        'breadcrumb_parent': '<a href="/services-advisory" style="color: var(--text-secondary); text-decoration: none;">Advisory Services</a>',
+        'breadcrumb_current': f'<span style="color: var(--text-primary);">{service["title"]}</span>',
+        'heading': f'<h1>{service["title"]}</h1>',
+        'intro': f'<p class="service-page-intro">{service["intro"]}</p>',
+        'what': f'''<h2 style="margin-bottom: var(--spacing-md);">What is {service["title"]}?</h2>
+                    <p style="font-size: var(--font-size-lg); line-height: 1.7; color: var(--text-secondary); margin-bottom: var(--spacing-lg);">{service["what"]}</p>''',
+        'who_title': '<h2 style="margin-bottom: var(--spacing-lg); text-align: center;">Who Needs This Service?</h2>',
+        'who_desc': 'This service is ideal for:',
+        'who_grid': who_items_html,
+        'what_we_do_desc': 'Our service includes:',
+        'what_we_do_list': what_we_do_html,
+        'frequency': '',
+        'benefits_title': 'Benefits',
+        'benefits_desc': 'Professional advisory services provide essential benefits.',
+        'benefits_grid': benefits_html,
+        'cta_title': f'Ready to get started with {service["title"]}?',
+        'cta_text': f"We'll help you with professional {service['title'].lower()} services.",
+        'back_link': '<a href="/services-advisory" class="btn btn-secondary">← Back to Advisory Services</a>',
+        'footer': layout.render('footer'),
+    })
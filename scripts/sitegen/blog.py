@@ -0,0 +1,375 @@
+"""
+Static blog post pages.
+
+Every published post in data/blog-posts.json becomes blog/<slug>.html -
+the URL /blog/<slug> already points at - rendered into the shared layout
+with its meta tags, structured data and table of contents, so an article
+no longer waits for the whole post archive to download and parse before it
+shows. The post page styles come from blog-post.html, which still serves
+posts added after the last build. Related posts come from
+data/blog-related.json (scripts/related-posts.py).
+
+All posts share one data file, so each page's manifest key is the post's
+updated_at plus a hash of its record: editing one post rebuilds one page.
+"""
+
+import html as html_lib
+import json
+import os
+import re
+from datetime import datetime
+
+from . import ROOT, content, layout
+from .manifest import hash_bytes
+
+NAME = 'blog'
+TEMPLATE = 'blog-post.html'
+DATA_FILE = os.path.join('data', 'blog-posts.json')
+RELATED_FILE = os.path.join('data', 'blog-related.json')
+
+# Watched for changes alongside the reference template
+DATA_FILES = (DATA_FILE, RELATED_FILE)
+
+SITE_URL = 'https://www.blackandwhiteaccounting.co.uk'
+SITE_NAME = 'Black and White Accounting'
+SITE_DESCRIPTION = 'Expert tax, accounts, and advisory services for individuals and businesses'
+
+POST_SCHEMA = {
+    'legacy_wp_id?': str,
+    'legacy_wp_url?': str,
+    'title': str,
+    'slug': str,
+    'excerpt': str | None,
+    'content': str,
+    'status': str,
+    'published_at': str | None,
+    'created_at?': str | None,
+    'updated_at': str | None,
+    'author_name': str | None,
+    'category_slug': str | None,
+    'tag_slugs': [str],
+    'featured_image_url': str | None,
+    'featured_image_alt': str | None,
+    'meta_title': str | None,
+    'meta_description': str | None,
+    'reading_time_minutes': int | None,
+}
+
+TERM_SCHEMA = {'id': str, 'name': str, 'slug': str}
+
+# What a related post card shows
+RELATED_FIELDS = ('slug', 'title', 'excerpt', 'featured_image_url', 'featured_image_alt')
+
+SCHEMA = {
+    'posts': [POST_SCHEMA],
+    'categories': [TERM_SCHEMA],
+    'tags': [TERM_SCHEMA],
+}
+
+HEADING = re.compile(r'<(h[23])\b([^>]*)>(.*?)</\1>', re.IGNORECASE | re.DOTALL)
+HEADING_ID = re.compile(r'\sid=["\']([^"\']*)["\']', re.IGNORECASE)
+TAG = re.compile(r'<[^>]+>')
+PAGE_STYLE = re.compile(r'\n(\s*<style>.*?</style>)', re.DOTALL)
+
+
+def load_related():
+    """{slug: [related slugs]}, empty until scripts/related-posts.py has run"""
+    try:
+        with open(os.path.join(ROOT, RELATED_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def load():
+    """Return the published posts, each with its category and related posts resolved"""
+    data = content.load_record(os.path.join(ROOT, DATA_FILE), SCHEMA)
+    related = load_related()
+    categories = {category['slug']: category['name'] for category in data['categories']}
+    published = {post['slug']: post for post in data['posts'] if post['status'] == 'published'}
+    return [
+        dict(
+            post,
+            category_name=categories.get(post['category_slug']),
+            related=[
+                {key: published[slug][key] for key in RELATED_FIELDS}
+                for slug in related.get(post['slug'], []) if slug in published
+            ],
+        )
+        for post in published.values()
+    ]
+
+
+def related_markup(post):
+    """The 'You might also be interested in' cards, as blog-post.html renders them"""
+    if not post['related']:
+        return ''
+    cards = []
+    for other in post['related']:
+        title = html_lib.escape(text(other['title']), quote=False)
+        excerpt = text(other['excerpt'])
+        image = ''
+        if other['featured_image_url']:
+            alt = attr(text(other['featured_image_alt'] or other['title']))
+            image = (f'<img src="{attr(other["featured_image_url"])}" alt="{alt}" style="width:100%; aspect-ratio:16/9; '
+                     f'object-fit:cover; border-radius: var(--radius-md) var(--radius-md) 0 0;">')
+        cards.append(f'''                <a href="/blog/{attr(other['slug'])}" class="card" style="text-decoration: none; color: inherit; display: flex; flex-direction: column;">
+                    {image}
+                    <div style="padding: var(--spacing-lg); flex: 1; display: flex; flex-direction: column;">
+                        <h3 style="font-size: var(--font-size-base); margin-bottom: var(--spacing-sm);">{title}</h3>
+                        <p style="font-size: var(--font-size-sm); color: var(--text-secondary); line-height: 1.6; flex: 1;">{html_lib.escape(excerpt[:120], quote=False) + '…' if excerpt else ''}</p>
+                        <span class="btn btn-secondary" style="margin-top: var(--spacing-md); text-align: center;">Read more</span>
+                    </div>
+                </a>''')
+    cards = '\n'.join(cards)
+    return f'''
+
+        <!-- Related Posts -->
+        <section class="section-alt" id="related-posts-section">
+            <div class="section-container">
+                <h2 style="text-align: center; font-size: var(--font-size-3xl); margin-bottom: var(--spacing-xl);">You might also be interested in</h2>
+                <div class="grid grid-3" id="related-posts-grid">
+{cards}
+                </div>
+            </div>
+        </section>'''
+
+
+def output_path(post):
+    """Path of the generated page, relative to the site root"""
+    return os.path.join('blog', f"{post['slug']}.html")
+
+
+def record_keys(post):
+    """The post's slice of the shared data file: its updated_at and content hash"""
+    return {f"{DATA_FILE}#{post['slug']}": f"{post['updated_at']}:{hash_bytes(json.dumps(post, sort_keys=True))}"}
+
+
+def compile_template(text):
+    """The post page's own <style> block from blog-post.html"""
+    match = PAGE_STYLE.search(text)
+    if not match:
+        raise ValueError(f'no <style> block found in {TEMPLATE}')
+    return match.group(1)
+
+
+def text(markup):
+    """Plain text of WordPress markup (titles arrive HTML-encoded)"""
+    return html_lib.unescape(TAG.sub('', markup or '')).strip()
+
+
+def attr(value):
+    return html_lib.escape(value, quote=True)
+
+
+def absolute(url):
+    return url if url.startswith('http') else f'{SITE_URL}{url}'
+
+
+def category(post):
+    """The post's category name, or None for uncategorised posts"""
+    if not post['category_slug'] or post['category_slug'].startswith('uncategori'):
+        return None
+    return post['category_name']
+
+
+def format_date(value):
+    """'3 April 2013', as formatDate() in blog-data.js shows it"""
+    if not value:
+        return ''
+    date = datetime.fromisoformat(value)
+    return f'{date.day} {date:%B %Y}'
+
+
+def iso_date(value):
+    return datetime.fromisoformat(value).isoformat() if value else None
+
+
+def with_heading_ids(markup):
+    """
+    Give every h2/h3 an id (heading-<n> unless it has one, as the client-side
+    TOC does) and return (markup, [(level, id, text)]).
+    """
+    headings = []
+
+    def heading(match):
+        tag, attrs, inner = match.groups()
+        existing = HEADING_ID.search(attrs)
+        heading_id = existing.group(1) if existing else f'heading-{len(headings)}'
+        headings.append((int(tag[1]), heading_id, text(inner)))
+        if not existing:
+            attrs = f' id="{heading_id}"{attrs}'
+        return f'<{tag}{attrs}>{inner}</{tag}>'
+    return HEADING.sub(heading, markup), headings
+
+
+def body_markup(post):
+    """Post content as HTML; plain-text posts become paragraphs"""
+    if re.search(r'<[a-z][\s\S]*>', post['content'], re.IGNORECASE):
+        return post['content']
+    paragraphs = [block.strip() for block in post['content'].split('\n\n') if block.strip()]
+    return '\n'.join(f'<p>{html_lib.escape(block)}</p>' for block in paragraphs)
+
+
+def json_ld(data):
+    """A JSON-LD script body that cannot close its <script> element early"""
+    return json.dumps(data, ensure_ascii=False).replace('</', '<\\/')
+
+
+def head_markup(post, style):
+    """Meta description, canonical, Open Graph, Twitter and JSON-LD tags plus the page styles"""
+    url = f"{SITE_URL}/blog/{post['slug']}"
+    title = text(post['meta_title'] or post['title'])
+    description = text(post['meta_description'] or post['excerpt']) or SITE_DESCRIPTION
+    image = absolute(post['featured_image_url']) if post['featured_image_url'] else None
+    image_alt = text(post['featured_image_alt'] or post['title'])
+
+    properties = [
+        ('og:type', 'article'),
+        ('og:title', title),
+        ('og:description', description),
+        ('og:url', url),
+        ('og:site_name', SITE_NAME),
+        ('og:locale', 'en_GB'),
+    ]
+    if image:
+        properties += [('og:image', image), ('og:image:alt', image_alt)]
+    if post['published_at']:
+        properties.append(('article:published_time', iso_date(post['published_at'])))
+    if post['updated_at']:
+        properties.append(('article:modified_time', iso_date(post['updated_at'])))
+    if category(post):
+        properties.append(('article:section', category(post)))
+
+    names = [
+        ('description', description),
+        ('twitter:card', 'summary_large_image'),
+        ('twitter:title', title),
+        ('twitter:description', description),
+    ]
+    if image:
+        names += [('twitter:image', image), ('twitter:image:alt', image_alt)]
+
+    article = {
+        '@context': 'https://schema.org',
+        '@type': 'Article',
+        'headline': text(post['title']),
+        'description': description,
+        'image': image,
+        'datePublished': iso_date(post['published_at']),
+        'dateModified': iso_date(post['updated_at'] or post['published_at']),
+        'author': {'@type': 'Organization', 'name': post['author_name'] or SITE_NAME, 'url': SITE_URL},
+        'publisher': {
+            '@type': 'Organization',
+            'name': SITE_NAME,
+            'url': SITE_URL,
+            'logo': {'@type': 'ImageObject', 'url': f'{SITE_URL}/Images/long logo.png'},
+        },
+        'mainEntityOfPage': {'@type': 'WebPage', '@id': url},
+    }
+    article = {key: value for key, value in article.items() if value is not None}
+    breadcrumbs = {
+        '@context': 'https://schema.org',
+        '@type': 'BreadcrumbList',
+        'itemListElement': [
+            {'@type': 'ListItem', 'position': 1, 'name': 'Home', 'item': SITE_URL},
+            {'@type': 'ListItem', 'position': 2, 'name': 'Insights', 'item': f'{SITE_URL}/blog'},
+            {'@type': 'ListItem', 'position': 3, 'name': text(post['title']), 'item': url},
+        ],
+    }
+
+    lines = [f'<meta name="{name}" content="{attr(value)}">' for name, value in names]
+    lines.append(f'<link rel="canonical" href="{attr(url)}">')
+    lines += [f'<meta property="{name}" content="{attr(value)}">' for name, value in properties]
+    lines.append(f'<script type="application/ld+json">{json_ld(article)}</script>')
+    lines.append(f'<script type="application/ld+json">{json_ld(breadcrumbs)}</script>')
+    return '\n' + '\n'.join(f'    {line}' for line in lines) + '\n' + style
+
+
+def render(post, template=None):
+    """Generate HTML for one blog post."""
+    title = html_lib.escape(text(post['title']), quote=False)
+    body, headings = with_heading_ids(body_markup(post))
+
+    meta = []
+    if category(post):
+        meta += [f'<span>{html_lib.escape(category(post))}</span>', '<span>•</span>']
+    meta += [f'<span>{format_date(post["published_at"])}</span>', '<span>•</span>',
+             f'<span>{post["reading_time_minutes"] or 5} min read</span>']
+
+    toc = '\n'.join(
+        f'                    <li class="toc-item level-{level}"><a href="#{attr(heading_id)}">{html_lib.escape(label, quote=False)}</a></li>'
+        for level, heading_id, label in headings
+    )
+    featured = ''
+    if post['featured_image_url']:
+        alt = attr(text(post['featured_image_alt'] or post['title']))
+        featured = f'<img src="{attr(post["featured_image_url"])}" alt="{alt}" class="blog-post-featured-image">'
+
+    wrapper_class = 'blog-post-content-wrapper' if headings else 'blog-post-content-wrapper no-toc'
+    toc_aside = f'''
+            <aside class="blog-post-toc">
+                <div class="toc-title" id="toc-toggle">Table of Contents</div>
+                <ul class="toc-list" id="toc-list">
+{toc}
+                </ul>
+            </aside>
+''' if headings else ''
+
+    main = f'''        <!-- Blog Post Header -->
+        <section class="blog-post-header">
+            <div class="blog-post-header-content">
+                <div class="blog-post-meta" id="post-meta">{''.join(meta)}</div>
+                <h1 class="blog-post-title" id="post-title">{title}</h1>
+            </div>
+        </section>
+
+        <!-- Blog Post Content -->
+        <div class="{wrapper_class}">{toc_aside}
+            <article class="blog-post-main">
+                <div id="post-featured-image">{featured}</div>
+                <div class="blog-post-content" id="post-content">
+{body}
+                </div>
+            </article>
+
+            <aside class="blog-post-sidebar">
+                <div class="cta-mini">
+                    <h3>Need Help?</h3>
+                    <p>Phone Us</p>
+                    <a href="tel:08001404644" class="btn btn-primary">0800 140 4644</a>
+                    <a href="/contact" class="btn btn-secondary">Contact Us</a>
+                </div>
+            </aside>
+        </div>{related_markup(post)}
+
+        <!-- End of Article CTA -->
+        <section class="section">
+            <div class="section-container">
+                <div class="blog-post-cta">
+                    <h2>Need help with this?</h2>
+                    <p>Get in touch with our team for expert advice and support.</p>
+                    <div class="blog-post-cta-actions">
+                        <a href="/contact" class="btn btn-primary">Contact Us</a>
+                        <a href="tel:08001404644" class="btn btn-secondary">Call 0800 140 4644</a>
+                    </div>
+                </div>
+            </div>
+        </section>'''
+    if headings:
+        main += '''
+
+        <script>
+            (function () {
+                var tocList = document.getElementById('toc-list');
+                document.getElementById('toc-toggle').addEventListener('click', function () {
+                    if (window.innerWidth <= 1024) tocList.classList.toggle('open');
+                });
+                tocList.addEventListener('click', function (e) {
+                    if (e.target.closest('a') && window.innerWidth <= 1024) tocList.classList.remove('open');
+                });
+            })();
+        </script>'''
+
+    page_title = f"{text(post['meta_title'] or post['title'])} | {SITE_NAME}"
+    return layout.render_page(html_lib.escape(page_title, quote=False), main, head_markup(post, template or ''))
@@ -0,0 +1,162 @@
+"""
+Sharded blog data for the built site.
+
+data/blog-posts.json holds the full HTML of every post, so the blog listing
+downloads megabytes to show nine cards. This stage splits it into
+dist/data/blog/:
+
+    index.json                    entry point: post count, page size, page
+                                  URLs, categories and the tags file URL
+    pages/<n>.<hash>.json         listing entries, newest first, PAGE_SIZE
+                                  per page
+    posts/<slug>.<hash>.json      one post's full record
+    tags.<hash>.json              the tag list (only post pages need it)
+
+Every file but index.json is named by its content hash, so it can be cached
+forever: editing one post changes its own file and the listing page it sits
+on, and nothing else. Files already present are not rewritten, and shards
+left over from earlier builds are removed.
+"""
+
+import json
+import os
+
+from . import ROOT
+from .compress import DIST_DIR
+from .manifest import hash_bytes
+from .output import write_atomic
+
+SOURCE_FILE = os.path.join(ROOT, 'data', 'blog-posts.json')
+
+# Under dist/; served as /data/blog/
+SHARD_DIR = os.path.join('data', 'blog')
+SHARD_URL = '/data/blog'
+
+# The listing shows a featured post plus nine cards, so page 1 fills the first screen
+PAGE_SIZE = 10
+
+LISTING_FIELDS = (
+    'title', 'slug', 'excerpt', 'category_slug', 'published_at',
+    'featured_image_url', 'featured_image_alt', 'reading_time_minutes',
+)
+
+HASH_LENGTH = 10
+
+# Precompressed copies written next to the shards by npm run compress
+SIDECAR_SUFFIXES = ('.gz', '.br')
+
+
+def encode(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def hashed_name(stem, data):
+    return f'{stem}.{hash_bytes(data)[:HASH_LENGTH]}.json'
+
+
+def published_posts(data):
+    """Published posts, newest first (ties broken by slug so pages are stable)"""
+    posts = [post for post in data['posts'] if post.get('status') == 'published']
+    posts.sort(key=lambda post: post['slug'])
+    posts.sort(key=lambda post: post.get('published_at') or post.get('created_at') or '', reverse=True)
+    return posts
+
+
+def shards(data, page_size=PAGE_SIZE):
+    """
+    The shard files for a blog-posts.json document as {relative path: bytes},
+    index.json included.
+    """
+    files = {}
+
+    def add(directory, stem, value):
+        body = encode(value)
+        name = hashed_name(stem, body)
+        rel = f'{directory}/{name}' if directory else name
+        files[rel] = body
+        return f'{SHARD_URL}/{rel}'
+
+    entries = []
+    for post in published_posts(data):
+        entry = {field: post.get(field) for field in LISTING_FIELDS}
+        entry['url'] = add('posts', post['slug'], post)
+        entries.append(entry)
+
+    pages = [
+        add('pages', str(number), entries[start:start + page_size])
+        for number, start in enumerate(range(0, len(entries), page_size), 1)
+    ]
+    index = {
+        'total': len(entries),
+        'page_size': page_size,
+        'pages': pages,
+        'categories': data.get('categories', []),
+        'tags': add(None, 'tags', data.get('tags', [])),
+    }
+    files['index.json'] = encode(index)
+    return files
+
+
+def unchanged_file(path, rel, body):
+    """Whether path already holds body (hashed names imply it; index.json is compared)"""
+    if not os.path.exists(path):
+        return False
+    if rel != 'index.json':
+        return True
+    with open(path, 'rb') as f:
+        return f.read() == body
+
+
+def write(files, root):
+    """
+    Write {relative path: bytes} files under root, skipping those already
+    there, and delete the files under root that are not among them.
+    Returns (written, unchanged, removed).
+    """
+    written = []
+    unchanged = []
+    for rel, body in files.items():
+        path = os.path.join(root, *rel.split('/'))
+        if unchanged_file(path, rel, body):
+            unchanged.append(rel)
+            continue
+        write_atomic(path, body)
+        written.append(rel)
+
+    removed = 0
+    for directory, _, names in os.walk(root):
+        for name in names:
+            rel = os.path.relpath(os.path.join(directory, name), root).replace(os.sep, '/')
+            # Sidecars belong to npm run compress, which drops orphaned ones itself
+            if rel not in files and not rel.endswith(SIDECAR_SUFFIXES):
+                os.unlink(os.path.join(directory, name))
+                removed += 1
+    return written, unchanged, removed
+
+
+def shard(source=SOURCE_FILE, dist=DIST_DIR, page_size=PAGE_SIZE):
+    """
+    Split the blog data into shards under dist/.
+
+    Returns {'posts': n, 'pages': n, 'written': [...], 'unchanged': n,
+    'removed': n, 'source_bytes': n, 'index_bytes': n, 'first_page_bytes': n,
+    'listing_bytes': index plus every page}.
+    """
+    with open(source, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    files = shards(data, page_size)
+    written, unchanged, removed = write(files, os.path.join(dist, SHARD_DIR))
+    pages = [rel for rel in files if rel.startswith('pages/')]
+    index = json.loads(files['index.json'])
+    first_page = index['pages'][0][len(SHARD_URL) + 1:] if index['pages'] else None
+    return {
+        'posts': index['total'],
+        'pages': len(pages),
+        'written': written,
+        'unchanged': len(unchanged),
+        'removed': removed,
+        'source_bytes': os.path.getsize(source),
+        'index_bytes': len(files['index.json']),
+        'first_page_bytes': len(files[first_page]) if first_page else 0,
+        'listing_bytes': len(files['index.json']) + sum(len(files[rel]) for rel in pages),
+    }
@@ -0,0 +1,468 @@
+"""
+Command line entry point for the page generators.
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+from datetime import datetime
+
+from . import ROOT, blogshards, compress, critical, css, imagerefs, images, mediadedup, related, search, wxr
+from .content import ContentError
+from .output import OutputWriter, write_atomic
+from .manifest import dependents, load_manifest
+from .pipeline import FAMILIES, build, plan
+from .rewrite import RULES, rewrite_files
+from .rules import GROUPS
+from .stats import profiled
+from .watch import watch
+
+PROFILE_FILE = os.path.join(ROOT, '.sitegen-cache', 'build.pstats')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate site pages from their templates and data.')
+    parser.add_argument('families', nargs='*', metavar='family',
+                        help=f'page family to build: {", ".join(FAMILIES)} (default: all)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: CPU count, 1 renders in-process)')
+    parser.add_argument('--dry-run', action='store_true', help='render pages without writing them')
+    parser.add_argument('--force', action='store_true', help='rebuild pages even if their inputs are unchanged')
+    parser.add_argument('--minify', action='store_true',
+                        help='minify pages before writing them and report the size reduction')
+    parser.add_argument('--graph', action='store_true',
+                        help='print each input file and the pages built from it, then exit')
+    parser.add_argument('--plan', action='store_true',
+                        help='print the pages that would be rebuilt and why, then exit')
+    parser.add_argument('--watch', action='store_true',
+                        help='rebuild affected pages whenever a data file, template or partial changes')
+    parser.add_argument('--profile', nargs='?', const=PROFILE_FILE, metavar='FILE',
+                        help=f'profile the build with cProfile (renders in-process) and write pstats '
+                             f'to FILE (default: {os.path.relpath(PROFILE_FILE, ROOT)})')
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.families if name not in FAMILIES]
+    if unknown:
+        parser.error(f'unknown page family: {", ".join(unknown)}')
+
+    if args.graph:
+        print_graph()
+        return 0
+    try:
+        if args.plan:
+            print_plan(args.families, args.force, args.minify)
+            return 0
+        if args.watch:
+            watch(args.families, jobs=args.jobs or 1, minify=args.minify)
+            return 0
+
+        start = time.perf_counter()
+        if args.profile:
+            os.makedirs(os.path.dirname(os.path.abspath(args.profile)), exist_ok=True)
+            # Worker processes are invisible to cProfile, so render in-process
+            with profiled(args.profile):
+                summary = build(args.families, jobs=1, dry_run=args.dry_run, force=args.force, minify=args.minify)
+        else:
+            summary = build(args.families, jobs=args.jobs, dry_run=args.dry_run, force=args.force, minify=args.minify)
+        elapsed = time.perf_counter() - start
+    except ContentError as e:
+        # The message starts with the data file (and the key that failed)
+        print(f'❌ Invalid content: {e}')
+        return 1
+
+    if summary['minified']:
+        print_minified(summary['minified'])
+
+    print()
+    for line in summary['stats'].table():
+        print(line)
+    print(f'\n✅ Built {len(summary["built"])} pages ({summary["written"]} written, '
+          f'{len(summary["built"]) - summary["written"]} identical), skipped {len(summary["skipped"])} unchanged, '
+          f'removed {len(summary["removed"])} no longer produced in {elapsed:.2f}s (saved ~{summary["saved"]:.2f}s)')
+    return 0
+
+
+def print_graph():
+    """Every input recorded in the manifest with the pages that depend on it"""
+    graph = dependents(load_manifest())
+    if not graph:
+        print('No build recorded yet - run a build first')
+        return
+    for name, pages in graph.items():
+        print(f'{name} ({len(pages)} page{"s" if len(pages) != 1 else ""})')
+        for page in pages:
+            print(f'    {page}')
+
+
+def print_minified(pages):
+    """Size before and after minification, per page and overall"""
+    width = max(len(path) for path, _, _ in pages) + 2
+    print()
+    for path, before, after in pages:
+        print(f'{path:<{width}} {before / 1024:>7.1f} KB -> {after / 1024:>7.1f} KB  {_reduction(before, after)}')
+    before = sum(size for _, size, _ in pages)
+    after = sum(size for _, _, size in pages)
+    print(f'{"Total":<{width}} {before / 1024:>7.1f} KB -> {after / 1024:>7.1f} KB  {_reduction(before, after)}')
+
+
+def _reduction(before, after):
+    return f'-{(before - after) / before * 100:.1f}%' if before else '-0.0%'
+
+
+def print_plan(names, force=False, minify=False):
+    """The rebuild set: stale pages and the inputs that changed"""
+    stale, skipped, removed = plan(names, force=force, minify=minify)
+    for _, _, path, _, changed in stale:
+        print(path)
+        for name in changed:
+            print(f'    changed: {name}')
+    for path in removed:
+        print(path)
+        print('    no longer produced: remove')
+    print(f'\n{len(stale)} pages to rebuild, {len(removed)} to remove, {len(skipped)} up to date')
+
+
+def rewrite_main(argv=None):
+    parser = argparse.ArgumentParser(description='Apply site-wide rewrite rules to every HTML page in one pass.')
+    parser.add_argument('rules', nargs='*', metavar='rule',
+                        help=f'rule or rule group to apply: {", ".join(GROUPS)} (default: all rules)')
+    parser.add_argument('--dry-run', action='store_true', help='report changes without writing files')
+    args = parser.parse_args(argv)
+
+    names = []
+    for name in args.rules or list(RULES):
+        if name in GROUPS:
+            names.extend(GROUPS[name])
+        elif name in RULES:
+            names.append(name)
+        else:
+            parser.error(f'unknown rule: {name}')
+
+    updated = rewrite_files(list(dict.fromkeys(names)), dry_run=args.dry_run)
+    print(f'\n✅ Updated {len(updated)} files')
+    return 0
+
+
+def compress_main(argv=None):
+    parser = argparse.ArgumentParser(description='Write precompressed .gz/.br sidecars for the text assets in dist/.')
+    parser.add_argument('--dist', default=compress.DIST_DIR, help='build output directory (default: dist)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='recompress files even if they are unchanged')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.dist):
+        parser.error(f'{args.dist} does not exist - run npm run build first')
+    if compress.brotli is None:
+        print('⚠️  brotli is not installed (pip install brotli) - writing .gz sidecars only')
+
+    start = time.perf_counter()
+    summary = compress.compress(args.dist, jobs=args.jobs, force=args.force)
+    elapsed = time.perf_counter() - start
+
+    if summary['types']:
+        print(f'{"Type":<8} {"files":>6} {"original KB":>12} {"gzip KB":>9} {"brotli KB":>10} {"saved KB":>9}')
+        for suffix, totals in sorted(summary['types'].items()):
+            best = min(totals['.gz'], totals['.br'] or totals['.gz'])
+            brotli_kb = f'{totals[".br"] / 1024:.1f}' if totals['.br'] else '-'
+            print(f'{suffix:<8} {totals["files"]:>6} {totals["bytes"] / 1024:>12.1f} {totals[".gz"] / 1024:>9.1f} '
+                  f'{brotli_kb:>10} {(totals["bytes"] - best) / 1024:>9.1f}')
+    print(f'\n✅ Compressed {len(summary["compressed"])} files, skipped {len(summary["skipped"])} unchanged, '
+          f'removed {summary["stale"]} stale sidecars in {elapsed:.2f}s')
+    return 0
+
+
+def prune_main(argv=None):
+    parser = argparse.ArgumentParser(description='Write a copy of styles.css without the rules no page can use.')
+    parser.add_argument('--input', default=os.path.join(ROOT, 'styles.css'), help='stylesheet to prune (default: styles.css)')
+    parser.add_argument('--output', default=os.path.join(compress.DIST_DIR, 'styles.css'),
+                        help='where to write the pruned stylesheet (default: dist/styles.css)')
+    parser.add_argument('--safelist', nargs='*', default=[], metavar='PATTERN',
+                        help='extra class name regexes to always keep')
+    parser.add_argument('--dry-run', action='store_true', help='report the savings without writing')
+    args = parser.parse_args(argv)
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    start = time.perf_counter()
+    paths = css.source_files()
+    usage = css.site_usage(paths, css.SAFELIST + args.safelist)
+    nodes, removed = css.prune(css.parse(source), usage)
+    pruned = css.serialize(nodes)
+    elapsed = time.perf_counter() - start
+
+    before, after = len(source.encode('utf-8')), len(pruned.encode('utf-8'))
+    print(f'Scanned {len(paths)} files: {len(usage.classes)} classes, {len(usage.ids)} ids, {len(usage.tags)} tags')
+    print(f'Removed {removed} unused selectors')
+    if not args.dry_run:
+        write_atomic(args.output, pruned.encode('utf-8'))
+        print(f'Wrote {os.path.relpath(args.output, ROOT)}')
+    print(f'\n✅ {before / 1024:.1f} KB -> {after / 1024:.1f} KB ({(before - after) / 1024:.1f} KB removed, '
+          f'{(before - after) / before:.0%}) in {elapsed:.2f}s')
+    return 0
+
+
+def critical_main(argv=None):
+    parser = argparse.ArgumentParser(description='Inline above-the-fold CSS into the built pages and load styles.css asynchronously.')
+    parser.add_argument('--dist', default=compress.DIST_DIR, help='build output directory (default: dist)')
+    parser.add_argument('--dry-run', action='store_true', help='report without writing pages')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.dist):
+        parser.error(f'{args.dist} does not exist - run npm run build first')
+
+    start = time.perf_counter()
+    pages = [rel for rel in compress.text_assets(args.dist) if rel.endswith('.html')]
+    with OutputWriter(dry_run=args.dry_run) as writer:
+        summary = critical.process(args.dist, pages, writer)
+    elapsed = time.perf_counter() - start
+
+    average = summary['bytes'] / summary['pages'] / 1024 if summary['pages'] else 0
+    print(f'\n✅ Inlined critical CSS into {summary["pages"]} pages from {summary["layouts"]} layouts '
+          f'({summary["computed"]} computed, the rest cached; ~{average:.1f} KB per page) in {elapsed:.2f}s')
+    return 0
+
+
+def images_main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate responsive WebP/AVIF variants of the images the built pages use.')
+    parser.add_argument('--dist', default=compress.DIST_DIR, help='build output directory (default: dist)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='re-encode every image, ignoring the cache')
+    parser.add_argument('--dry-run', action='store_true', help='list the referenced images without encoding')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.dist):
+        parser.error(f'{args.dist} does not exist - run npm run build first')
+    pages = [rel for rel in compress.text_assets(args.dist) if rel.endswith('.html')]
+
+    if args.dry_run:
+        sources = images.references(args.dist, pages)
+        for url, path in sources.items():
+            print(f'{url}  ({os.path.getsize(path) / 1024:.0f} KB, {os.path.relpath(path, ROOT)})')
+        print(f'\n{len(sources)} images referenced by {len(pages)} pages')
+        return 0
+    if images.Image is None:
+        print('❌ Pillow is not installed (pip install Pillow)')
+        return 1
+    if 'avif' not in images.formats():
+        print('⚠️  This Pillow cannot write AVIF (pip install pillow-avif-plugin) - writing WebP variants only')
+
+    start = time.perf_counter()
+    with OutputWriter() as writer:
+        summary = images.process(args.dist, pages, writer, jobs=args.jobs, force=args.force)
+    elapsed = time.perf_counter() - start
+
+    print(f'\n✅ {summary["sources"]} images ({summary["encoded"]} encoded, the rest cached), '
+          f'{summary["published"]} variants copied, {summary["tags"]} <img> tags in {summary["pages"]} pages '
+          f'made responsive in {elapsed:.2f}s')
+    if summary['bytes']:
+        print(f'   Originals {summary["bytes"] / 1024 / 1024:.1f} MB, widest variants '
+              f'{summary["variant_bytes"] / 1024 / 1024:.1f} MB')
+    return 0
+
+
+def image_refs_main(argv=None):
+    parser = argparse.ArgumentParser(description='Index which pages, stylesheets, scripts and posts reference each image.')
+    parser.add_argument('--output', default=imagerefs.REPORT_FILE,
+                        help='used/unused report to write (default: temp-image-audit-data.json)')
+    parser.add_argument('--force', action='store_true', help='rescan every file, ignoring the index')
+    parser.add_argument('--show', nargs='+', metavar='IMAGE', help='print the files referencing these images (site paths)')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index, rescanned = imagerefs.update(force=args.force)
+    data, missing = imagerefs.report(index)
+    imagerefs.write_report(data, args.output)
+    elapsed = time.perf_counter() - start
+
+    if args.show:
+        for path in args.show:
+            print(path)
+            for rel in index['images'].get(path, []):
+                print(f'    {rel}')
+    for path in missing:
+        print(f'⚠️  Referenced but missing: {path} ({", ".join(index["images"][path])})')
+    print(f'\n✅ {data["usedCount"]} of {data["allCount"]} images used, {data["unusedCount"]} unused '
+          f'({len(rescanned)} of {len(index["files"])} files rescanned) in {elapsed:.2f}s')
+    print(f'   Report written to {os.path.relpath(args.output, ROOT)}')
+    return 0
+
+
+def dedup_main(argv=None):
+    parser = argparse.ArgumentParser(description='Find near-duplicate images in data/wp-media-cache and map each to one canonical file.')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--apply', action='store_true', help='rewrite data/blog-posts.json to use the canonical files')
+    parser.add_argument('--prune', action='store_true',
+                        help='delete duplicates nothing references any more from the cache and Images/blog/')
+    parser.add_argument('--dry-run', action='store_true', help='report without writing or deleting anything')
+    args = parser.parse_args(argv)
+
+    if mediadedup.Image is None:
+        print('⚠️  Pillow is not installed (pip install Pillow) - only byte-identical files will be clustered')
+
+    start = time.perf_counter()
+    result = mediadedup.dedup(jobs=args.jobs)
+    elapsed = time.perf_counter() - start
+
+    for cluster in result['clusters']:
+        print(f'{cluster["canonical"]}  <-  {", ".join(cluster["duplicates"])}')
+    duplicates = len(result['mapping'])
+    print(f'\n✅ {result["files"]} files ({result["bytes"] / 1024 / 1024:.1f} MB): {len(result["clusters"])} clusters, '
+          f'{duplicates} duplicates holding {result["saved"] / 1024 / 1024:.1f} MB in {elapsed:.2f}s')
+    if not args.dry_run:
+        mediadedup.save_mapping(result)
+        print(f'   Mapping written to {os.path.relpath(mediadedup.MAPPING_FILE, ROOT)}')
+
+    if args.apply:
+        rewritten = mediadedup.rewrite_posts(result['mapping'], dry_run=args.dry_run)
+        print(f'✅ {"Would rewrite" if args.dry_run else "Rewrote"} {rewritten} image references in '
+              f'{os.path.relpath(mediadedup.BLOG_POSTS_FILE, ROOT)}')
+    if args.prune:
+        index, _ = imagerefs.update()
+        referenced = set(index['images'])
+        if args.apply and args.dry_run:
+            # The posts were not rewritten: leave out references only they hold
+            blog_posts = os.path.relpath(mediadedup.BLOG_POSTS_FILE, ROOT)
+            referenced -= {url for url in result['mapping'] if index['images'].get(url) == [blog_posts]}
+        removed, freed = mediadedup.prune(result['mapping'], referenced, dry_run=args.dry_run)
+        print(f'✅ {"Would remove" if args.dry_run else "Removed"} {removed} unreferenced duplicate files '
+              f'({freed / 1024 / 1024:.1f} MB)')
+    return 0
+
+
+def shard_blog_main(argv=None):
+    parser = argparse.ArgumentParser(description='Split data/blog-posts.json into a paginated listing index and per-post files in dist/.')
+    parser.add_argument('--dist', default=compress.DIST_DIR, help='build output directory (default: dist)')
+    parser.add_argument('--source', default=blogshards.SOURCE_FILE, help='blog data file (default: data/blog-posts.json)')
+    parser.add_argument('--page-size', type=int, default=blogshards.PAGE_SIZE,
+                        help=f'posts per listing page (default: {blogshards.PAGE_SIZE})')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.dist):
+        parser.error(f'{args.dist} does not exist - run npm run build first')
+    if args.page_size < 1:
+        parser.error('--page-size must be at least 1')
+
+    start = time.perf_counter()
+    summary = blogshards.shard(args.source, args.dist, args.page_size)
+    elapsed = time.perf_counter() - start
+
+    print(f'{"File":<24} {"KB":>9}')
+    print(f'{os.path.relpath(args.source, ROOT):<24} {summary["source_bytes"] / 1024:>9.1f}')
+    print(f'{"index.json":<24} {summary["index_bytes"] / 1024:>9.1f}')
+    print(f'{"first listing page":<24} {summary["first_page_bytes"] / 1024:>9.1f}')
+    print(f'{"whole listing":<24} {summary["listing_bytes"] / 1024:>9.1f}')
+    print(f'\n✅ Sharded {summary["posts"]} posts into {summary["pages"]} listing pages: wrote {len(summary["written"])} files, '
+          f'skipped {summary["unchanged"]} unchanged, removed {summary["removed"]} stale in {elapsed:.2f}s')
+    return 0
+
+
+def search_index_main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the blog full-text search index in dist/ and optionally run test queries against it.')
+    parser.add_argument('--dist', default=compress.DIST_DIR, help='build output directory (default: dist)')
+    parser.add_argument('--source', default=search.SOURCE_FILE, help='blog data file (default: data/blog-posts.json)')
+    parser.add_argument('-q', '--query', action='append', default=[],
+                        help='run a query against the written index and show its ranking and latency (repeatable)')
+    parser.add_argument('--limit', type=int, default=10, help='results to show per query (default: 10)')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.dist):
+        parser.error(f'{args.dist} does not exist - run npm run build first')
+
+    start = time.perf_counter()
+    summary = search.write_index(args.source, args.dist)
+    elapsed = time.perf_counter() - start
+
+    largest = summary['largest_shard']
+    print(f'✅ Indexed {summary["documents"]} posts: {summary["terms"]} terms in {summary["shards"]} shards '
+          f'({summary["shard_bytes"] / 1024:.1f} KB, largest "{largest[0]}" {largest[1] / 1024:.1f} KB), '
+          f'index.json {summary["index_bytes"] / 1024:.1f} KB')
+    print(f'   Wrote {len(summary["written"])} files, skipped {summary["unchanged"]} unchanged, '
+          f'removed {summary["removed"]} stale in {elapsed:.2f}s')
+
+    root = os.path.join(args.dist, search.INDEX_DIR)
+    for text in args.query:
+        cache = {}
+        cold = search.query(text, root, args.limit, cache=cache)
+        index = search.load_index(root)
+        warm = search.query(text, root, args.limit, index=index, cache=cache)
+        print(f'\n🔎 {text!r}: terms {", ".join(cold["terms"]) or "-"}; shards {", ".join(cold["shards"]) or "-"}; '
+              f'cold {cold["seconds"] * 1000:.1f} ms, warm {warm["seconds"] * 1000:.1f} ms')
+        if not cold['results']:
+            print('   No matches')
+        for rank, (slug, score) in enumerate(cold['results'], 1):
+            print(f'   {rank:>2}. {score:6.2f}  {slug}')
+    return 0
+
+
+def related_main(argv=None):
+    parser = argparse.ArgumentParser(description='Work out each blog post\'s related posts into data/blog-related.json.')
+    parser.add_argument('--source', default=related.SOURCE_FILE, help='blog data file (default: data/blog-posts.json)')
+    parser.add_argument('--full', action='store_true',
+                        help='recompute the IDF and every post instead of just the changed ones. Incremental runs '
+                             'keep the IDF of the last full run, so their rankings can differ slightly from a full run')
+    parser.add_argument('--show', metavar='SLUG', help='print the scored candidates for one post')
+    args = parser.parse_args(argv)
+
+    if related.numpy is None:
+        print('⚠️  numpy is not installed (pip install numpy scipy) - scoring in pure Python')
+
+    start = time.perf_counter()
+    result = related.update(args.source, full=args.full)
+    elapsed = time.perf_counter() - start
+
+    print(f'✅ Related posts for {result["posts"]} posts ({result["backend"]}): '
+          f'{"full run" if result["full"] else "incremental"}, {result["scored"]} rows scored in {elapsed:.2f}s')
+    if result['since_full']:
+        print(f'   Term weights are from the last full run over {result["idf_posts"]} posts; '
+              f'{result["since_full"]} added, edited or removed since, so rankings can differ slightly '
+              f'from --full')
+    if result['changed']:
+        print(f'   Wrote {os.path.relpath(related.RELATED_FILE, ROOT)} - regenerate the blog pages to pick it up')
+    if args.show:
+        candidates = related.load_cache().get('candidates', {}).get(args.show)
+        if candidates is None:
+            print(f'❌ No published post with slug {args.show!r}')
+            return 1
+        for slug, score in candidates:
+            print(f'   {score:.3f}  {slug}')
+    return 0
+
+
+def wxr_import_main(argv=None):
+    parser = argparse.ArgumentParser(description='Stream a WordPress WXR export into blog-posts.json records.')
+    parser.add_argument('--file', default=wxr.EXPORT_FILE,
+                        help=f'WXR export (default: {os.path.relpath(wxr.EXPORT_FILE, ROOT)})')
+    parser.add_argument('--output', help='where to write the records (default: data/wp-import-<timestamp>.json)')
+    parser.add_argument('--dry-run', action='store_true', help='convert and count the posts without writing them')
+    parser.add_argument('--memory', action='store_true', help='trace the peak Python memory use (slows the import)')
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.file):
+        parser.error(f'{args.file} does not exist')
+    output = None
+    if not args.dry_run:
+        output = args.output or os.path.join(ROOT, 'data', f'wp-import-{datetime.now():%Y-%m-%dT%H-%M-%S}.json')
+
+    if args.memory:
+        tracemalloc.start()
+    summary = wxr.import_export(args.file, output)
+    if args.memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    seconds = summary['seconds']
+    if summary['error']:
+        print(f'⚠️  {os.path.relpath(args.file, ROOT)} is malformed or cut short ({summary["error"]}) - '
+              f'imported what was read before the break')
+    print(f'✅ {summary["posts"]} posts from {summary["items"]} items ({summary["bytes"] / 1024 / 1024:.1f} MB): '
+          f'{summary["attachments"]} attachments, {summary["categories"]} categories, {summary["tags"]} tags')
+    print(f'   {seconds:.2f}s (attachment scan {summary["scan_seconds"]:.2f}s), '
+          f'{summary["posts"] / seconds if seconds else 0:.0f} posts/s, '
+          f'{summary["bytes"] / 1024 / 1024 / seconds if seconds else 0:.1f} MB/s')
+    if args.memory:
+        print(f'   Peak memory {peak / 1024 / 1024:.1f} MB')
+    if output:
+        print(f'   Wrote {os.path.relpath(output, ROOT)} - import it from the admin import page')
+    return 0
@@ -0,0 +1,196 @@
+"""
+Precompressed .gz / .br sidecars for the built site.
+
+Walks dist/ and writes maximum-compression gzip and brotli copies next to
+every text asset, so the server can send them as-is instead of compressing
+per request. Files are streamed through the compressors in chunks across a
+process pool. Each file's content hash and the sidecars kept for it are
+recorded in .sitegen-cache/compress.json, and unchanged files are skipped.
+
+Brotli needs the optional `brotli` package; without it only .gz sidecars
+are written.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from . import ROOT
+from .output import write_atomic
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DIST_DIR = os.path.join(ROOT, 'dist')
+HASHES_FILE = os.path.join(ROOT, '.sitegen-cache', 'compress.json')
+
+TEXT_SUFFIXES = ('.html', '.css', '.js', '.mjs', '.json', '.map', '.svg', '.xml', '.txt', '.webmanifest')
+
+# Smaller files gain nothing once response headers are counted
+MIN_SIZE = 256
+
+CHUNK_SIZE = 256 * 1024
+
+
+def text_assets(root=DIST_DIR):
+    """Relative paths of every compressible file under root"""
+    assets = []
+    for directory, dirs, names in os.walk(root):
+        dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+        for name in sorted(names):
+            if name.endswith(TEXT_SUFFIXES) and not name.startswith('.'):
+                assets.append(os.path.relpath(os.path.join(directory, name), root))
+    return assets
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stream(path, target, open_compressor):
+    """Stream path through a compressor into target (atomically); return the compressed size"""
+    directory = os.path.dirname(target)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(target))
+    try:
+        with os.fdopen(fd, 'wb') as raw, open(path, 'rb') as source:
+            write = open_compressor(raw)
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b''):
+                write(chunk)
+            write(None)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return os.path.getsize(target)
+
+
+def _gzip_writer(raw):
+    # mtime=0 and no file name keep the output reproducible
+    stream = gzip.GzipFile(filename='', mode='wb', compresslevel=9, fileobj=raw, mtime=0)
+
+    def write(chunk):
+        if chunk is None:
+            stream.close()
+        else:
+            stream.write(chunk)
+    return write
+
+
+def _brotli_writer(raw):
+    compressor = brotli.Compressor(quality=11, mode=brotli.MODE_TEXT)
+
+    def write(chunk):
+        raw.write(compressor.finish() if chunk is None else compressor.process(chunk))
+    return write
+
+
+def _compress_task(task):
+    """
+    Compress one asset inside a worker process.
+
+    previous is the [hash, kept sidecars] recorded last run. Returns (path,
+    [hash, kept sidecars], original size, {suffix: compressed size}); the sizes
+    dict is None when the file was unchanged and its sidecars still exist.
+    """
+    root, rel, previous = task
+    path = os.path.join(root, rel)
+    digest = file_hash(path)
+    size = os.path.getsize(path)
+    if previous and previous[0] == digest and all(os.path.exists(path + suffix) for suffix in previous[1]):
+        return rel, previous, size, None
+
+    sizes = {'.gz': _stream(path, path + '.gz', _gzip_writer)}
+    if brotli:
+        sizes['.br'] = _stream(path, path + '.br', _brotli_writer)
+
+    # A sidecar that is not smaller than the original is never worth serving
+    kept = []
+    for suffix, compressed in list(sizes.items()):
+        if compressed >= size:
+            os.unlink(path + suffix)
+            sizes[suffix] = size
+        else:
+            kept.append(suffix)
+    return rel, [digest, kept], size, sizes
+
+
+def remove_stale(kept, root=DIST_DIR):
+    """
+    Delete the sidecars this run did not keep: those of removed files, of
+    files now under MIN_SIZE, and any an earlier run left behind (the .br of
+    a file changed since brotli was uninstalled). kept is {relative path:
+    [suffix, ...]}. Returns how many were deleted.
+    """
+    removed = 0
+    for directory, _, names in os.walk(root):
+        for name in names:
+            stem, suffix = os.path.splitext(name)
+            if suffix not in ('.gz', '.br') or not stem.endswith(TEXT_SUFFIXES):
+                continue
+            rel = os.path.relpath(os.path.join(directory, stem), root)
+            if suffix not in kept.get(rel, ()):
+                os.unlink(os.path.join(directory, name))
+                removed += 1
+    return removed
+
+
+def load_hashes(path=HASHES_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def compress(root=DIST_DIR, jobs=None, force=False):
+    """
+    Write sidecars for every changed text asset under root.
+
+    Returns {'compressed': [...], 'skipped': [...], 'stale': n, 'types': {suffix: totals}},
+    where stale counts the sidecars deleted because no current file kept them
+    and totals holds files, bytes and the compressed bytes per sidecar type.
+    """
+    previous = {} if force else load_hashes()
+    tasks = [
+        (root, rel, previous.get(rel))
+        for rel in text_assets(root)
+        if os.path.getsize(os.path.join(root, rel)) >= MIN_SIZE
+    ]
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(tasks) < 2:
+        results = [_compress_task(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_compress_task, tasks, chunksize=chunksize))
+
+    hashes = {}
+    compressed = []
+    skipped = []
+    types = {}
+    for rel, record, size, sizes in results:
+        hashes[rel] = record
+        if sizes is None:
+            skipped.append(rel)
+            continue
+        compressed.append(rel)
+        totals = types.setdefault(os.path.splitext(rel)[1], {'files': 0, 'bytes': 0, '.gz': 0, '.br': 0})
+        totals['files'] += 1
+        totals['bytes'] += size
+        for suffix, compressed_size in sizes.items():
+            totals[suffix] += compressed_size
+
+    write_atomic(HASHES_FILE, json.dumps(hashes, indent=2, sort_keys=True).encode('utf-8'))
+    stale = remove_stale({rel: record[1] for rel, record in hashes.items()}, root)
+    return {'compressed': compressed, 'skipped': skipped, 'stale': stale, 'types': types}
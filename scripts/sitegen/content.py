@@ -0,0 +1,108 @@
+"""
+Page content data files.
+
+Each page record is one JSON file under data/content/<family>/, checked
+against the family's schema when it is read. Parsed records are cached per
+file and keyed on its mtime and size, so a process that builds repeatedly
+only reparses the files that changed.
+
+Schemas are plain Python values:
+
+    str, int, bool         a value of that type
+    str | None             a value of either type (e.g. a nullable string)
+    {'key': schema}        an object with exactly these keys ('key?' = optional)
+    [schema]               a list whose items all match schema
+    (schema, schema, ...)  a fixed-length list, e.g. a (title, description) pair
+"""
+
+import json
+import os
+
+from . import ROOT, stats
+
+CONTENT_DIR = os.path.join(ROOT, 'data', 'content')
+
+# path -> (mtime_ns, size, record)
+_cache = {}
+
+# id(record) -> data file relative to the site root, for records held in _cache
+_sources = {}
+
+
+class ContentError(ValueError):
+    """A data file that is not valid JSON or does not match its schema"""
+
+
+def validate(value, schema, where='record'):
+    """Raise ContentError if value does not match schema"""
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            raise ContentError(f'{where}: expected an object')
+        keys = {key.rstrip('?'): key.endswith('?') for key in schema}
+        for key in value:
+            if key not in keys:
+                raise ContentError(f'{where}: unknown key {key!r}')
+        for key, item_schema in schema.items():
+            name = key.rstrip('?')
+            if name in value:
+                validate(value[name], item_schema, f'{where}.{name}')
+            elif not key.endswith('?'):
+                raise ContentError(f'{where}: missing key {name!r}')
+    elif isinstance(schema, list):
+        if not isinstance(value, list):
+            raise ContentError(f'{where}: expected a list')
+        for index, item in enumerate(value):
+            validate(item, schema[0], f'{where}[{index}]')
+    elif isinstance(schema, tuple):
+        if not isinstance(value, list) or len(value) != len(schema):
+            raise ContentError(f'{where}: expected a list of {len(schema)} items')
+        for index, (item, item_schema) in enumerate(zip(value, schema)):
+            validate(item, item_schema, f'{where}[{index}]')
+    elif not isinstance(value, schema) or (schema is int and isinstance(value, bool)):
+        raise ContentError(f'{where}: expected {getattr(schema, "__name__", schema)}')
+
+
+def load_record(path, schema):
+    """One validated record, reparsed only if the file changed since last read"""
+    stat = os.stat(path)
+    cached = _cache.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            record = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ContentError(f'{os.path.relpath(path, ROOT)}: {e}') from e
+    stats.count('bytes_read', stat.st_size)
+    validate(record, schema, os.path.relpath(path, ROOT))
+    if cached:
+        _sources.pop(id(cached[2]), None)
+    _cache[path] = (stat.st_mtime_ns, stat.st_size, record)
+    _sources[id(record)] = os.path.relpath(path, ROOT)
+    return record
+
+
+def source(record):
+    """The data file a loaded record came from (None if it was not loaded from one)"""
+    return _sources.get(id(record))
+
+
+def family_dir(family):
+    return os.path.join(CONTENT_DIR, family)
+
+
+def record_paths(family):
+    """Data files of a family, sorted by name (none if the family has no data yet)"""
+    directory = family_dir(family)
+    try:
+        with os.scandir(directory) as entries:
+            names = sorted(entry.name for entry in entries if entry.name.endswith('.json') and not entry.name.startswith('.'))
+    except FileNotFoundError:
+        return []
+    return [os.path.join(directory, name) for name in names]
+
+
+def load_family(family, schema):
+    """Every validated record of a family"""
+    return [load_record(path, schema) for path in record_paths(family)]
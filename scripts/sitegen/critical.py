@@ -0,0 +1,165 @@
+"""
+Critical CSS: inline the rules a page needs for first paint.
+
+For every built page the above-the-fold markup - everything up to the end
+of the first FOLD_SECTIONS sections of <main> (header, breadcrumb, page
+header with its intro) - is reduced to the classes, ids and tags it uses.
+Pages of the same layout share that signature, so the critical rule set is
+computed once per layout and stylesheet version, and cached in
+.sitegen-cache/critical.json across runs.
+
+The critical rules are inlined in a <style data-critical> block and the
+full stylesheet link becomes a preload that switches itself to a
+stylesheet once loaded, with a <noscript> fallback.
+"""
+
+import json
+import os
+import re
+
+from . import ROOT, css
+from .manifest import hash_bytes
+from .output import write_atomic
+
+CACHE_FILE = os.path.join(ROOT, '.sitegen-cache', 'critical.json')
+
+# Sections of <main> treated as above the fold
+FOLD_SECTIONS = 2
+
+# State-dependent selectors cannot apply at first paint
+INTERACTIVE = re.compile(r':(?:hover|focus|focus-visible|focus-within|active|visited)\b')
+
+# Raw at-rules not needed for first paint
+DEFERRED_AT_RULES = {'keyframes', '-webkit-keyframes'}
+
+STYLESHEET_LINK = re.compile(r'<link\b(?=[^>]*\brel=["\']stylesheet["\'])[^>]*\bhref=["\'](/[^"\']+\.css)["\'][^>]*>')
+
+
+class FoldUsage(css.Usage):
+    """Usage of the above-the-fold markup, ignoring interactive states"""
+
+    def __init__(self):
+        super().__init__(safelist=None)
+
+    def add_script(self, text):
+        """Markup built by scripts appears after first paint"""
+
+    def uses(self, selector):
+        return not INTERACTIVE.search(selector) and super().uses(selector)
+
+
+def fold_markup(html):
+    """The page up to the end of its first FOLD_SECTIONS <main> sections"""
+    main = html.find('<main')
+    if main == -1:
+        return html
+    end = main
+    for _ in range(FOLD_SECTIONS):
+        close = html.find('</section>', end)
+        if close == -1:
+            break
+        end = close + len('</section>')
+    return html[:end]
+
+
+def fold_usage(html):
+    usage = FoldUsage()
+    usage.add_html(fold_markup(html))
+    return usage
+
+
+def layout_key(usage, stylesheet_hash):
+    """Cache key: the fold's classes, ids and tags plus the stylesheet version"""
+    signature = json.dumps([sorted(usage.classes), sorted(usage.ids), sorted(usage.tags)])
+    return hash_bytes(f'{stylesheet_hash}:{signature}')
+
+
+def _drop_deferred(nodes):
+    kept = []
+    for node in nodes:
+        if isinstance(node, css.AtRule) and node.children is not None:
+            node.children = _drop_deferred(node.children)
+        elif isinstance(node, css.AtRule) and node.body is not None and node.name in DEFERRED_AT_RULES:
+            continue
+        kept.append(node)
+    return kept
+
+
+def compact(text):
+    """Strip comments and collapse whitespace"""
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+    text = re.sub(r'\s+', ' ', text)
+    return re.sub(r'\s*([{};])\s*', r'\1', text).strip()
+
+
+def critical_css(nodes, usage):
+    """The compacted rules of a parsed stylesheet that the fold usage needs"""
+    kept, _ = css.prune(nodes, usage)
+    return compact(css.serialize(_drop_deferred(kept)))
+
+
+def inline(html, href, critical):
+    """Replace the stylesheet link with inline critical CSS and an async load"""
+    replacement = (
+        f'<style data-critical>{critical}</style>\n'
+        f'    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+        f'    <noscript><link rel="stylesheet" href="{href}"></noscript>'
+    )
+    return STYLESHEET_LINK.sub(lambda match: replacement if match.group(1) == href else match.group(0), html, count=1)
+
+
+def load_cache(path=CACHE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def process(root, pages, writer):
+    """
+    Inline critical CSS into the given pages (paths relative to root).
+
+    Returns {'pages': n inlined, 'layouts': distinct critical sets,
+    'computed': sets computed this run, 'bytes': total inlined bytes}.
+    """
+    cache = load_cache()
+    used_keys = set()
+    stylesheets = {}
+    computed = 0
+    inlined = 0
+    total = 0
+
+    for rel in pages:
+        path = os.path.join(root, rel)
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        match = STYLESHEET_LINK.search(html)
+        if 'data-critical' in html or not match:
+            continue
+
+        href = match.group(1)
+        if href not in stylesheets:
+            sheet_path = os.path.join(root, href.lstrip('/'))
+            if not os.path.exists(sheet_path):
+                continue
+            with open(sheet_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            stylesheets[href] = (hash_bytes(text), css.parse(text))
+        sheet_hash, nodes = stylesheets[href]
+
+        usage = fold_usage(html)
+        key = layout_key(usage, sheet_hash)
+        if key not in cache:
+            cache[key] = critical_css(nodes, usage)
+            computed += 1
+        used_keys.add(key)
+
+        writer.write(path, inline(html, href, cache[key]))
+        inlined += 1
+        total += len(cache[key].encode('utf-8'))
+
+    # Keep only the layouts still in use (a run over already-inlined pages leaves the cache alone)
+    if used_keys:
+        write_atomic(CACHE_FILE, json.dumps({key: cache[key] for key in sorted(used_keys)}, indent=1).encode('utf-8'))
+    return {'pages': inlined, 'layouts': len(used_keys), 'computed': computed, 'bytes': total}
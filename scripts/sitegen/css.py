@@ -0,0 +1,318 @@
+"""
+Stylesheet parsing and selector usage checks.
+
+A small, forgiving CSS parser: enough structure to keep or drop whole rules
+and individual selectors, with declaration blocks and non-conditional
+at-rules (@font-face, @keyframes, ...) carried through verbatim.
+
+A selector is considered used when every class, id and type it requires
+appears in the page corpus. Anything the check cannot reason about -
+attribute selectors, :is()/:where()/:has() - is treated as matching, so
+pruning only ever drops rules that cannot apply.
+"""
+
+import os
+import re
+from html.parser import HTMLParser
+
+from . import ROOT, inventory
+
+# At-rules whose block holds further rules; any other block at-rule is kept raw
+CONDITIONAL_AT_RULES = {'media', 'supports', 'layer', 'container', 'document', '-moz-document', 'scope'}
+
+# Selectors with these pseudo-classes are always kept (their arguments can match anything)
+OPAQUE_PSEUDOS = re.compile(r':(?:is|where|has|matches|-webkit-any|-moz-any)\(')
+
+# Classes script.js and friends add at runtime under computed names
+SAFELIST = [
+    r'scroll-fade-in',
+    r'scroll-slide-left',
+    r'scroll-slide-right',
+    r'scroll-scale-in',
+    r'stagger-\d+',
+]
+
+# Content outside the page inventory that still loads styles.css or renders markup
+EXTRA_SOURCES = ['admin', 'data/blog-posts.json']
+
+# Word-like tokens in scripts and data; any of them may be a class, id or tag
+TOKEN = re.compile(r'[A-Za-z_][\w-]*')
+
+ESCAPED_NAME = r'(?:[\w-]|\\.)+'
+CLASS = re.compile(r'\.(' + ESCAPED_NAME + ')')
+ID = re.compile(r'#(' + ESCAPED_NAME + ')')
+TYPE = re.compile(r'(?<![\w-])([a-zA-Z][\w-]*)')
+ATTRIBUTE = re.compile(r'\[[^\]]*\]')
+PSEUDO = re.compile(r'::?[\w-]+')
+
+
+class Rule:
+    """A style rule: its selectors and raw declaration block"""
+
+    def __init__(self, selectors, body):
+        self.selectors = selectors
+        self.body = body
+
+    def render(self):
+        return f'{", ".join(self.selectors)} {{{self.body}}}'
+
+
+class AtRule:
+    """An at-rule: either a statement (;), a raw block, or a block of child rules"""
+
+    def __init__(self, prelude, body=None, children=None):
+        self.prelude = prelude
+        self.body = body
+        self.children = children
+
+    @property
+    def name(self):
+        return re.match(r'@([\w-]+)', self.prelude).group(1).lower()
+
+    def render(self):
+        if self.children is not None:
+            return f'{self.prelude} {{\n' + '\n'.join(child.render() for child in self.children) + '\n}'
+        if self.body is not None:
+            return f'{self.prelude} {{{self.body}}}'
+        return f'{self.prelude};'
+
+
+def _skip(css, i):
+    """Index past a comment or string starting at i (i itself if there is none)"""
+    if css.startswith('/*', i):
+        end = css.find('*/', i + 2)
+        return len(css) if end == -1 else end + 2
+    if css[i] in '"\'':
+        quote = css[i]
+        i += 1
+        while i < len(css) and css[i] != quote:
+            i += 2 if css[i] == '\\' else 1
+        return i + 1
+    return i
+
+
+def _block_end(css, i):
+    """Index of the '}' closing the block whose body starts at i"""
+    depth = 0
+    while i < len(css):
+        skipped = _skip(css, i)
+        if skipped != i:
+            i = skipped
+            continue
+        if css[i] == '{':
+            depth += 1
+        elif css[i] == '}':
+            if depth == 0:
+                return i
+            depth -= 1
+        i += 1
+    return len(css)
+
+
+def split_selectors(prelude):
+    """Split a selector list on top-level commas"""
+    selectors = []
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(prelude):
+        skipped = _skip(prelude, i)
+        if skipped != i:
+            i = skipped
+            continue
+        char = prelude[i]
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+        i += 1
+    selectors.append(prelude[start:].strip())
+    return [selector for selector in selectors if selector]
+
+
+def parse(css, i=0, end=None):
+    """Parse a stylesheet (or the inside of a conditional at-rule) into Rule/AtRule nodes"""
+    end = len(css) if end is None else end
+    nodes = []
+    while i < end:
+        start = i
+        # Read the prelude up to '{', ';' or the end of the enclosing block
+        while i < end and css[i] not in '{;}':
+            skipped = _skip(css, i)
+            i = skipped if skipped != i else i + 1
+        prelude = re.sub(r'/\*.*?\*/', '', css[start:i], flags=re.DOTALL).strip()
+        if i >= end or css[i] == '}':
+            break
+        if css[i] == ';':
+            if prelude:
+                nodes.append(AtRule(prelude))
+            i += 1
+            continue
+
+        body_end = _block_end(css, i + 1)
+        if prelude.startswith('@'):
+            node = AtRule(prelude)
+            if node.name in CONDITIONAL_AT_RULES:
+                node.children = parse(css, i + 1, body_end)
+            else:
+                node.body = css[i + 1:body_end]
+            nodes.append(node)
+        elif prelude:
+            nodes.append(Rule(split_selectors(prelude), css[i + 1:body_end]))
+        i = body_end + 1
+    return nodes
+
+
+def serialize(nodes):
+    return '\n'.join(node.render() for node in nodes) + '\n'
+
+
+def _strip_functional(selector, name):
+    """Remove every :name(...) (with nested parentheses) from a selector"""
+    marker = f':{name}('
+    while marker in selector:
+        start = selector.index(marker)
+        depth = 0
+        for end in range(start + len(marker) - 1, len(selector)):
+            depth += {'(': 1, ')': -1}.get(selector[end], 0)
+            if depth == 0:
+                break
+        selector = selector[:start] + selector[end + 1:]
+    return selector
+
+
+def requirements(selector):
+    """
+    The (classes, ids, types) a selector needs to match, or None if it
+    cannot be decided (and must be kept).
+    """
+    if OPAQUE_PSEUDOS.search(selector):
+        return None
+    selector = ATTRIBUTE.sub('', selector)
+    # A negation never makes a selector need a class
+    selector = _strip_functional(selector, 'not')
+    selector = re.sub(r'\([^()]*\)', '', selector)
+
+    classes = {name.replace('\\', '') for name in CLASS.findall(selector)}
+    ids = {name.replace('\\', '') for name in ID.findall(selector)}
+    rest = PSEUDO.sub('', ID.sub('', CLASS.sub('', selector)))
+    types = {name.lower() for name in TYPE.findall(rest)}
+    return classes, ids, types
+
+
+class Usage:
+    """Classes, ids and tags used across a set of pages and scripts"""
+
+    def __init__(self, safelist=SAFELIST):
+        self.classes = set()
+        self.ids = set()
+        self.tags = {'html', 'body'}
+        self.tokens = set()
+        self.safelist = re.compile('|'.join(f'(?:{pattern})' for pattern in safelist)) if safelist else None
+
+    def add_html(self, html):
+        collector = _UsageParser(self)
+        collector.feed(html)
+        collector.close()
+
+    def add_script(self, text):
+        """Scripts and data build markup at runtime: count every word-like token"""
+        self.tokens.update(TOKEN.findall(text))
+
+    def uses(self, selector):
+        return self.covers(requirements(selector))
+
+    def covers(self, needed):
+        """Whether every (classes, ids, types) requirement is met (None always is)"""
+        if needed is None:
+            return True
+        classes, ids, types = needed
+        return (
+            all(name in self.classes or name in self.tokens or self._safe(name) for name in classes)
+            and all(name in self.ids or name in self.tokens for name in ids)
+            and all(name in self.tags or name in self.tokens for name in types)
+        )
+
+    def _safe(self, name):
+        return bool(self.safelist and self.safelist.fullmatch(name))
+
+
+class _UsageParser(HTMLParser):
+    def __init__(self, usage):
+        super().__init__(convert_charrefs=True)
+        self.usage = usage
+        self.in_script = False
+
+    def handle_starttag(self, tag, attrs):
+        self.usage.tags.add(tag)
+        for name, value in attrs:
+            if name == 'class' and value:
+                self.usage.classes.update(value.split())
+            elif name == 'id' and value:
+                self.usage.ids.add(value)
+        self.in_script = tag == 'script'
+
+    def handle_endtag(self, tag):
+        if tag == 'script':
+            self.in_script = False
+
+    def handle_data(self, data):
+        if self.in_script:
+            self.usage.add_script(data)
+
+
+def prune(nodes, usage):
+    """
+    Drop unused selectors, then rules with none left and conditional
+    at-rules left empty. Returns (kept nodes, selectors removed).
+    """
+    kept = []
+    removed = 0
+    for node in nodes:
+        if isinstance(node, Rule):
+            selectors = [selector for selector in node.selectors if usage.uses(selector)]
+            removed += len(node.selectors) - len(selectors)
+            if selectors:
+                kept.append(Rule(selectors, node.body))
+        elif node.children is not None:
+            children, count = prune(node.children, usage)
+            removed += count
+            if children:
+                kept.append(AtRule(node.prelude, children=children))
+        else:
+            kept.append(node)
+    return kept, removed
+
+
+def source_files(extra=EXTRA_SOURCES):
+    """Relative paths of every page, script and data file styles may apply to"""
+    paths = list(inventory.files(('.html', '.js')))
+    paths += [name for name in sorted(os.listdir(ROOT)) if name.startswith('admin') and name.endswith(('.html', '.js'))]
+    for rel in extra:
+        full = os.path.join(ROOT, rel)
+        if os.path.isdir(full):
+            for directory, dirs, names in os.walk(full):
+                dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+                paths += [
+                    os.path.relpath(os.path.join(directory, name), ROOT)
+                    for name in sorted(names) if name.endswith(('.html', '.js')) and not name.startswith('.')
+                ]
+        elif os.path.exists(full):
+            paths.append(rel)
+    return list(dict.fromkeys(paths))
+
+
+def site_usage(paths=None, safelist=SAFELIST):
+    """Usage collected from every source file (HTML parsed, everything else tokenised)"""
+    usage = Usage(safelist)
+    for rel in paths if paths is not None else source_files():
+        with open(os.path.join(ROOT, rel), 'r', encoding='utf-8', errors='replace') as f:
+            text = f.read()
+        if rel.endswith('.html'):
+            usage.add_html(text)
+        else:
+            usage.add_script(text)
+    return usage
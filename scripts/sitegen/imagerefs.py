@@ -0,0 +1,175 @@
+"""
+Image reference index - which files use which images.
+
+Every HTML and CSS file, script.js and data/blog-posts.json is read in
+chunks and split into tokens at quotes, parentheses, angle brackets,
+backslashes (JSON-escaped quotes), '=' and newlines; tokens naming an image
+are resolved to site paths. Each file's references are kept in
+.sitegen-cache/image-refs.json with its mtime and size, so a run only
+rescans files that changed, then rebuilds the reverse index (image ->
+referencing files) from the per-file lists.
+
+The used/unused report has the shape of temp-image-audit-data.json, the data
+file behind temp-image-audit.html.
+"""
+
+import json
+import os
+import posixpath
+import re
+from urllib.parse import unquote, urlsplit
+
+from . import ROOT, inventory
+from .output import write_atomic
+
+INDEX_FILE = os.path.join(ROOT, '.sitegen-cache', 'image-refs.json')
+REPORT_FILE = os.path.join(ROOT, 'temp-image-audit-data.json')
+
+IMAGES_DIR = os.path.join(ROOT, 'Images')
+
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.webp', '.gif', '.svg', '.avif', '.ico')
+
+# Referencing files outside the page inventory
+EXTRA_SOURCES = ['script.js', 'data/blog-posts.json']
+
+CHUNK_SIZE = 64 * 1024
+
+DELIMITER = re.compile(r'["\'()<>\\=\n]')
+
+# Image paths inside a token; srcset lists are split at commas and descriptors
+REFERENCE = re.compile(
+    r'(?:^|,)\s*([^,]*?\.(?:' + '|'.join(suffix[1:] for suffix in IMAGE_SUFFIXES) + r'))(?=[?#\s,]|$)',
+    re.IGNORECASE,
+)
+
+
+def tokens(path):
+    """Stream a file's tokens; a token split across chunks is carried over"""
+    pending = ''
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), ''):
+            pieces = DELIMITER.split(pending + chunk)
+            pending = pieces.pop()
+            yield from pieces
+    yield pending
+
+
+def resolve(reference, rel):
+    """Site path (/Images/...) of a reference made from the file rel, or None for external URLs"""
+    parts = urlsplit(reference.strip())
+    if parts.scheme in ('data', 'blob'):
+        return None
+    path = unquote(parts.path)
+    if parts.scheme or parts.netloc:
+        # Absolute URLs count when they point at a site path that exists locally
+        return path or None
+    if not path.startswith('/'):
+        path = '/' + posixpath.join(posixpath.dirname(rel.replace(os.sep, '/')), path)
+    return posixpath.normpath(path)
+
+
+def scan(rel):
+    """Sorted site paths of the images a file references"""
+    found = set()
+    for token in tokens(os.path.join(ROOT, rel)):
+        if '.' not in token:
+            continue
+        for match in REFERENCE.finditer(token):
+            path = resolve(match.group(1), rel)
+            if path:
+                found.add(path)
+    return sorted(found)
+
+
+def source_files():
+    """{relative path: (mtime_ns, size)} of every file that may reference images"""
+    sources = inventory.files(('.html', '.css'))
+    for directory, dirs, names in os.walk(ROOT):
+        rel_dir = os.path.relpath(directory, ROOT)
+        dirs[:] = sorted(
+            name for name in dirs
+            if not name.startswith('.') and (rel_dir != '.' or name == 'admin')
+        )
+        for name in sorted(names):
+            # Admin pages: root admin-*.html plus the admin/ tree
+            if name.endswith('.html') and not name.startswith('.') and (rel_dir != '.' or name.startswith('admin')):
+                rel = os.path.normpath(os.path.join(rel_dir, name))
+                stat = os.stat(os.path.join(directory, name))
+                sources[rel] = (stat.st_mtime_ns, stat.st_size)
+    for rel in EXTRA_SOURCES:
+        path = os.path.join(ROOT, rel)
+        if os.path.exists(path):
+            stat = os.stat(path)
+            sources[rel] = (stat.st_mtime_ns, stat.st_size)
+    return dict(sorted(sources.items()))
+
+
+def site_images():
+    """Site paths of every image under Images/ and in the site root"""
+    images = []
+    for directory, dirs, names in os.walk(IMAGES_DIR):
+        dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+        for name in names:
+            if name.lower().endswith(IMAGE_SUFFIXES) and not name.startswith('.'):
+                images.append('/' + os.path.relpath(os.path.join(directory, name), ROOT).replace(os.sep, '/'))
+    for name in os.listdir(ROOT):
+        if name.lower().endswith(IMAGE_SUFFIXES) and not name.startswith('.'):
+            images.append('/' + name)
+    return sorted(images, key=str.casefold)
+
+
+def load_index(path=INDEX_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def update(force=False):
+    """
+    Bring the index up to date and save it.
+
+    Returns (index, rescanned files). index['files'] maps each source to
+    [mtime_ns, size, image paths]; index['images'] maps each referenced
+    image to its referencing files.
+    """
+    previous = {} if force else load_index().get('files', {})
+    files = {}
+    rescanned = []
+    for rel, (mtime, size) in source_files().items():
+        entry = previous.get(rel)
+        if entry and entry[0] == mtime and entry[1] == size:
+            files[rel] = entry
+        else:
+            files[rel] = [mtime, size, scan(rel)]
+            rescanned.append(rel)
+
+    images = {}
+    for rel, (_, _, paths) in files.items():
+        for path in paths:
+            images.setdefault(path, []).append(rel)
+    index = {'files': files, 'images': dict(sorted(images.items()))}
+    if rescanned or len(files) != len(previous):
+        write_atomic(INDEX_FILE, json.dumps(index, indent=1, sort_keys=True).encode('utf-8'))
+    return index, rescanned
+
+
+def report(index, images=None):
+    """Used/unused image report in the temp-image-audit-data.json shape, plus referenced paths that do not exist"""
+    images = site_images() if images is None else images
+    used = [path for path in images if path in index['images']]
+    unused = [path for path in images if path not in index['images']]
+    known = set(images)
+    missing = sorted(path for path in index['images'] if path not in known and path.startswith('/Images/'))
+    return {
+        'allCount': len(images),
+        'usedCount': len(used),
+        'unusedCount': len(unused),
+        'used': used,
+        'unused': unused,
+    }, missing
+
+
+def write_report(data, path=REPORT_FILE):
+    write_atomic(path, json.dumps(data, indent=2).encode('utf-8'))
@@ -0,0 +1,324 @@
+"""
+Responsive image variants for the built site.
+
+Every image a built page references under /Images/ is resized to the
+WIDTHS narrower than it (plus its own width, unless it is wider than them
+all) and encoded as WebP (and AVIF when the installed
+Pillow can write it) across a process pool. Variants are content-addressed
+by the source's hash and the encoder settings and kept in
+.sitegen-cache/images/, so a source is only ever encoded once; the pages'
+<img> tags then get srcset/sizes pointing at copies in dist/Images/responsive/.
+
+/Images/blog/ files missing from Images/ are read from data/wp-media-cache/,
+where the WordPress importers download them.
+
+Needs the optional `Pillow` package (plus `pillow-avif-plugin` for AVIF on
+Pillow releases without built-in AVIF support).
+"""
+
+import hashlib
+import html as html_lib
+import json
+import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from . import ROOT
+from .compress import file_hash
+from .output import write_atomic
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+else:
+    try:
+        import pillow_avif  # noqa: F401 - registers the AVIF encoder
+    except ImportError:
+        pass
+
+CACHE_DIR = os.path.join(ROOT, '.sitegen-cache', 'images')
+INDEX_FILE = os.path.join(ROOT, '.sitegen-cache', 'images.json')
+MEDIA_CACHE_DIR = os.path.join(ROOT, 'data', 'wp-media-cache')
+
+# Published variants: /Images/responsive/<digest>-<width>.<format>
+VARIANT_URL = '/Images/responsive'
+
+WIDTHS = (480, 800, 1200, 1600, 2000)
+
+# Encoder settings per format, in <picture> source order (best first)
+FORMATS = {
+    'avif': {'quality': 50, 'speed': 6},
+    'webp': {'quality': 80, 'method': 6},
+}
+
+IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.webp')
+
+# script.js swaps the theme logos by src, which a srcset would override
+EXCLUDED = re.compile(r'logo', re.IGNORECASE)
+
+# sizes by class; anything else is assumed to span the viewport
+SIZES = {
+    'hero-carousel-img': '(max-width: 1024px) 100vw, 50vw',
+    'service-banner-img': '(max-width: 768px) 100vw, 33vw',
+    'service-pillar-logo-img': '120px',
+    'img-placeholder-rect': '(max-width: 768px) 100vw, 50vw',
+}
+DEFAULT_SIZES = '100vw'
+
+IMG_TAG = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+ATTRIBUTE = re.compile(r'\s([\w-]+)="([^"]*)"')
+
+
+def formats():
+    """The formats the installed Pillow can write, best first"""
+    if Image is None:
+        return []
+    Image.init()
+    return [name for name in FORMATS if name.upper() in Image.SAVE]
+
+
+def settings_key(names):
+    """Part of every digest, so changing widths or encoder settings re-encodes"""
+    return json.dumps([WIDTHS, {name: FORMATS[name] for name in names}], sort_keys=True)
+
+
+def source_path(url):
+    """The file behind an /Images/... URL, or None"""
+    if not url.startswith('/Images/') or not url.lower().endswith(IMAGE_SUFFIXES):
+        return None
+    rel = html_lib.unescape(url).lstrip('/')
+    path = os.path.join(ROOT, *rel.split('/'))
+    if os.path.exists(path):
+        return path
+    if rel.startswith('Images/blog/'):
+        cached = os.path.join(MEDIA_CACHE_DIR, os.path.basename(rel))
+        if os.path.exists(cached):
+            return cached
+    return None
+
+
+def references(root, pages):
+    """{image URL: source path} for every variant-able <img> in the given pages"""
+    found = {}
+    for rel in pages:
+        with open(os.path.join(root, rel), 'r', encoding='utf-8') as f:
+            html = f.read()
+        for tag in IMG_TAG.findall(html):
+            attrs = dict(ATTRIBUTE.findall(tag))
+            url = attrs.get('src', '')
+            if 'srcset' in attrs or EXCLUDED.search(url) or url in found:
+                continue
+            path = source_path(url)
+            if path:
+                found[url] = path
+    return found
+
+
+def source_digest(path, index, settings):
+    """Content address of a source; index entries skip rehashing files whose mtime and size are unchanged"""
+    stat = os.stat(path)
+    rel = os.path.relpath(path, ROOT)
+    entry = index.get(rel)
+    if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size and entry['settings'] == settings:
+        return entry
+    digest = hashlib.sha256(f'{file_hash(path)}:{settings}'.encode('utf-8')).hexdigest()[:16]
+    entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'settings': settings, 'digest': digest, 'variants': None}
+    index[rel] = entry
+    return entry
+
+
+def variant_name(digest, width, name):
+    return f'{digest}-{width}.{name}'
+
+
+def _encode_task(task):
+    """
+    Resize and encode one source inside a worker process.
+
+    Returns (digest, {format: [(width, bytes), ...]}) for every variant,
+    encoding only those missing from the cache unless force is set.
+    """
+    path, digest, names, force = task
+    variants = {name: [] for name in names}
+    with Image.open(path) as image:
+        source_width, source_height = image.size
+        widths = [width for width in WIDTHS if width < source_width]
+        if source_width <= WIDTHS[-1]:
+            widths.append(source_width)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'PA') else 'RGB')
+        for width in widths:
+            resized = None
+            for name in names:
+                target = os.path.join(CACHE_DIR, variant_name(digest, width, name))
+                if force or not os.path.exists(target):
+                    if resized is None:
+                        height = max(1, round(source_height * width / source_width))
+                        resized = image if width == source_width else image.resize((width, height), Image.LANCZOS)
+                    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix='.tmp-', suffix=f'.{name}')
+                    os.close(fd)
+                    try:
+                        resized.save(tmp, format=name.upper(), **FORMATS[name])
+                        os.replace(tmp, target)
+                    except BaseException:
+                        os.unlink(tmp)
+                        raise
+                variants[name].append((width, os.path.getsize(target)))
+    return digest, variants
+
+
+def load_index(path=INDEX_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def encode(sources, jobs=None, force=False):
+    """
+    Make sure every source has its variants in the cache.
+
+    sources is {URL: path}. Returns ({URL: index entry}, encoded source
+    count); entries carry the digest and the {format: [(width, bytes)]}
+    variants.
+    """
+    names = formats()
+    settings = settings_key(names)
+    index = {} if force else load_index()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    entries = {url: source_digest(path, index, settings) for url, path in sources.items()}
+    pending = {}
+    for url, entry in entries.items():
+        cached = entry['variants'] and all(
+            os.path.exists(os.path.join(CACHE_DIR, variant_name(entry['digest'], width, name)))
+            for name in names for width, _ in entry['variants'].get(name, [])
+        )
+        if force or not cached:
+            pending[entry['digest']] = (sources[url], entry['digest'], names, force)
+
+    tasks = list(pending.values())
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(tasks) < 2:
+        results = [_encode_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_encode_task, tasks))
+
+    encoded = dict(results)
+    for entry in entries.values():
+        if entry['digest'] in encoded:
+            entry['variants'] = encoded[entry['digest']]
+    write_atomic(INDEX_FILE, json.dumps(index, indent=1, sort_keys=True).encode('utf-8'))
+    return entries, len(results)
+
+
+def publish(root, entries):
+    """Copy the variants into root/Images/responsive/; return how many were copied"""
+    target_dir = os.path.join(root, *VARIANT_URL.strip('/').split('/'))
+    os.makedirs(target_dir, exist_ok=True)
+    copied = 0
+    for entry in entries.values():
+        for name, variants in entry['variants'].items():
+            for width, size in variants:
+                filename = variant_name(entry['digest'], width, name)
+                target = os.path.join(target_dir, filename)
+                if os.path.exists(target) and os.path.getsize(target) == size:
+                    continue
+                shutil.copyfile(os.path.join(CACHE_DIR, filename), target)
+                copied += 1
+    return copied
+
+
+def srcset(entry, name):
+    return ', '.join(
+        f'{VARIANT_URL}/{variant_name(entry["digest"], width, name)} {width}w'
+        for width, _ in entry['variants'][name]
+    )
+
+
+def sizes_for(attrs):
+    if 'sizes' in attrs:
+        return attrs['sizes']
+    for name in attrs.get('class', '').split():
+        if name in SIZES:
+            return SIZES[name]
+    return DEFAULT_SIZES
+
+
+def responsive_tag(tag, entry):
+    """
+    The <img> tag with a WebP srcset and sizes, wrapped in a <picture> with
+    the other formats as <source>s when there are any. src stays as the
+    fallback.
+    """
+    attrs = dict(ATTRIBUTE.findall(tag))
+    sizes = sizes_for(attrs)
+    variants = entry['variants']
+    img = tag
+    if variants.get('webp'):
+        img = re.sub(r'\s*/?>$', '', tag) + f' srcset="{srcset(entry, "webp")}" sizes="{sizes}">'
+    sources = ''.join(
+        f'<source type="image/{name}" srcset="{srcset(entry, name)}" sizes="{sizes}">'
+        for name in variants if name != 'webp' and variants[name]
+    )
+    return f'<picture>{sources}{img}</picture>' if sources else img
+
+
+def rewrite(html, entries):
+    """html with every referenced <img> made responsive; returns (html, tags rewritten)"""
+    rewritten = 0
+
+    def replace(match):
+        nonlocal rewritten
+        tag = match.group(0)
+        attrs = dict(ATTRIBUTE.findall(tag))
+        entry = entries.get(attrs.get('src', ''))
+        if 'srcset' in attrs or not entry or not entry['variants']:
+            return tag
+        rewritten += 1
+        return responsive_tag(tag, entry)
+    return IMG_TAG.sub(replace, html), rewritten
+
+
+def process(root, pages, writer, jobs=None, force=False):
+    """
+    Encode, publish and reference the variants of every image the pages use.
+
+    Returns {'sources': n, 'encoded': n, 'published': n, 'pages': n,
+    'tags': n, 'bytes': source bytes, 'variant_bytes': bytes of the widest
+    WebP (else first format) variant per source}.
+    """
+    sources = references(root, pages)
+    entries, encoded = encode(sources, jobs, force)
+    published = publish(root, entries)
+
+    changed_pages = 0
+    tags = 0
+    for rel in pages:
+        path = os.path.join(root, rel)
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        html, count = rewrite(html, entries)
+        if count:
+            writer.write(path, html)
+            changed_pages += 1
+            tags += count
+
+    widest = 0
+    for entry in entries.values():
+        variants = entry['variants'].get('webp') or next(iter(entry['variants'].values()), [])
+        widest += variants[-1][1] if variants else 0
+    return {
+        'sources': len(sources),
+        'encoded': encoded,
+        'published': published,
+        'pages': changed_pages,
+        'tags': tags,
+        'bytes': sum(os.path.getsize(path) for path in sources.values()),
+        'variant_bytes': widest,
+    }
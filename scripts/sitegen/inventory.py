@@ -0,0 +1,140 @@
+"""
+Cached inventory of the site's source files.
+
+The tree is walked once with os.scandir under a single exclusion policy and
+the result (directory mtimes, file mtimes and sizes) is kept in
+.sitegen-cache/inventory.json. Later runs re-stat the cached entries and
+only rescan directories whose mtime changed, i.e. where files were added,
+removed or renamed.
+"""
+
+import json
+import os
+
+from . import ROOT
+from .output import write_atomic
+
+INVENTORY_FILE = os.path.join(ROOT, '.sitegen-cache', 'inventory.json')
+
+# Directories that never hold site pages
+EXCLUDED_DIRS = {'admin', 'dist', 'data', 'Images', 'node_modules', 'logs', 'partials', 'public', 'scripts'}
+
+
+def excluded(name, is_dir):
+    """The one exclusion policy: hidden/AppleDouble entries, excluded dirs, admin pages"""
+    if name.startswith('.'):
+        return True
+    if is_dir:
+        return name in EXCLUDED_DIRS
+    return name.startswith('admin')
+
+
+def _scan_dir(root, rel, inventory):
+    """Scan one directory (and new subdirectories) into the inventory"""
+    path = os.path.join(root, rel)
+    inventory['dirs'][rel] = os.stat(path).st_mtime_ns
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if excluded(entry.name, is_dir):
+                continue
+            entry_rel = os.path.join(rel, entry.name) if rel else entry.name
+            if is_dir:
+                subdirs.append(entry_rel)
+            elif entry.is_file():
+                stat = entry.stat()
+                inventory['files'][entry_rel] = [stat.st_mtime_ns, stat.st_size]
+    for subdir in subdirs:
+        if subdir not in inventory['dirs']:
+            _scan_dir(root, subdir, inventory)
+
+
+def _drop_dir(rel, inventory):
+    """Forget a directory and everything below it"""
+    prefix = rel + os.sep if rel else ''
+    for name in [d for d in inventory['dirs'] if d == rel or d.startswith(prefix)]:
+        del inventory['dirs'][name]
+    for name in [f for f in inventory['files'] if f.startswith(prefix)]:
+        del inventory['files'][name]
+
+
+def _parent(rel):
+    return os.path.dirname(rel)
+
+
+def refresh(inventory=None, root=ROOT):
+    """
+    Bring an inventory up to date.
+
+    Unchanged directories keep their file list and each file is re-stat'ed;
+    directories whose mtime moved are rescanned. With no inventory, the whole
+    tree is scanned.
+    """
+    if not inventory or not inventory.get('dirs'):
+        inventory = {'dirs': {}, 'files': {}}
+        _scan_dir(root, '', inventory)
+        return inventory
+
+    for rel in sorted(inventory['dirs'], key=len):
+        if rel not in inventory['dirs']:
+            continue
+        try:
+            mtime = os.stat(os.path.join(root, rel)).st_mtime_ns
+        except FileNotFoundError:
+            _drop_dir(rel, inventory)
+            continue
+        if mtime == inventory['dirs'][rel]:
+            continue
+
+        # Entries were added or removed here - rescan just this directory
+        for name in [f for f in inventory['files'] if _parent(f) == rel]:
+            del inventory['files'][name]
+        children = [d for d in inventory['dirs'] if d != rel and _parent(d) == rel]
+        _scan_dir(root, rel, inventory)
+        for child in children:
+            if not os.path.isdir(os.path.join(root, child)):
+                _drop_dir(child, inventory)
+
+    for rel in list(inventory['files']):
+        try:
+            stat = os.stat(os.path.join(root, rel))
+        except FileNotFoundError:
+            del inventory['files'][rel]
+            continue
+        inventory['files'][rel] = [stat.st_mtime_ns, stat.st_size]
+
+    return inventory
+
+
+def load(path=INVENTORY_FILE):
+    """Read the cached inventory (None if there is none yet)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def save(inventory, path=INVENTORY_FILE):
+    """Persist the inventory"""
+    write_atomic(path, json.dumps(inventory, sort_keys=True).encode('utf-8'))
+
+
+def files(suffixes=None):
+    """
+    Current {relative path: (mtime_ns, size)} for the site's files, optionally
+    limited to the given suffixes. Refreshes and saves the cached inventory.
+    """
+    inventory = refresh(load())
+    save(inventory)
+    return {
+        rel: tuple(stat)
+        for rel, stat in sorted(inventory['files'].items())
+        if suffixes is None or rel.endswith(suffixes)
+    }
+
+
+def html_files():
+    """Relative paths of every site HTML page"""
+    return list(files(('.html',)))
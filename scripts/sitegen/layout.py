@@ -0,0 +1,88 @@
+"""
+Shared layout partials (header, nav, footer, CTA banner).
+
+Partials live in /partials as HTML files. `{{> name }}` includes another
+partial and `{{ name }}` is a value supplied at render time. Each partial
+is read, expanded and compiled once per process and then served from an
+in-memory cache, so a nav change is one edit to partials/nav.html followed
+by a re-render from cache.
+"""
+
+import os
+import re
+
+from . import ROOT, stats
+from .template import CompiledTemplate, placeholders
+
+PARTIALS_DIR = os.path.join(ROOT, 'partials')
+
+INCLUDE = re.compile(r'\{\{>\s*([\w-]+)\s*\}\}')
+
+# name -> CompiledTemplate
+_cache = {}
+
+# name -> names of every partial it includes, directly or not
+_includes = {}
+
+# Partials rendered since the last used_partials() call
+_used = set()
+
+
+def partial_path(name):
+    return os.path.join(PARTIALS_DIR, f'{name}.html')
+
+
+def read_partial(name):
+    """Raw text of one partial, without its trailing newline"""
+    with open(partial_path(name), 'r', encoding='utf-8') as f:
+        text = f.read()
+    stats.count('bytes_read', len(text.encode('utf-8')))
+    return text[:-1] if text.endswith('\n') else text
+
+
+def expand(name, stack=(), included=None):
+    """A partial's text with every include resolved (their names are added to included)"""
+    if name in stack:
+        raise ValueError(f'partial include cycle: {" -> ".join(stack + (name,))}')
+
+    def include(match):
+        if included is not None:
+            included.add(match.group(1))
+        return expand(match.group(1), stack + (name,), included)
+    return INCLUDE.sub(include, read_partial(name))
+
+
+def partial(name):
+    """The compiled partial, parsed on first use and cached"""
+    if name not in _cache:
+        included = set()
+        text = expand(name, included=included)
+        _cache[name] = CompiledTemplate.compile(text, placeholders(text))
+        _includes[name] = included
+    return _cache[name]
+
+
+def clear_cache():
+    """Forget compiled partials (after a partial file changes)"""
+    _cache.clear()
+    _includes.clear()
+
+
+def render(name, **values):
+    """Render a partial with its placeholder values"""
+    compiled = partial(name)
+    _used.add(name)
+    _used.update(_includes[name])
+    return compiled.render(values)
+
+
+def render_page(title, content, head=''):
+    """A complete page: shared head (plus any page-specific head markup), header, the page's <main> content and footer"""
+    return render('layout', title=title, content=content, head=head)
+
+
+def used_partials():
+    """Files of the partials rendered since the last call (relative to the site root)"""
+    used = sorted(_used)
+    _used.clear()
+    return [os.path.relpath(partial_path(name), ROOT) for name in used]
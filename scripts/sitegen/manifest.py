@@ -0,0 +1,78 @@
+"""
+Build manifest - the dependency graph of the generated pages.
+
+For every output page the manifest records each input file it was built
+from (data file, reference template, partials, generator module, plus one
+combined hash of the shared sitegen code) and that file's content hash. A page is rebuilt only when one of its inputs changed
+since the last build.
+"""
+
+import hashlib
+import json
+import os
+
+from . import ROOT, stats
+from .output import write_atomic
+
+MANIFEST_FILE = os.path.join(ROOT, '.sitegen-cache', 'manifest.json')
+
+
+def hash_bytes(data):
+    """Hex sha256 of bytes or text"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    """Hex sha256 of a file's contents"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    stats.count('bytes_read', len(data))
+    return hash_bytes(data)
+
+
+def hash_input(path, hashes):
+    """Hash of an input file relative to ROOT (None if missing), memoised in hashes"""
+    if path not in hashes:
+        try:
+            hashes[path] = hash_file(os.path.join(ROOT, path))
+        except FileNotFoundError:
+            hashes[path] = None
+    return hashes[path]
+
+
+def changed_inputs(entry, inputs, hashes):
+    """
+    The inputs of a page that differ from its manifest entry.
+
+    inputs are the files known before rendering; the inputs recorded last
+    build (e.g. partials) are checked too. Every input counts as changed
+    for a page that has not been built before.
+    """
+    recorded = entry.get('inputs', {})
+    names = dict.fromkeys(list(inputs) + list(recorded))
+    return [name for name in names if name not in recorded or hash_input(name, hashes) != recorded[name]]
+
+
+def dependents(manifest):
+    """Reverse graph: {input file: [output pages built from it]}"""
+    graph = {}
+    for path, entry in sorted(manifest.items()):
+        for name in entry.get('inputs', {}):
+            graph.setdefault(name, []).append(path)
+    return dict(sorted(graph.items()))
+
+
+def load_manifest(path=MANIFEST_FILE):
+    """Return {output path: {'inputs': {file: hash}, 'seconds': ...}} from the last build"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest, path=MANIFEST_FILE):
+    """Persist the manifest"""
+    write_atomic(path, json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
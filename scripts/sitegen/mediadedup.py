@@ -0,0 +1,247 @@
+"""
+Near-duplicate detection for the WordPress media cache.
+
+data/wp-media-cache/ names each download by its URL's hash, so one upload
+fetched in several sizes or formats (.jpg and .webp) is stored several
+times. Every file gets an exact hash (SHA-256), a 64-bit difference hash of
+its pixels and a 32x32 greyscale thumbnail, computed across a process pool.
+Files with the same exact hash form a cluster, and so do files whose dHashes
+are within HAMMING_THRESHOLD bits, whose aspect ratios match (so crops are
+never merged with the full image) and whose thumbnails agree pixel for
+pixel. The thumbnail check is what keeps apart the blog's templated banners
+(same photo and layout, different headline), which dHash alone merges. A
+cluster's canonical file is the highest-quality one: most pixels, then
+lossless over lossy, then largest.
+
+The result is written to data/wp-media-dedup.json as clusters plus a
+{duplicate URL: canonical URL} mapping under /Images/blog/, where the
+importers publish the cache.
+
+Perceptual hashing needs the optional `Pillow` package; without it only
+byte-identical files are clustered.
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from . import ROOT
+from .compress import file_hash
+from .output import write_atomic
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+MEDIA_CACHE_DIR = os.path.join(ROOT, 'data', 'wp-media-cache')
+PUBLISHED_DIR = os.path.join(ROOT, 'Images', 'blog')
+PUBLISHED_URL = '/Images/blog'
+MAPPING_FILE = os.path.join(ROOT, 'data', 'wp-media-dedup.json')
+BLOG_POSTS_FILE = os.path.join(ROOT, 'data', 'blog-posts.json')
+
+IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+
+# Differing dHash bits still counted as the same picture (of 64)
+HAMMING_THRESHOLD = 6
+
+# Relative aspect ratio difference allowed within a cluster
+ASPECT_TOLERANCE = 0.02
+
+# Thumbnail confirmation: at most this share of pixels may differ by more
+# than PIXEL_TOLERANCE grey levels (re-encodes and resizes stay at 0;
+# banners differing only in their headline reach about 1%)
+THUMBNAIL_SIZE = 32
+PIXEL_TOLERANCE = 40
+MAX_CHANGED_SHARE = 0.004
+
+# srcset attributes inside the JSON-escaped post HTML
+SRCSET = re.compile(r'(srcset=\\")([^"\\]*)(\\")')
+
+# Tie-break between equally large candidates: lossless first
+FORMAT_RANK = {'PNG': 2, 'GIF': 1, 'JPEG': 1, 'WEBP': 0}
+
+
+def media_files(root=MEDIA_CACHE_DIR):
+    return sorted(
+        name for name in os.listdir(root)
+        if name.lower().endswith(IMAGE_SUFFIXES) and not name.startswith('.')
+    )
+
+
+def dhash(grey):
+    """64-bit difference hash: brightness gradients of a 9x8 greyscale thumbnail"""
+    pixels = grey.resize((9, 8), Image.LANCZOS).tobytes()
+    bits = 0
+    for row in range(8):
+        for column in range(8):
+            bits = (bits << 1) | (pixels[row * 9 + column] > pixels[row * 9 + column + 1])
+    return bits
+
+
+def thumbnail(grey):
+    return grey.resize((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.BOX).tobytes()
+
+
+def _hash_task(path):
+    """Exact hash, size and (with Pillow) dHash, thumbnail, dimensions and format of one file"""
+    record = {'sha256': file_hash(path), 'bytes': os.path.getsize(path), 'dhash': None}
+    if Image is not None:
+        try:
+            with Image.open(path) as image:
+                record.update(width=image.width, height=image.height, format=image.format)
+                image.draft('L', (THUMBNAIL_SIZE * 2, THUMBNAIL_SIZE * 2))
+                grey = image.convert('L')
+                record.update(dhash=dhash(grey), thumbnail=thumbnail(grey))
+        except (OSError, ValueError) as e:
+            record['error'] = str(e)
+    return os.path.basename(path), record
+
+
+def hash_files(names, root=MEDIA_CACHE_DIR, jobs=None):
+    """{file name: hash record} for the given files, across a process pool"""
+    paths = [os.path.join(root, name) for name in names]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(paths) < 2:
+        return dict(_hash_task(path) for path in paths)
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return dict(pool.map(_hash_task, paths, chunksize=chunksize))
+
+
+def similar(a, b):
+    """Whether two hashed files show the same picture"""
+    if a['sha256'] == b['sha256']:
+        return True
+    if a['dhash'] is None or b['dhash'] is None:
+        return False
+    ratio_a = a['width'] / a['height']
+    ratio_b = b['width'] / b['height']
+    if abs(ratio_a - ratio_b) > ASPECT_TOLERANCE * max(ratio_a, ratio_b):
+        return False
+    if bin(a['dhash'] ^ b['dhash']).count('1') > HAMMING_THRESHOLD:
+        return False
+    changed = sum(abs(x - y) > PIXEL_TOLERANCE for x, y in zip(a['thumbnail'], b['thumbnail']))
+    return changed <= MAX_CHANGED_SHARE * len(a['thumbnail'])
+
+
+def clusters(records):
+    """Lists of file names showing the same picture (singletons left out), via union-find"""
+    names = sorted(records)
+    parent = {name: name for name in names}
+
+    def find(name):
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for i, a in enumerate(names):
+        for b in names[i + 1:]:
+            if find(a) != find(b) and similar(records[a], records[b]):
+                parent[find(b)] = find(a)
+
+    groups = {}
+    for name in names:
+        groups.setdefault(find(name), []).append(name)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def quality(record):
+    return (
+        record.get('width', 0) * record.get('height', 0),
+        FORMAT_RANK.get(record.get('format'), 0),
+        record['bytes'],
+    )
+
+
+def canonical(group, records):
+    """The cluster member to keep: most pixels, then lossless, then largest file"""
+    return max(group, key=lambda name: (quality(records[name]), name))
+
+
+def dedup(root=MEDIA_CACHE_DIR, jobs=None):
+    """
+    Hash and cluster the media cache.
+
+    Returns {'files': n, 'bytes': total, 'clusters': [{'canonical', 'duplicates'}],
+    'mapping': {duplicate URL: canonical URL}, 'saved': bytes held by duplicates}.
+    """
+    records = hash_files(media_files(root), root, jobs)
+    result = {'files': len(records), 'bytes': sum(record['bytes'] for record in records.values()),
+              'clusters': [], 'mapping': {}, 'saved': 0}
+    for group in clusters(records):
+        keep = canonical(group, records)
+        duplicates = sorted(name for name in group if name != keep)
+        result['clusters'].append({'canonical': keep, 'duplicates': duplicates})
+        for name in duplicates:
+            result['mapping'][f'{PUBLISHED_URL}/{name}'] = f'{PUBLISHED_URL}/{keep}'
+            result['saved'] += records[name]['bytes']
+    result['clusters'].sort(key=lambda cluster: cluster['canonical'])
+    result['mapping'] = dict(sorted(result['mapping'].items()))
+    return result
+
+
+def save_mapping(result, path=MAPPING_FILE):
+    data = {
+        'clusters': result['clusters'],
+        'mapping': result['mapping'],
+    }
+    write_atomic(path, (json.dumps(data, indent=2) + '\n').encode('utf-8'))
+
+
+def collapse_srcset(value):
+    """A srcset with each URL listed once, under its largest descriptor"""
+    best = {}
+    for candidate in value.split(','):
+        url, _, descriptor = candidate.strip().partition(' ')
+        if not url:
+            continue
+        width = descriptor.strip()
+        size = float(width[:-1]) if width[-1:] in ('w', 'x') and width[:-1].replace('.', '', 1).isdigit() else 0
+        if url not in best or size > best[url][0]:
+            best[url] = (size, width)
+    return ', '.join(f'{url} {width}'.rstrip() for url, (_, width) in best.items())
+
+
+def rewrite_posts(mapping, path=BLOG_POSTS_FILE, dry_run=False):
+    """
+    Point data/blog-posts.json at the canonical files. The cache names are
+    URL hashes, so a plain text replacement cannot hit anything else.
+    srcset lists that end up naming a canonical file several times keep
+    it once. Returns how many references were rewritten.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    rewritten = 0
+    for duplicate, keep in mapping.items():
+        rewritten += text.count(duplicate)
+        text = text.replace(duplicate, keep)
+    if rewritten:
+        text = SRCSET.sub(lambda match: f'{match.group(1)}{collapse_srcset(match.group(2))}{match.group(3)}', text)
+        if not dry_run:
+            write_atomic(path, text.encode('utf-8'))
+    return rewritten
+
+
+def prune(mapping, referenced, dry_run=False):
+    """
+    Delete duplicates nothing references any more from the cache and
+    Images/blog/. Returns (files removed, bytes freed).
+    """
+    removed = 0
+    freed = 0
+    for duplicate in mapping:
+        if duplicate in referenced:
+            continue
+        name = duplicate.rsplit('/', 1)[1]
+        for directory in (MEDIA_CACHE_DIR, PUBLISHED_DIR):
+            path = os.path.join(directory, name)
+            if os.path.exists(path):
+                freed += os.path.getsize(path)
+                removed += 1
+                if not dry_run:
+                    os.unlink(path)
+    return removed, freed
+
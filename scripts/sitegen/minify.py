@@ -0,0 +1,374 @@
+"""
+HTML minification for generated pages.
+
+- Comments are removed (conditional comments are kept).
+- Whitespace runs collapse to one space, and whitespace next to block-level
+  tags is dropped.
+- An inline style="..." repeated on a page becomes a generated utility class
+  (u-<hash>) defined once in a <style> block at the end of the <head>, after
+  the stylesheets, so it wins over their rules of equal specificity. It is
+  not marked !important: that would also beat the inline styles script.js
+  sets at runtime. A style stays inline when, on any element carrying it:
+  - it sets a property script.js changes through element.style
+    (RUNTIME_PROPERTIES), or
+  - a stylesheet rule that may apply to the element is more specific than
+    one class and sets an overlapping property (a compound or descendant
+    selector, a [data-theme] .x override). An inline style beats that
+    rule; a class would not. Or
+  - a rule selects on the style attribute itself ([style*="..."]).
+  The page's local stylesheets and <style> blocks are checked. A rule
+  "may apply" when its last compound's classes, id and tag are on the
+  element and every other class, id and tag it needs is on the page or in
+  one of its local scripts (which add classes at runtime). Anything it
+  cannot decide (:is(), :not(), ...) counts as applying, so the check only
+  ever keeps more styles inline.
+
+<pre>, <script>, <style> and <textarea> elements pass through untouched.
+"""
+
+import html as html_lib
+import os
+import re
+
+from . import ROOT, css, stats
+from .manifest import hash_bytes
+
+# Raw elements (kept byte-for-byte) and comments
+SEGMENT = re.compile(r'(<!--.*?-->)|(<(pre|script|style|textarea)\b.*?</\3\s*>)', re.DOTALL | re.IGNORECASE)
+
+BLOCK_TAGS = (
+    'html|head|body|title|meta|link|base|header|footer|main|nav|section|article|aside|div|p|'
+    'h[1-6]|ul|ol|li|dl|dt|dd|table|thead|tbody|tfoot|tr|th|td|form|fieldset|figure|figcaption|'
+    'blockquote|hr|br|noscript|svg|path|circle|line|rect|polyline|polygon|!doctype'
+)
+AROUND_BLOCK = re.compile(r'\s*(</?(?:' + BLOCK_TAGS + r')\b[^>]*>)\s*', re.IGNORECASE)
+
+TAG = re.compile(r'<([a-zA-Z][\w-]*)(\s[^>]*)?>')
+STYLE_ATTR = re.compile(r'\sstyle="([^"]*)"')
+CLASS_ATTR = re.compile(r'(\sclass=")([^"]*)(")')
+ID_ATTR = re.compile(r'\sid="([^"]*)"')
+LINK = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+STYLESHEET_REL = re.compile(r'\srel="stylesheet"', re.IGNORECASE)
+HREF = re.compile(r'\shref="([^"]*)"')
+SCRIPT_SRC = re.compile(r'<script\b[^>]*\ssrc="([^"]*)"', re.IGNORECASE)
+INLINE_STYLESHEET = re.compile(r'<style\b[^>]*>(.*?)</style\s*>', re.DOTALL | re.IGNORECASE)
+INLINE_SCRIPT = re.compile(r'<script\b[^>]*>(.*?)</script\s*>', re.DOTALL | re.IGNORECASE)
+
+# [style], [style="..."], [style*="..."], ... in a selector
+STYLE_SELECTOR = re.compile(r'\[\s*style\s*(?:([*^$~|]?=)\s*(?:"([^"]*)"|\'([^\']*)\'|([^\]\s]*))\s*(?:[is]\s*)?)?\]', re.IGNORECASE)
+COMBINATOR = re.compile(r'\s*[>+~]\s*|\s+')
+PSEUDO_ELEMENT = re.compile(r'::|:(?:before|after|first-line|first-letter)\b', re.IGNORECASE)
+VENDOR_PREFIX = re.compile(r'^-(?:webkit|moz|ms|o)-')
+
+# An inline style must repeat this often on a page to become a class
+MIN_REPEATS = 2
+
+# Properties script.js writes through element.style (menus, accordions,
+# tooltips); elements whose inline style sets one keep it inline
+RUNTIME_PROPERTIES = frozenset({'display', 'max-height', 'cursor', 'transform', 'left', 'top', 'width', 'height'})
+
+# stylesheet or script path -> (mtime_ns, size, parsed)
+_files = {}
+
+# <style> block text -> overriding rules (pages of a layout share their critical CSS)
+_inline_rules = {}
+
+
+def split_declarations(style):
+    """Declarations of an inline style, split on semicolons outside parentheses"""
+    declarations = []
+    depth = 0
+    current = ''
+    for char in style:
+        depth += {'(': 1, ')': -1}.get(char, 0)
+        if char == ';' and depth == 0:
+            declarations.append(current.strip())
+            current = ''
+        else:
+            current += char
+    declarations.append(current.strip())
+    return [declaration for declaration in declarations if declaration]
+
+
+def properties(style):
+    """Lower-cased property names an inline style sets"""
+    return {declaration.partition(':')[0].strip().lower() for declaration in split_declarations(html_lib.unescape(style))}
+
+
+def property_groups(names):
+    """
+    Property names reduced to their group, so longhands and shorthands
+    overlap: margin-left and margin are both 'margin'
+    """
+    return {name if name.startswith('--') else VENDOR_PREFIX.sub('', name).split('-')[0] for name in names}
+
+
+def subject(selector):
+    """The last compound of a selector - the part that names the element styled"""
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(selector):
+        skipped = css._skip(selector, i)
+        if skipped != i:
+            i = skipped
+            continue
+        char = selector[i]
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif depth == 0:
+            combinator = COMBINATOR.match(selector, i)
+            if combinator and combinator.end() > i and combinator.end() < len(selector):
+                start = combinator.end()
+                i = combinator.end()
+                continue
+        i += 1
+    return selector[start:].strip()
+
+
+def outranks_class(selector):
+    """
+    Whether a selector is (or may be) more specific than one class, i.e.
+    beats a utility class but not an inline style.
+    """
+    if css.OPAQUE_PSEUDOS.search(selector) or ':not(' in selector:
+        return True
+    selector = re.sub(r'\([^()]*\)', '', selector)
+    attributes = len(css.ATTRIBUTE.findall(selector))
+    selector = css.ATTRIBUTE.sub('', selector)
+    ids = len(css.ID.findall(selector))
+    classes = len(css.CLASS.findall(selector)) + attributes
+    rest = css.ID.sub('', css.CLASS.sub('', selector))
+    pseudo_elements = len(PSEUDO_ELEMENT.findall(rest))
+    classes += len(css.PSEUDO.findall(rest)) - pseudo_elements
+    types = len(css.TYPE.findall(css.PSEUDO.sub('', rest))) + pseudo_elements
+    return ids > 0 or classes > 1 or (classes == 1 and types > 0)
+
+
+def overriding_rules(nodes):
+    """
+    (requirements, classes, ids, types, style tests, property groups) for
+    each selector that could change how an element renders once its inline
+    style becomes a class: one that outranks a class, or one that tests the
+    style attribute. requirements are what the whole selector needs on the
+    page (css.requirements); the classes, ids and types are those of its
+    last compound.
+    """
+    rules = []
+    for node in nodes:
+        if isinstance(node, css.AtRule):
+            if node.children is not None:
+                rules += overriding_rules(node.children)
+            continue
+        groups = property_groups(properties(node.body))
+        for selector in node.selectors:
+            compound = subject(selector)
+            if PSEUDO_ELEMENT.search(compound):
+                continue
+            tests = STYLE_SELECTOR.findall(compound)
+            if not tests and not outranks_class(selector):
+                continue
+            needed = css.requirements(compound) or (set(), set(), set())
+            rules.append((css.requirements(selector), *needed, tests, groups))
+    return rules
+
+
+def _local(url):
+    """Site-root-relative path of a root-relative URL (None for external and relative ones)"""
+    url = url.split('?')[0].split('#')[0]
+    if url.startswith('/') and not url.startswith('//'):
+        return url.lstrip('/')
+    return None
+
+
+def stylesheets(page):
+    """Local stylesheets a page links; external ones (web fonts) are skipped"""
+    paths = []
+    for link in LINK.findall(page):
+        href = HREF.search(link)
+        if STYLESHEET_REL.search(link) and href and _local(href.group(1)):
+            paths.append(_local(href.group(1)))
+    return paths
+
+
+def scripts(page):
+    """Local scripts a page loads"""
+    return [_local(src) for src in SCRIPT_SRC.findall(page) if _local(src)]
+
+
+def dependencies(page):
+    """Files besides the page itself that decide how it is minified"""
+    return stylesheets(page) + scripts(page)
+
+
+def _cached(path, parse):
+    """parse(text) of a file under ROOT, redone only if the file changed since last read (None if missing)"""
+    full = os.path.join(ROOT, path)
+    try:
+        stat = os.stat(full)
+    except FileNotFoundError:
+        return None
+    cached = _files.get(full)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(full, 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    stats.count('bytes_read', stat.st_size)
+    parsed = parse(text)
+    _files[full] = (stat.st_mtime_ns, stat.st_size, parsed)
+    return parsed
+
+
+def page_rules(page):
+    """
+    Overriding rules of the page's linked stylesheets and <style> blocks
+    whose classes, ids and types all occur on the page or in its scripts
+    """
+    rules = []
+    for path in stylesheets(page):
+        rules += _cached(path, lambda text: overriding_rules(css.parse(text))) or []
+    for text in INLINE_STYLESHEET.findall(page):
+        if text not in _inline_rules:
+            _inline_rules[text] = overriding_rules(css.parse(text))
+        rules += _inline_rules[text]
+    if not rules:
+        return rules
+
+    usage = css.Usage()
+    for match in TAG.finditer(page):
+        attrs = match.group(2) or ''
+        usage.tags.add(match.group(1).lower())
+        classes = CLASS_ATTR.search(attrs)
+        if classes:
+            usage.classes.update(classes.group(2).split())
+        element_id = ID_ATTR.search(attrs)
+        if element_id:
+            usage.ids.add(element_id.group(1))
+    for text in INLINE_SCRIPT.findall(page):
+        usage.add_script(text)
+    for path in scripts(page):
+        usage.tokens |= _cached(path, lambda text: set(css.TOKEN.findall(text))) or set()
+    return [rule for rule in rules if usage.covers(rule[0])]
+
+
+def _style_test(test, style):
+    operator, *values = test
+    value = next((value for value in values if value), '')
+    if not operator:
+        return True
+    if operator == '=':
+        return style == value
+    if operator == '*=':
+        return value in style
+    if operator == '^=':
+        return style.startswith(value)
+    if operator == '$=':
+        return style.endswith(value)
+    return True
+
+
+def _overridden(attrs, tag, style, rules):
+    """Whether an element's inline style must stay inline because of a stylesheet rule"""
+    classes = CLASS_ATTR.search(attrs)
+    classes = set(classes.group(2).split()) if classes else set()
+    element_id = ID_ATTR.search(attrs)
+    element_id = {element_id.group(1)} if element_id else set()
+    groups = property_groups(properties(style))
+    for _, needed_classes, ids, types, tests, rule_groups in rules:
+        if needed_classes - classes or ids - element_id or types - {tag.lower()}:
+            continue
+        if tests:
+            if all(_style_test(test, style) for test in tests):
+                return True
+        elif groups & rule_groups or 'all' in rule_groups or 'all' in groups:
+            return True
+    return False
+
+
+def utility_rule(name, style):
+    declarations = []
+    for declaration in split_declarations(html_lib.unescape(style)):
+        prop, _, value = declaration.partition(':')
+        declarations.append(f'{prop.strip()}:{value.strip()}')
+    return f'.{name}{{{";".join(declarations)}}}'
+
+
+def _utility_classes(texts, rules=()):
+    """
+    {style value: class name} for inline styles repeated across the page's
+    text segments that no rule in rules would override as a class
+    """
+    counts = {}
+    kept_inline = set()
+    for text in texts:
+        for match in TAG.finditer(text):
+            attrs = match.group(2) or ''
+            style = STYLE_ATTR.search(attrs)
+            value = style.group(1).strip() if style else ''
+            if not value:
+                continue
+            counts[value] = counts.get(value, 0) + 1
+            if value not in kept_inline and _overridden(attrs, match.group(1), html_lib.unescape(value), rules):
+                kept_inline.add(value)
+    return {
+        value: f'u-{hash_bytes(value)[:6]}'
+        for value, seen in counts.items()
+        if seen >= MIN_REPEATS and value not in kept_inline and not properties(value) & RUNTIME_PROPERTIES
+    }
+
+
+def _apply_classes(text, classes):
+    def tag(match):
+        attrs = match.group(2) or ''
+        style = STYLE_ATTR.search(attrs)
+        if not style or style.group(1).strip() not in classes:
+            return match.group(0)
+        name = classes[style.group(1).strip()]
+        attrs = attrs[:style.start()] + attrs[style.end():]
+        if CLASS_ATTR.search(attrs):
+            attrs = CLASS_ATTR.sub(lambda m: f'{m.group(1)}{m.group(2)} {name}{m.group(3)}', attrs, count=1)
+        else:
+            attrs = f' class="{name}"' + attrs
+        return f'<{match.group(1)}{attrs}>'
+    return TAG.sub(tag, text)
+
+
+def _collapse(text):
+    return AROUND_BLOCK.sub(r'\1', re.sub(r'\s+', ' ', text))
+
+
+def segments(page):
+    """The page as (kind, text) pairs: 'text' to minify, 'raw' to keep; comments dropped"""
+    parts = []
+    position = 0
+    for match in SEGMENT.finditer(page):
+        parts.append(('text', page[position:match.start()]))
+        if match.group(2):
+            parts.append(('raw', match.group(2)))
+        elif match.group(1).startswith('<!--[if'):
+            parts.append(('raw', match.group(1)))
+        position = match.end()
+    parts.append(('text', page[position:]))
+    return parts
+
+
+def minify(page, utility_classes=True):
+    """
+    Minified copy of an HTML page. Repeated inline styles only become
+    utility classes when the page has a <head> to hold their rules.
+    """
+    parts = segments(page)
+    classes = {}
+    if utility_classes and '</head>' in page:
+        classes = _utility_classes((text for kind, text in parts if kind == 'text'), page_rules(page))
+
+    result = ''.join(
+        _collapse(_apply_classes(text, classes) if classes else text) if kind == 'text' else text
+        for kind, text in parts
+    ).strip()
+    if classes:
+        rules = ''.join(utility_rule(name, style) for style, name in sorted(classes.items(), key=lambda item: item[1]))
+        result = result.replace('</head>', f'<style>{rules}</style></head>', 1)
+    return result
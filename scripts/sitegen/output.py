@@ -0,0 +1,89 @@
+"""
+Batched, atomic output writer.
+
+Pages are queued with write() and flushed together at the end of a run.
+A queued page is only written if it differs from what is on disk (sizes
+compared first, then contents), and each write goes to a temp file in the
+same directory that is renamed over the target, so an interrupted run never
+leaves a half-written page.
+"""
+
+import os
+import tempfile
+
+from . import stats
+
+
+def same_content(path, data):
+    """True if the file at path already holds exactly these bytes"""
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, 'rb') as f:
+            existing = f.read()
+        stats.count('bytes_read', len(existing))
+        return existing == data
+    except FileNotFoundError:
+        return False
+
+
+def write_atomic(path, data):
+    """Write bytes through a temp file and rename it over path"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        stats.count('bytes_written', len(data))
+        if os.path.exists(path):
+            os.chmod(tmp, os.stat(path).st_mode & 0o777)
+        else:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class OutputWriter:
+    """
+    Queue of pending writes, flushed in one batch.
+
+    Use as a context manager to flush on a clean exit:
+
+        with OutputWriter() as out:
+            out.write('about.html', html)
+    """
+
+    def __init__(self, dry_run=False):
+        self.dry_run = dry_run
+        self.pending = {}
+        self.written = []
+        self.unchanged = []
+
+    def write(self, path, content, encoding='utf-8'):
+        """Queue content for path (a later write to the same path wins)"""
+        self.pending[path] = content.encode(encoding) if isinstance(content, str) else content
+
+    def flush(self):
+        """Write every queued file that changed; return the paths written"""
+        written = []
+        for path, data in self.pending.items():
+            if same_content(path, data):
+                self.unchanged.append(path)
+                continue
+            if not self.dry_run:
+                write_atomic(path, data)
+            written.append(path)
+        self.pending = {}
+        self.written.extend(written)
+        return written
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        return False
@@ -0,0 +1,246 @@
+"""
+Shared load -> render -> write pipeline for all page families.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import ROOT, advisory, blog, content, layout, sectors, stats, structures, topics
+from .manifest import changed_inputs, hash_bytes, hash_file, hash_input, load_manifest, save_manifest
+from .minify import dependencies as minify_dependencies, minify as minify_html
+from .output import OutputWriter
+
+# Page families in the order they are built
+FAMILIES = {
+    family.NAME: family
+    for family in (structures, sectors, advisory, topics, blog)
+}
+
+# Compiled templates, handed to each worker process once by _init_worker
+_templates = {}
+
+# The package's own code: every page is built by the shared modules
+# (pipeline, template, layout, minify, ...), so it is an input of every page
+CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+CODE_INPUT = 'scripts/sitegen/*.py'
+
+
+def load_template(family):
+    """Read the reference page a family renders from (None if it has none)"""
+    if not family.TEMPLATE:
+        return None
+    with open(os.path.join(ROOT, family.TEMPLATE), 'r', encoding='utf-8') as f:
+        text = f.read()
+    stats.count('bytes_read', len(text.encode('utf-8')))
+    return text
+
+
+def compile_template(family, text):
+    """Compile a family's template once per build (families without a compiler use the text)"""
+    compiler = getattr(family, 'compile_template', None)
+    if compiler is None or text is None:
+        return text
+    return compiler(text)
+
+
+def _init_worker(templates):
+    """Process pool initializer - keep the templates for every task"""
+    _templates.update(templates)
+
+
+def _render_task(task):
+    """
+    Render one page inside a worker process.
+
+    Returns (path, html, wall seconds, cpu seconds, partials used, counters).
+    """
+    name, page = task
+    family = FAMILIES[name]
+    layout.used_partials()
+    wall, cpu = time.perf_counter(), time.process_time()
+    html = family.render(page, _templates.get(name))
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return family.output_path(page), html, wall, cpu, layout.used_partials(), stats.take_counters()
+
+
+def render_pages(tasks, templates, jobs=None):
+    """Render (family name, page) tasks, across a process pool if jobs != 1"""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(tasks) < 2:
+        _init_worker(templates)
+        return [_render_task(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(templates,)) as pool:
+        return list(pool.map(_render_task, tasks, chunksize=chunksize))
+
+
+def code_hash():
+    """
+    One hash over the shared sitegen modules. The family modules are left
+    out: each is an input of its own pages only.
+    """
+    families = {os.path.abspath(family.__file__) for family in FAMILIES.values()}
+    names = sorted(name for name in os.listdir(CODE_DIR) if name.endswith('.py'))
+    digest = []
+    for name in names:
+        path = os.path.join(CODE_DIR, name)
+        if path not in families:
+            digest.append(f'{name}:{hash_file(path)}')
+    return hash_bytes('\n'.join(digest))
+
+
+def page_inputs(family, page):
+    """Files a page is built from, as far as is known before rendering it"""
+    inputs = [CODE_INPUT, os.path.relpath(family.__file__, ROOT)]
+    if family.TEMPLATE:
+        inputs.append(family.TEMPLATE)
+    source = content.source(page)
+    if source:
+        inputs.append(source)
+    return inputs
+
+
+def record_keys(family, page):
+    """
+    Inputs that are part of a shared data file rather than a file of their
+    own, as {name: hash} (families with one record per file have none).
+    """
+    keys = getattr(family, 'record_keys', None)
+    return keys(page) if keys else {}
+
+
+def orphaned(family, manifest, produced):
+    """
+    Pages a family built before but no longer produces (e.g. an unpublished
+    post): manifest entries built from the family's module, minus produced.
+    """
+    module = os.path.relpath(family.__file__, ROOT)
+    return [
+        path for path, entry in sorted(manifest.items())
+        if module in entry.get('inputs', {}) and path not in produced
+    ]
+
+
+def plan(names=None, manifest=None, force=False, hashes=None, minify=False):
+    """
+    Work out which pages of the named families need rebuilding.
+
+    Returns (stale, skipped, removed): stale is a list of (family name, page,
+    output path, inputs, changed inputs), skipped the output paths that are
+    up to date and removed the earlier outputs the families no longer
+    produce. A page is stale if any input changed, its output is missing or
+    it was last written with a different minify setting.
+    """
+    manifest = load_manifest() if manifest is None else manifest
+    hashes = {} if hashes is None else hashes
+    hashes.setdefault(CODE_INPUT, code_hash())
+    stale = []
+    skipped = []
+    removed = []
+    for name in names or list(FAMILIES):
+        family = FAMILIES[name]
+        produced = set()
+        for page in family.load():
+            path = family.output_path(page)
+            produced.add(path)
+            inputs = page_inputs(family, page)
+            keys = record_keys(family, page)
+            hashes.update(keys)
+            inputs += list(keys)
+            entry = manifest.get(path, {})
+            changed = changed_inputs(entry, inputs, hashes)
+            if not changed and not os.path.exists(os.path.join(ROOT, path)):
+                changed = [path]
+            if not changed and entry and entry.get('minified', False) != minify:
+                changed = ['(minify setting)']
+            if changed or force:
+                stale.append((name, page, path, inputs, changed))
+            else:
+                skipped.append(path)
+        removed += orphaned(family, manifest, produced)
+    return stale, skipped, removed
+
+
+def build(names=None, jobs=None, dry_run=False, force=False, minify=False):
+    """
+    Generate the pages of the named families (all families by default).
+
+    Pages none of whose inputs changed since the manifest was written (and
+    whose output still exists) are skipped unless force is set. Pages a
+    family no longer produces (an unpublished or deleted post) are deleted
+    along with their manifest entries. With minify set, rendered pages go
+    through the HTML minifier before being written. Returns a summary of
+    built/skipped/removed pages, time saved, the (path, bytes before, bytes
+    after) of each minified page and the build's BuildStats.
+    """
+    build_stats = stats.BuildStats()
+    stats.take_counters()
+
+    # Load - only compile templates that have pages to render
+    with build_stats.stage('load'):
+        manifest = load_manifest()
+        hashes = {}
+        stale, skipped, removed = plan(names, manifest, force, hashes, minify)
+        tasks = [(name, page) for name, page, _, _, _ in stale]
+        inputs = {path: files for _, _, path, files, _ in stale}
+        templates = {}
+        for name in dict.fromkeys(name for name, _ in tasks):
+            family = FAMILIES[name]
+            templates[name] = compile_template(family, load_template(family))
+    build_stats.merge(stats.take_counters())
+
+    # Render
+    with build_stats.stage('render'):
+        results = render_pages(tasks, templates, jobs) if tasks else []
+
+    # Minify
+    minified = []
+    if minify and results:
+        with build_stats.stage('minify'):
+            for i, (path, html, *rest) in enumerate(results):
+                small = minify_html(html)
+                minified.append((path, len(html.encode('utf-8')), len(small.encode('utf-8'))))
+                results[i] = (path, small, *rest)
+                # Which inline styles may become classes depends on the page's stylesheets and scripts
+                inputs[path] = inputs[path] + minify_dependencies(html)
+
+    # Write - one batch at the end, leaving byte-identical pages untouched
+    built = []
+    writer = OutputWriter(dry_run=dry_run)
+    with build_stats.stage('write'):
+        for path, html, wall, cpu, partials, page_counters in results:
+            build_stats.add_page(path, wall, cpu, page_counters)
+            writer.write(os.path.join(ROOT, path), html)
+            if not dry_run:
+                manifest[path] = {
+                    'inputs': {name: hash_input(name, hashes) for name in inputs[path] + partials},
+                    'seconds': round(wall, 6),
+                    'minified': minify,
+                }
+            built.append(path)
+        for filepath in writer.flush():
+            print(f'Created {os.path.relpath(filepath, ROOT)}')
+
+        if not dry_run:
+            for path in removed:
+                try:
+                    os.unlink(os.path.join(ROOT, path))
+                    print(f'Removed {path}')
+                except FileNotFoundError:
+                    pass
+                del manifest[path]
+        if (built or removed) and not dry_run:
+            save_manifest(manifest)
+    build_stats.merge(stats.take_counters())
+
+    return {
+        'built': built,
+        'written': len(writer.written),
+        'skipped': skipped,
+        'removed': removed,
+        'saved': sum(manifest[path].get('seconds', 0) for path in skipped),
+        'minified': minified,
+        'stats': build_stats,
+    }
@@ -0,0 +1,295 @@
+"""
+Related posts for the blog.
+
+Every published post becomes a TF-IDF vector over the stems of its title
+(counted TITLE_REPEAT times), excerpt and text, using search's tokenizer
+and stemmer. Term weights are 1 + log(tf) times the IDF, and each vector is
+L2-normalised. Terms found in only one post, or in more than
+MAX_DOCUMENT_SHARE of them, are left out. Two posts score
+
+    TEXT_WEIGHT * cosine + TAG_WEIGHT * tag Jaccard + CATEGORY_WEIGHT * same category
+
+and each post's TOP_N best are written to data/blog-related.json, which the
+blog page family renders.
+
+With NumPy the scores for all requested rows come from one matrix multiply
+per signal (scipy.sparse matrices when SciPy is installed, dense arrays
+otherwise). Without it, the same sums are accumulated in pure Python
+through an inverted index.
+
+.sitegen-cache/related.json keeps each post's content hash, term counts and
+CANDIDATES best matches with their scores. A run only re-tokenises and
+re-scores the rows of new or edited posts, then patches their scores into
+the other posts' candidate lists. The IDF is frozen between full runs, which
+happen on --full, when the cache is missing, or once the post count drifts
+more than REBUILD_DRIFT from the count the IDF was computed for. Until then
+an edit that shifts how common a term is does not reweight the other
+posts, so incremental rankings can differ slightly from a full run's; the
+cache counts the posts added, edited or removed since the last full run so
+the CLI can say so.
+"""
+
+import json
+import math
+import os
+
+from . import ROOT, blogshards, search
+from .manifest import hash_bytes
+from .output import write_atomic
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+SOURCE_FILE = blogshards.SOURCE_FILE
+RELATED_FILE = os.path.join(ROOT, 'data', 'blog-related.json')
+CACHE_FILE = os.path.join(ROOT, '.sitegen-cache', 'related.json')
+
+TOP_N = 3
+
+# Matches kept per post, so incremental runs can refill the top N when a
+# changed post drops out of it
+CANDIDATES = 20
+
+TEXT_WEIGHT = 0.7
+TAG_WEIGHT = 0.2
+CATEGORY_WEIGHT = 0.1
+
+TITLE_REPEAT = 3
+MAX_DOCUMENT_SHARE = 0.5
+REBUILD_DRIFT = 0.1
+
+# Scores are rounded so every backend ranks ties the same way
+PRECISION = 6
+
+
+def backend():
+    if numpy is None:
+        return 'python'
+    return 'scipy.sparse' if sparse is not None else 'numpy'
+
+
+def post_hash(post):
+    """Hash of the fields that feed the scores"""
+    fields = [post['title'], post.get('excerpt'), post.get('content'), post.get('category_slug'), post.get('tag_slugs')]
+    return hash_bytes(json.dumps(fields))[:16]
+
+
+def term_counts(post):
+    counts = {}
+    title, _ = search.terms(search.plain_text(post['title']))
+    excerpt, _ = search.terms(search.plain_text(post.get('excerpt')))
+    content, _ = search.terms(search.plain_text(post.get('content')))
+    for _, term in title * TITLE_REPEAT + excerpt + content:
+        counts[term] = counts.get(term, 0) + 1
+    return counts
+
+
+def inverse_frequencies(counts):
+    """{term: smoothed IDF} for the terms shared by at least two posts but not too many"""
+    frequencies = {}
+    for post_counts in counts.values():
+        for term in post_counts:
+            frequencies[term] = frequencies.get(term, 0) + 1
+    total = len(counts)
+    return {
+        term: math.log((1 + total) / (1 + frequency)) + 1
+        for term, frequency in sorted(frequencies.items())
+        if 2 <= frequency <= MAX_DOCUMENT_SHARE * total
+    }
+
+
+def tfidf(counts, idf):
+    """L2-normalised {term: weight}"""
+    weights = {term: (1 + math.log(count)) * idf[term] for term, count in counts.items() if term in idf}
+    norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+    return {term: weight / norm for term, weight in weights.items()} if norm else {}
+
+
+def category(post):
+    slug = post.get('category_slug')
+    return None if not slug or slug.startswith('uncategori') else slug
+
+
+def _python_scores(rows, vectors, tags, categories):
+    """Blended score rows (lists) for the post indexes in rows, via an inverted index"""
+    postings = {}
+    for column, vector in enumerate(vectors):
+        for term, weight in vector.items():
+            postings.setdefault(term, []).append((column, weight))
+    result = []
+    for row in rows:
+        cosine = [0.0] * len(vectors)
+        for term, weight in vectors[row].items():
+            for column, other in postings[term]:
+                cosine[column] += weight * other
+        scores = []
+        for column in range(len(vectors)):
+            shared = len(tags[row] & tags[column])
+            union = len(tags[row]) + len(tags[column]) - shared
+            same = categories[row] is not None and categories[row] == categories[column]
+            scores.append(TEXT_WEIGHT * cosine[column] + TAG_WEIGHT * (shared / union if union else 0) + CATEGORY_WEIGHT * same)
+        result.append(scores)
+    return result
+
+
+def _numpy_scores(rows, vectors, tags, categories):
+    """Blended score rows for the post indexes in rows: one product per signal"""
+    count = len(vectors)
+    term_index = {term: i for i, term in enumerate(sorted({term for vector in vectors for term in vector}))}
+    tag_index = {tag: i for i, tag in enumerate(sorted({tag for post_tags in tags for tag in post_tags}))}
+
+    def matrix(entries, width):
+        coordinates = [(row, column, value) for row, row_entries in enumerate(entries) for column, value in row_entries]
+        row_ids = numpy.array([entry[0] for entry in coordinates], dtype=numpy.int64)
+        column_ids = numpy.array([entry[1] for entry in coordinates], dtype=numpy.int64)
+        values = numpy.array([entry[2] for entry in coordinates], dtype=numpy.float64)
+        if sparse is not None:
+            return sparse.csr_matrix((values, (row_ids, column_ids)), shape=(count, max(width, 1)))
+        dense = numpy.zeros((count, max(width, 1)))
+        dense[row_ids, column_ids] = values
+        return dense
+
+    def product(m, selected):
+        result = m[selected] @ m.T
+        return result.toarray() if sparse is not None else result
+
+    selected = numpy.array(rows, dtype=numpy.int64)
+    text = matrix([[(term_index[term], weight) for term, weight in vector.items()] for vector in vectors], len(term_index))
+    tag_matrix = matrix([[(tag_index[tag], 1.0) for tag in post_tags] for post_tags in tags], len(tag_index))
+
+    cosine = product(text, selected)
+    shared = product(tag_matrix, selected)
+    sizes = numpy.array([len(post_tags) for post_tags in tags], dtype=numpy.float64)
+    union = sizes[selected][:, None] + sizes[None, :] - shared
+    jaccard = numpy.divide(shared, union, out=numpy.zeros_like(shared), where=union > 0)
+    codes = {name: i for i, name in enumerate(sorted({name for name in categories if name}))}
+    category_ids = numpy.array([codes[name] if name else -1 for name in categories])
+    same = (category_ids[selected][:, None] == category_ids[None, :]) & (category_ids[selected][:, None] >= 0)
+
+    blended = TEXT_WEIGHT * cosine + TAG_WEIGHT * jaccard + CATEGORY_WEIGHT * same
+    return blended.tolist()
+
+
+def scores(rows, vectors, tags, categories):
+    compute = _python_scores if numpy is None else _numpy_scores
+    return compute(rows, vectors, tags, categories) if rows else []
+
+
+def top(row_scores, slugs, own, limit=CANDIDATES):
+    """The best [slug, score] matches of one row, itself and zero scores left out"""
+    ranked = [
+        [slugs[column], round(score, PRECISION)]
+        for column, score in enumerate(row_scores)
+        if column != own and round(score, PRECISION) > 0
+    ]
+    ranked.sort(key=lambda match: (-match[1], match[0]))
+    return ranked[:limit]
+
+
+def load_cache(path=CACHE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def update(source=SOURCE_FILE, full=False):
+    """
+    Bring the related posts up to date and write data/blog-related.json.
+
+    Returns {'posts': n, 'scored': rows recomputed, 'full': bool, 'backend':
+    name, 'changed': whether the related file changed, 'idf_posts': posts
+    the IDF was computed from, 'since_full': posts added, edited or removed
+    since then, 'related': {slug: [slugs]}}.
+    """
+    with open(source, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    posts = sorted(blogshards.published_posts(data), key=lambda post: post['slug'])
+    slugs = [post['slug'] for post in posts]
+
+    cache = load_cache()
+    cached = cache.get('posts', {})
+    idf_posts = cache.get('idf_posts', 0)
+    full = full or 'idf' not in cache or abs(len(posts) - idf_posts) > REBUILD_DRIFT * max(idf_posts, 1)
+
+    entries = {}
+    changed = []
+    for post in posts:
+        digest = post_hash(post)
+        entry = cached.get(post['slug'])
+        if entry and entry['hash'] == digest:
+            entries[post['slug']] = entry
+        else:
+            entries[post['slug']] = {'hash': digest, 'counts': term_counts(post)}
+            changed.append(post['slug'])
+    removed = set(cached) - set(entries)
+    since_full = set() if full else set(cache.get('since_full', [])) | set(changed) | removed
+
+    if full:
+        idf = inverse_frequencies({slug: entry['counts'] for slug, entry in entries.items()})
+        idf_posts = len(posts)
+        rows = list(range(len(slugs)))
+    else:
+        idf = cache['idf']
+        position = {slug: i for i, slug in enumerate(slugs)}
+        rows = [position[slug] for slug in changed]
+
+    vectors = [tfidf(entries[slug]['counts'], idf) for slug in slugs]
+    tags = [frozenset(post.get('tag_slugs') or ()) for post in posts]
+    categories = [category(post) for post in posts]
+    row_scores = scores(rows, vectors, tags, categories)
+
+    candidates = {} if full else {slug: cache['candidates'][slug] for slug in slugs if slug in cache.get('candidates', {})}
+    stale = removed | set(changed)
+    for row, values in zip(rows, row_scores):
+        candidates[slugs[row]] = top(values, slugs, row)
+    if not full:
+        # Scores are symmetric: the changed posts' rows hold their new score with every other post
+        for own, slug in enumerate(slugs):
+            if slug in changed:
+                continue
+            matches = [match for match in candidates.get(slug, []) if match[0] not in stale]
+            for row, values in zip(rows, row_scores):
+                score = round(values[own], PRECISION)
+                if score > 0:
+                    matches.append([slugs[row], score])
+            matches.sort(key=lambda match: (-match[1], match[0]))
+            candidates[slug] = matches[:CANDIDATES]
+
+    related = {slug: [match[0] for match in candidates[slug][:TOP_N]] for slug in slugs}
+    body = (json.dumps(related, indent=2) + '\n').encode('utf-8')
+    try:
+        with open(RELATED_FILE, 'rb') as f:
+            unchanged = f.read() == body
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        write_atomic(RELATED_FILE, body)
+
+    if rows or removed or full:
+        cache = {
+            'idf': idf,
+            'idf_posts': idf_posts,
+            'since_full': sorted(since_full),
+            'posts': entries,
+            'candidates': candidates,
+        }
+        write_atomic(CACHE_FILE, json.dumps(cache, separators=(',', ':'), sort_keys=True).encode('utf-8'))
+    return {
+        'posts': len(posts),
+        'scored': len(rows),
+        'full': full,
+        'backend': backend(),
+        'changed': not unchanged,
+        'idf_posts': idf_posts,
+        'since_full': len(since_full),
+        'related': related,
+    }
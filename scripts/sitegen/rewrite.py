@@ -0,0 +1,115 @@
+"""
+Single-pass HTML rewriter for site-wide patches.
+
+Rules register a regex and a replacement callback. For each file the
+patterns of every applicable rule are combined into one alternation, so
+the file is read once, scanned once and written at most once no matter
+how many rules run.
+"""
+
+import os
+import re
+from functools import lru_cache
+
+from . import ROOT, inventory, stats
+from .output import OutputWriter
+
+# Registered rules by name, in registration (= precedence) order
+RULES = {}
+
+
+class Rule:
+    """
+    One rewrite: a regex and a callback returning its replacement.
+
+    replace(match, state) gets a RuleMatch (groups numbered within the
+    rule's own pattern) and a dict of per-file state shared by all rules.
+    skip_if(content) can opt a file out before scanning, e.g. when the
+    edit has already been made.
+    """
+
+    def __init__(self, name, pattern, replace, skip_if=None):
+        self.name = name
+        self.pattern = pattern
+        self.replace = replace
+        self.skip_if = skip_if
+        self.groups = re.compile(pattern).groups
+
+
+class RuleMatch:
+    """A match of the combined scanner, seen through one rule's groups"""
+
+    def __init__(self, match, offset):
+        self.match = match
+        self.offset = offset
+
+    def group(self, index=0):
+        if index == 0:
+            return self.match.group(self.offset)
+        return self.match.group(self.offset + index)
+
+    def start(self):
+        return self.match.start(self.offset)
+
+    def end(self):
+        return self.match.end(self.offset)
+
+
+def register(rule):
+    """Add a rule to the registry"""
+    RULES[rule.name] = rule
+    return rule
+
+
+@lru_cache(maxsize=None)
+def combine(names):
+    """Build one scanner for a tuple of rule names: (regex, [(group offset, rule)])"""
+    parts = []
+    offsets = []
+    offset = 1
+    for name in names:
+        rule = RULES[name]
+        parts.append(f'({rule.pattern})')
+        offsets.append((offset, rule))
+        offset += rule.groups + 1
+    return re.compile('|'.join(parts)), offsets
+
+
+def rewrite(content, names):
+    """Apply the named rules to one document in a single scan"""
+    active = tuple(name for name in names if not (RULES[name].skip_if and RULES[name].skip_if(content)))
+    if not active:
+        return content
+
+    scanner, offsets = combine(active)
+    stats.count('regex_passes')
+    state = {}
+
+    def dispatch(match):
+        for offset, rule in offsets:
+            if match.start(offset) != -1:
+                return rule.replace(RuleMatch(match, offset), state)
+        return match.group(0)
+
+    return scanner.sub(dispatch, content)
+
+
+def rewrite_files(names, paths=None, dry_run=False):
+    """Run the named rules over each file once; return the paths that changed"""
+    writer = OutputWriter(dry_run=dry_run)
+    for path in (paths if paths is not None else inventory.html_files()):
+        filepath = os.path.join(ROOT, path)
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+            new_content = rewrite(content, names)
+            if new_content != content:
+                writer.write(filepath, new_content)
+        except Exception as e:
+            print(f'❌ Error processing {path}: {e}')
+
+    updated = [os.path.relpath(filepath, ROOT) for filepath in writer.flush()]
+    for path in updated:
+        print(f'✅ Updated {path}')
+    return updated
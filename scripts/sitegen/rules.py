@@ -0,0 +1,86 @@
+"""
+Site-wide rewrite rules (navigation items, scroll animation classes).
+"""
+
+import re
+
+from .rewrite import Rule, register
+
+NAV_INDENT = '\n                    '
+
+# Cards that fade in on scroll, and the stagger classes script.js animates
+CARD_CLASSES = {'service-topic-card', 'sector-card', 'service-pillar-card'}
+STAGGER_CLASS = re.compile(r'stagger-\d+')
+
+
+def _nav_item(href, label):
+    return f'<li class="nav-item"><a href="{href}" class="nav-link">{label}</a></li>'
+
+
+def _insert_structures(match, state):
+    """Add Structures after the Sectors nav item"""
+    return match.group(0) + NAV_INDENT + _nav_item('/structures', 'Structures')
+
+
+def _insert_tools(match, state):
+    """Add Tools after the Insights nav item, wrapping Insights in an <li> if needed"""
+    insights = match.group(0) if match.group(1) else f'<li class="nav-item">{match.group(0)}</li>'
+    return insights + NAV_INDENT + _nav_item('/tools', 'Tools')
+
+
+def _animate_card(match, state):
+    """
+    Give a card scroll-fade-in and its stagger-1..6 class.
+
+    Cards of each type are numbered in document order, restarting at each
+    <section> so every grid staggers from 1. Existing animation classes are
+    replaced by the expected ones, so the output is the same however many
+    times the rule runs.
+    """
+    counts = state.setdefault('cards', {})
+    if match.group(1):
+        counts.clear()
+        return match.group(0)
+
+    classes = match.group(3).split()
+    card = next((name for name in classes if name in CARD_CLASSES), None)
+    if card is None:
+        return match.group(0)
+
+    index = counts.get(card, 0)
+    counts[card] = index + 1
+    expected = ['scroll-fade-in', f'stagger-{(index % 6) + 1}']
+
+    kept = [name for name in classes if name != 'scroll-fade-in' and not STAGGER_CLASS.fullmatch(name)]
+    if kept + expected == classes:
+        return match.group(0)
+    return f'{match.group(2)}{" ".join(kept + expected)}{match.group(4)}'
+
+
+register(Rule(
+    'structures-nav',
+    r'(?:<li class="nav-item">)?<a href="/sectors" class="nav-link">Sectors</a>(?:</li>)?',
+    _insert_structures,
+    skip_if=lambda content: 'href="/structures"' in content,
+))
+
+register(Rule(
+    'tools-nav',
+    r'(<li class="nav-item">)?<a href="/blog" class="nav-link">Insights</a>(?:</li>)?',
+    _insert_tools,
+    skip_if=lambda content: '/tools' in content and 'nav-link' in content,
+))
+
+# One scan over section starts and every <div>/<a> class attribute that mentions a card
+register(Rule(
+    'scroll-animations',
+    r'(<section\b)|(<(?:div|a)\b[^>]*?\sclass=")([^"]*card[^"]*)(")',
+    _animate_card,
+))
+
+# Rule groups run by the add-*.py scripts
+GROUPS = {
+    'structures-nav': ['structures-nav'],
+    'tools-nav': ['tools-nav'],
+    'scroll-animations': ['scroll-animations'],
+}
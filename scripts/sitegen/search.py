@@ -0,0 +1,368 @@
+"""
+Full-text search index for the blog.
+
+Each published post's title, excerpt and HTML-stripped content are split
+into lower-case words. Stop words are dropped, though they still take up a
+position so phrases keep their spacing. The remaining words are reduced
+with the first and last steps of the Porter stemmer. blog-search.js repeats
+the same tokenizer and stemmer in the browser, so queries meet the index on
+equal terms.
+
+The inverted index maps every stem to its postings. Each posting is
+[doc, first position, gap, gap, ...]: the term frequency is the number of
+positions, and the positions drive phrase queries. Postings are sharded by
+the stem's first PREFIX_LENGTH characters into dist/data/search/:
+
+    index.json                    documents (slug, field boundaries, length),
+                                  ranking settings, stop words and the
+                                  {prefix: hash} of every shard
+    terms/<prefix>.<hash>.json    {stem: [posting, ...]} for one prefix
+
+so a query fetches index.json plus one small shard per distinct prefix.
+Shards are content-hashed like the blog shards (see blogshards).
+
+Ranking is BM25 over the combined fields, with title and excerpt
+occurrences weighted up. Results are scaled by the share of query terms a
+post contains, and "quoted phrases" must appear verbatim. query() runs the
+same ranking locally for tuning and latency checks.
+"""
+
+import html as html_lib
+import json
+import math
+import os
+import re
+import time
+import unicodedata
+
+from . import blogshards
+from .compress import DIST_DIR
+from .manifest import hash_bytes
+
+SOURCE_FILE = blogshards.SOURCE_FILE
+
+# Under dist/; served as /data/search/
+INDEX_DIR = os.path.join('data', 'search')
+INDEX_URL = '/data/search'
+
+PREFIX_LENGTH = 2
+
+# Words longer than this are markup or URL debris rather than search terms
+MAX_WORD_LENGTH = 30
+
+# BM25 settings and per-field weights (title, excerpt, content)
+K1 = 1.2
+B = 0.75
+FIELD_WEIGHTS = (3.0, 2.0, 1.0)
+
+STOP_WORDS = frozenset('''
+a about above after again against all am an and any are as at be because been before being below between both
+but by can could did do does doing down during each few for from further had has have having he her here hers
+herself him himself his how i if in into is it its itself just me more most my myself no nor not now of off on
+once only or other our ours ourselves out over own same she should so some such than that the their theirs them
+themselves then there these they this those through to too under until up very was we were what when where which
+while who whom why will with would you your yours yourself yourselves
+'''.split())
+
+RAW_ELEMENT = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+TAG = re.compile(r'<[^>]+>')
+APOSTROPHE = re.compile(r"(?<=\w)['’](?=\w)")
+WORD = re.compile(r'[a-z0-9]+')
+PHRASE = re.compile(r'"([^"]*)"')
+
+
+def plain_text(markup):
+    """Text of an HTML fragment, with tags turned into word breaks"""
+    return html_lib.unescape(TAG.sub(' ', RAW_ELEMENT.sub(' ', markup or '')))
+
+
+def words(text):
+    """Lower-case ASCII words, accents folded and apostrophes dropped ("HMRC's" -> "hmrcs")"""
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return WORD.findall(APOSTROPHE.sub('', text))
+
+
+# Porter stemmer, steps 1a-1c and 5 (plurals, -ed/-ing, -y, trailing e/ll)
+
+def _consonant(word, i):
+    if word[i] in 'aeiou':
+        return False
+    if word[i] == 'y':
+        return i == 0 or not _consonant(word, i - 1)
+    return True
+
+
+def _measure(stem):
+    """Porter's m: the number of vowel-consonant sequences"""
+    pattern = ''.join('c' if _consonant(stem, i) else 'v' for i in range(len(stem)))
+    return re.sub(r'(.)\1+', r'\1', pattern).count('vc')
+
+
+def _has_vowel(stem):
+    return any(not _consonant(stem, i) for i in range(len(stem)))
+
+
+def _double_consonant(word):
+    return len(word) >= 2 and word[-1] == word[-2] and _consonant(word, len(word) - 1)
+
+
+def _cvc(word):
+    return (
+        len(word) >= 3 and _consonant(word, len(word) - 3) and not _consonant(word, len(word) - 2)
+        and _consonant(word, len(word) - 1) and word[-1] not in 'wxy'
+    )
+
+
+def stem(word):
+    """Porter steps 1a, 1b, 1c, 5a and 5b; short and numeric words are left alone"""
+    if len(word) <= 2 or not word.isalpha():
+        return word
+
+    if word.endswith('sses') or word.endswith('ies'):
+        word = word[:-2]
+    elif word.endswith('s') and not word.endswith('ss'):
+        word = word[:-1]
+
+    if word.endswith('eed'):
+        if _measure(word[:-3]) > 0:
+            word = word[:-1]
+    else:
+        for suffix in ('ed', 'ing'):
+            if word.endswith(suffix) and _has_vowel(word[:-len(suffix)]):
+                word = word[:-len(suffix)]
+                if word.endswith(('at', 'bl', 'iz')):
+                    word += 'e'
+                elif _double_consonant(word) and word[-1] not in 'lsz':
+                    word = word[:-1]
+                elif _measure(word) == 1 and _cvc(word):
+                    word += 'e'
+                break
+
+    if word.endswith('y') and _has_vowel(word[:-1]):
+        word = word[:-1] + 'i'
+
+    if word.endswith('e'):
+        measure = _measure(word[:-1])
+        if measure > 1 or (measure == 1 and not _cvc(word[:-1])):
+            word = word[:-1]
+    if word.endswith('ll') and _measure(word) > 1:
+        word = word[:-1]
+    return word
+
+
+def terms(text, start=0):
+    """
+    (position, stem) pairs of the indexable words in text, numbered from
+    start, and the position after the last word. Stop words are skipped but
+    still numbered.
+    """
+    found = []
+    position = start
+    for word in words(text):
+        if word not in STOP_WORDS and len(word) <= MAX_WORD_LENGTH:
+            found.append((position, stem(word)))
+        position += 1
+    return found, position
+
+
+def document_terms(post):
+    """
+    A post's (position, stem) pairs across its fields, plus where the title
+    and excerpt end. Each field starts one position past the last so phrases
+    never run across fields.
+    """
+    title, title_end = terms(html_lib.unescape(post['title']))
+    excerpt, excerpt_end = terms(plain_text(post.get('excerpt')), title_end + 1)
+    content, end = terms(plain_text(post.get('content')), excerpt_end + 1)
+    return title + excerpt + content, title_end, excerpt_end, end
+
+
+def prefix(term):
+    return term[:PREFIX_LENGTH]
+
+
+def shard_path(key, body):
+    """terms/<prefix>.<hash>.json, relative to the index directory"""
+    return f'terms/{blogshards.hashed_name(key, body)}'
+
+
+def build(data):
+    """
+    The search index for a blog-posts.json document as {relative path:
+    bytes}: index.json plus one shard per term prefix.
+    """
+    documents = []
+    postings = {}
+    for doc, post in enumerate(blogshards.published_posts(data)):
+        found, title_end, excerpt_end, end = document_terms(post)
+        documents.append([post['slug'], title_end, excerpt_end, len(found)])
+        positions = {}
+        for position, term in found:
+            positions.setdefault(term, []).append(position)
+        for term, places in positions.items():
+            gaps = [places[0]] + [b - a for a, b in zip(places, places[1:])]
+            postings.setdefault(term, []).append([doc] + gaps)
+
+    shards = {}
+    for term in sorted(postings):
+        shards.setdefault(prefix(term), {})[term] = postings[term]
+
+    files = {}
+    hashes = {}
+    for key, shard in shards.items():
+        body = blogshards.encode(shard)
+        files[shard_path(key, body)] = body
+        hashes[key] = hash_bytes(body)[:blogshards.HASH_LENGTH]
+
+    lengths = [document[3] for document in documents]
+    index = {
+        'documents': documents,
+        'average_length': sum(lengths) / len(lengths) if lengths else 0,
+        'k1': K1,
+        'b': B,
+        'field_weights': FIELD_WEIGHTS,
+        'prefix_length': PREFIX_LENGTH,
+        'max_word_length': MAX_WORD_LENGTH,
+        'stop_words': sorted(STOP_WORDS),
+        'shards': hashes,
+    }
+    files['index.json'] = blogshards.encode(index)
+    return files
+
+
+def write_index(source=SOURCE_FILE, dist=DIST_DIR):
+    """
+    Build the index from the blog data and write it under dist/data/search/.
+
+    Returns {'documents': n, 'terms': n, 'shards': n, 'written': [...],
+    'unchanged': n, 'removed': n, 'index_bytes': n, 'shard_bytes': total,
+    'largest_shard': (prefix, bytes)}.
+    """
+    with open(source, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    files = build(data)
+    written, unchanged, removed = blogshards.write(files, os.path.join(dist, INDEX_DIR))
+    shards = {rel: body for rel, body in files.items() if rel != 'index.json'}
+    largest = max(shards, key=lambda rel: len(shards[rel]), default=None)
+    index = json.loads(files['index.json'])
+    return {
+        'documents': len(index['documents']),
+        'terms': sum(len(json.loads(body)) for body in shards.values()),
+        'shards': len(shards),
+        'written': written,
+        'unchanged': len(unchanged),
+        'removed': removed,
+        'index_bytes': len(files['index.json']),
+        'shard_bytes': sum(len(body) for body in shards.values()),
+        'largest_shard': (largest.split('/')[1].split('.')[0], len(shards[largest])) if largest else None,
+    }
+
+
+def parse_query(text):
+    """
+    (terms, phrases) of a query: every distinct stem, and each quoted
+    phrase as [(offset, stem), ...] relative to its first word.
+    """
+    phrases = []
+    for match in PHRASE.finditer(text):
+        found, _ = terms(match.group(1))
+        if len(found) > 1:
+            phrases.append([(position - found[0][0], term) for position, term in found])
+    found, _ = terms(PHRASE.sub(' ', text).replace('"', ' '))
+    unique = list(dict.fromkeys([term for _, term in found] + [term for phrase in phrases for _, term in phrase]))
+    return unique, phrases
+
+
+def _positions(posting):
+    """Absolute positions of a [doc, first, gap, ...] posting"""
+    positions = []
+    total = 0
+    for gap in posting[1:]:
+        total += gap
+        positions.append(total)
+    return positions
+
+
+def load_index(root):
+    with open(os.path.join(root, 'index.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _shard(root, index, key, cache):
+    if key not in cache:
+        digest = index['shards'].get(key)
+        if digest is None:
+            cache[key] = {}
+        else:
+            with open(os.path.join(root, 'terms', f'{key}.{digest}.json'), 'r', encoding='utf-8') as f:
+                cache[key] = json.load(f)
+    return cache[key]
+
+
+def rank(index, query_terms, phrases, postings, limit=10):
+    """
+    [(score, doc)] of the best matches, best first. postings maps each query
+    term to its posting list (empty when the term is not indexed).
+    """
+    documents = index['documents']
+    count = len(documents)
+    k1, b, average = index['k1'], index['b'], index['average_length'] or 1
+    title_weight, excerpt_weight, content_weight = index['field_weights']
+
+    scores = {}
+    matched = {}
+    positions = {}
+    for term in query_terms:
+        term_postings = postings.get(term, [])
+        if not term_postings:
+            continue
+        idf = math.log(1 + (count - len(term_postings) + 0.5) / (len(term_postings) + 0.5))
+        for posting in term_postings:
+            doc = posting[0]
+            _, title_end, excerpt_end, length = documents[doc]
+            places = _positions(posting)
+            positions[(term, doc)] = places
+            weighted = sum(
+                title_weight if place < title_end else excerpt_weight if place < excerpt_end else content_weight
+                for place in places
+            )
+            norm = k1 * (1 - b + b * length / average)
+            scores[doc] = scores.get(doc, 0) + idf * weighted * (k1 + 1) / (weighted + norm)
+            matched[doc] = matched.get(doc, 0) + 1
+
+    def has_phrase(doc, phrase):
+        (_, first), rest = phrase[0], phrase[1:]
+        following = [(offset, set(positions.get((term, doc), ()))) for offset, term in rest]
+        return any(
+            all(start + offset in places for offset, places in following)
+            for start in positions.get((first, doc), ())
+        )
+
+    results = [
+        (score * matched[doc] / len(query_terms), doc)
+        for doc, score in scores.items()
+        if all(has_phrase(doc, phrase) for phrase in phrases)
+    ]
+    results.sort(key=lambda result: (-result[0], result[1]))
+    return results[:limit]
+
+
+def query(text, root=None, limit=10, index=None, cache=None):
+    """
+    Search a written index locally. root defaults to dist/data/search; pass
+    the same index and cache dicts across calls to time warm queries.
+
+    Returns {'results': [(slug, score)], 'terms': [...], 'shards':
+    shard prefixes read, 'seconds': elapsed}.
+    """
+    start = time.perf_counter()
+    root = root or os.path.join(DIST_DIR, INDEX_DIR)
+    index = index if index is not None else load_index(root)
+    cache = cache if cache is not None else {}
+    query_terms, phrases = parse_query(text)
+    keys = sorted({prefix(term) for term in query_terms})
+    postings = {term: _shard(root, index, prefix(term), cache).get(term, []) for term in query_terms}
+    ranked = rank(index, query_terms, phrases, postings, limit) if query_terms else []
+    results = [(index['documents'][doc][0], score) for score, doc in ranked]
+    return {'results': results, 'terms': query_terms, 'shards': keys, 'seconds': time.perf_counter() - start}
@@ -0,0 +1,98 @@
+"""
+Sector pages derived from the Construction sector page
+"""
+
+import re
+
+from . import content, layout
+from .template import CompiledTemplate, between, element, literal, pattern
+
+NAME = 'sectors'
+TEMPLATE = 'sectors-construction.html'
+
+CONSTRUCTION_INTRO = 'The construction industry faces unique accounting challenges, from CIS compliance and subcontractor management to seasonal cashflow and complex VAT rules. We provide specialist support that understands the realities of construction work, helping contractors and construction businesses stay compliant while maximising profitability.'
+
+# One data/content/sectors/<sector>.json per page
+SCHEMA = {
+    'filename': str,
+    'title': str,
+    'intro': str,
+    'challenges': [{'title': str, 'description': str}],
+    'help_items': [{'title': str, 'description': str}],
+    'services': [{'link': str, 'title': str, 'description': str}],
+    'cta_title': str,
+    'cta_text': str,
+}
+
+
+def load():
+    """Return the sector page records"""
+    return content.load_family(NAME, SCHEMA)
+
+
+def output_path(sector_data):
+    """Path of the generated page, relative to the site root"""
+    return sector_data['filename']
+
+
+def compile_template(template):
+    """Split the Construction page into literals and the slots each sector fills"""
+    return CompiledTemplate.compile(template, {
+        'title': between('<title>', '</title>'),
+        'header': element('<header class="site-header">'),
+        'heading': literal('<h1>Construction</h1>'),
+        'intro': literal(CONSTRUCTION_INTRO),
+        'challenges': pattern(r'<h2>Common Challenges</h2>.*?</ul>', re.DOTALL),
+        'help': pattern(r'<h2>How Black and White Accounting Helps</h2>.*?</div>\s*</div>', re.DOTALL),
+        'services': pattern(r'<h2>Relevant Services</h2>.*?</div>\s*</div>', re.DOTALL),
+        'cta_title': literal('Ready to get specialist support for Construction?'),
+        'cta_text': literal("Let's discuss how we can help your construction business with tailored accounting and tax advice."),
+        'footer': element('<footer class="site-footer">'),
+    })
+
+
+def render(sector_data, template):
+    """Generate a sector page from the compiled template and data"""
+    # Challenges
+    challenges_html = '<h2>Common Challenges</h2>\n                    <ul class="challenges-list">'
+    for challenge in sector_data['challenges']:
+        challenges_html += f'''
+                        <li>
+                            <strong>{challenge["title"]}</strong>
+                            <p>{challenge["description"]}</p>
+                        </li>'''
+    challenges_html += '\n                    </ul>'
+
+    # Help items
+    help_html = '<h2>How Black and White Accounting Helps</h2>\n                    <div class="how-we-help-grid">'
+    for item in sector_data['help_items']:
+        help_html += f'''
+                        <div class="how-we-help-item">
+                            <h3>{item["title"]}</h3>
+                            <p>{item["description"]}</p>
+                        </div>'''
+    help_html += '\n                    </div>'
+
+    # Relevant services
+    services_html = f'<h2>Relevant Services</h2>\n                    <p style="text-align: center; color: var(--text-secondary); margin-bottom: var(--spacing-xl); max-width: 600px; margin-left: auto; margin-right: auto;">Our {sector_data["title"]} clients typically benefit from these services:</p>\n                    <div class="relevant-services-grid">'
+    for service in sector_data['services']:
+        services_html += f'''
+                        <a href="{service["link"]}" class="relevant-service-card">
+                            <h3>{service["title"]}</h3>
+                            <p>{service["description"]}</p>
+                            <span class="btn btn-secondary btn-small">Explore {service["title"].split()[0]}</span>
+                        </a>'''
+    services_html += '\n                    </div>'
+
+    return template.render({
+        'title': f'{sector_data["title"]} - Black and White Accounting',
+        'header': layout.render('header'),
+        'heading': f'<h1>{sector_data["title"]}</h1>',
+        'intro': sector_data['intro'],
+        'challenges': challenges_html,
+        'help': help_html,
+        'services': services_html,
+        'cta_title': sector_data['cta_title'],
+        'cta_text': sector_data['cta_text'],
+        'footer': layout.render('footer'),
+    })
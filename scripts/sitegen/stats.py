@@ -0,0 +1,90 @@
+"""
+Build instrumentation - stage timers, per-page timings and counters.
+
+Counters (bytes read and written, regex passes) are per process: the I/O
+and regex call sites bump them with count(), and render workers hand theirs
+back with each page so the build totals cover the whole pool.
+"""
+
+import cProfile
+import io
+import pstats
+import time
+from contextlib import contextmanager
+
+# Per-process counters, e.g. {'bytes_read': ..., 'bytes_written': ..., 'regex_passes': ...}
+counters = {}
+
+
+def count(name, amount=1):
+    """Add to a counter"""
+    counters[name] = counters.get(name, 0) + amount
+
+
+def take_counters():
+    """Return the counters and reset them"""
+    taken = dict(counters)
+    counters.clear()
+    return taken
+
+
+class BuildStats:
+    """Wall and CPU time per stage and per page, plus the merged counters"""
+
+    def __init__(self):
+        self.stages = {}
+        self.pages = []
+        self.counters = {}
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block as one pipeline stage (repeated stages accumulate)"""
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            totals = self.stages.setdefault(name, [0.0, 0.0])
+            totals[0] += time.perf_counter() - wall
+            totals[1] += time.process_time() - cpu
+
+    def add_page(self, path, wall, cpu, page_counters=None):
+        self.pages.append((path, wall, cpu))
+        self.merge(page_counters or {})
+
+    def merge(self, more):
+        for name, amount in more.items():
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def table(self, top=5):
+        """Summary lines: stage times, the slowest pages and the counters"""
+        slowest = sorted(self.pages, key=lambda page: page[1], reverse=True)[:top]
+        width = max([len(path) for path, _, _ in slowest] + [30]) + 2
+        lines = [f'{"Stage":<{width}} {"wall ms":>9} {"cpu ms":>9}']
+        for name, (wall, cpu) in self.stages.items():
+            lines.append(f'{name:<{width}} {wall * 1000:>9.1f} {cpu * 1000:>9.1f}')
+        if slowest:
+            lines.append(f'{"Slowest pages (render)":<{width}} {"wall ms":>9} {"cpu ms":>9}')
+            for path, wall, cpu in slowest:
+                lines.append(f'{path:<{width}} {wall * 1000:>9.1f} {cpu * 1000:>9.1f}')
+        lines.append(
+            f'Read {self.counters.get("bytes_read", 0) / 1024:.0f} KB, '
+            f'wrote {self.counters.get("bytes_written", 0) / 1024:.0f} KB, '
+            f'{self.counters.get("regex_passes", 0)} regex passes'
+        )
+        return lines
+
+
+@contextmanager
+def profiled(path, top=15):
+    """cProfile the block, dump pstats to path and print the top functions by cumulative time"""
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        profile.dump_stats(path)
+        report = io.StringIO()
+        pstats.Stats(profile, stream=report).sort_stats('cumulative').print_stats(top)
+        print(report.getvalue())
+        print(f'Profile written to {path} (open with python3 -m pstats)')
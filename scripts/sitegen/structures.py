@@ -0,0 +1,170 @@
+"""
+Structure pages for the Structures section.
+"""
+
+import os
+
+from . import content, layout
+
+NAME = 'structures'
+TEMPLATE = None
+
+# One data/content/structures/<slug>.json per page; design picks the grid layout
+SCHEMA = {
+    'slug': str,
+    'title': str,
+    'intro': str,
+    'what_section': {'title': str, 'content': str},
+    'who_section': {'title': str, 'items': [{'title': str, 'desc': str}]},
+    'requirements_section': {'title': str, 'items': [{'title': str, 'desc': str}]},
+    'services_section': {'title': str, 'items': [{'title': str, 'desc': str}]},
+    'design': str,
+}
+
+
+def load():
+    """Return the structure page records"""
+    return content.load_family(NAME, SCHEMA)
+
+
+def output_path(structure):
+    """Path of the generated page, relative to the site root"""
+    return os.path.join('structures', f"structures-{structure['slug']}.html")
+
+
+def render(structure, template=None):
+    """Generate HTML for a structure page."""
+    
+    # Determine grid class based on design
+    grid_class = structure["design"]
+    if grid_class == "grid-2":
+        grid_style = "grid-template-columns: repeat(2, 1fr);"
+    elif grid_class == "grid-3":
+        grid_style = "grid-template-columns: repeat(3, 1fr);"
+    else:
+        grid_style = "grid-template-columns: repeat(2, 1fr);"
+    
+    html = f'''        <!-- Breadcrumb -->
+        <section class="section" style="padding-top: var(--spacing-lg); padding-bottom: var(--spacing-sm);">
+            <div class="section-container">
+                <nav style="font-size: var(--font-size-sm); color: var(--text-secondary);">
+                    <a href="/" style="color: var(--text-secondary); text-decoration: none;">Home</a> / 
+                    <a href="/structures" style="color: var(--text-secondary); text-decoration: none;">Structures</a> / 
+                    <span style="color: var(--text-primary);">{structure["title"]}</span>
+                </nav>
+            </div>
+        </section>
+
+        <!-- Page Header -->
+        <section class="section">
+            <div class="section-container">
+                <div class="service-page-header">
+                    <h1>{structure["title"]}</h1>
+                    <p class="service-page-intro">{structure["intro"]}</p>
+                </div>
+            </div>
+        </section>
+
+        <!-- What Section -->
+        <section class="section-alt">
+            <div class="section-container">
+                <div style="max-width: 800px; margin: 0 auto;">
+                    <h2 style="margin-bottom: var(--spacing-md);">{structure["what_section"]["title"]}</h2>
+                    <p style="font-size: var(--font-size-lg); line-height: 1.7; color: var(--text-secondary); margin-bottom: var(--spacing-lg);">{structure["what_section"]["content"]}</p>
+                </div>
+            </div>
+        </section>
+
+        <!-- Who Section -->
+        <section class="section">
+            <div class="section-container">
+                <h2 style="margin-bottom: var(--spacing-lg); text-align: center;">{structure["who_section"]["title"]}</h2>
+                <p style="text-align: center; color: var(--text-secondary); margin-bottom: var(--spacing-xl); max-width: 600px; margin-left: auto; margin-right: auto;">Understanding who needs this type of support helps ensure you're getting the right advice.</p>
+                
+                <div style="max-width: 1200px; margin: 0 auto;">
+                    <div class="grid" style="{grid_style} gap: var(--spacing-lg);">
+'''
+    
+    for item in structure["who_section"]["items"]:
+        html += f'''                        <div style="background: var(--bg-white); padding: var(--spacing-lg); border-radius: var(--radius-md); box-shadow: var(--shadow-sm);">
+                            <h3 style="font-size: var(--font-size-lg); margin-bottom: var(--spacing-sm); color: var(--text-primary);">{item["title"]}</h3>
+                            <p style="color: var(--text-secondary); line-height: 1.6; margin: 0;">{item["desc"]}</p>
+                        </div>
+'''
+    
+    html += '''                    </div>
+                </div>
+            </div>
+        </section>
+
+        <!-- Requirements Section -->
+        <section class="section-alt-2">
+            <div class="section-container">
+                <div style="max-width: 800px; margin: 0 auto;">
+                    <h2 style="margin-bottom: var(--spacing-lg);">'''
+    html += structure["requirements_section"]["title"]
+    html += '''</h2>
+                    <p style="color: var(--text-secondary); margin-bottom: var(--spacing-xl); font-size: var(--font-size-lg);">Important deadlines and requirements:</p>
+                    
+                    <div style="background: var(--bg-white); padding: var(--spacing-xl); border-radius: var(--radius-lg); box-shadow: var(--shadow-sm);">
+                        <ul style="list-style: none; padding: 0; margin: 0;">
+'''
+    
+    for i, item in enumerate(structure["requirements_section"]["items"]):
+        border_style = "border-bottom: 1px solid rgba(0, 0, 0, 0.06);" if i < len(structure["requirements_section"]["items"]) - 1 else ""
+        html += f'''                            <li style="padding: var(--spacing-md) 0; {border_style}">
+                                <strong style="display: block; margin-bottom: var(--spacing-xs); color: var(--text-primary);">{item["title"]}</strong>
+                                <span style="color: var(--text-secondary);">{item["desc"]}</span>
+                            </li>
+'''
+    
+    html += '''                        </ul>
+                    </div>
+                </div>
+            </div>
+        </section>
+
+        <!-- Services Section -->
+        <section class="section">
+            <div class="section-container">
+                <h2 style="margin-bottom: var(--spacing-lg); text-align: center;">'''
+    html += structure["services_section"]["title"]
+    html += '''</h2>
+                <p style="text-align: center; color: var(--text-secondary); margin-bottom: var(--spacing-xl); max-width: 700px; margin-left: auto; margin-right: auto; font-size: var(--font-size-lg);">Our specialist support includes:</p>
+                
+                <div style="max-width: 1200px; margin: 0 auto;">
+                    <div class="grid" style="''' + grid_style + ''' gap: var(--spacing-lg);">
+'''
+    
+    for item in structure["services_section"]["items"]:
+        html += f'''                        <div style="background: var(--bg-white); padding: var(--spacing-xl); border-radius: var(--radius-lg); box-shadow: var(--shadow-sm);">
+                            <h3 style="font-size: var(--font-size-lg); margin-bottom: var(--spacing-md); color: var(--text-primary); border-bottom: 2px solid rgba(0, 0, 0, 0.08); padding-bottom: var(--spacing-sm);">{item["title"]}</h3>
+                            <p style="color: var(--text-secondary); margin: 0; line-height: 1.6;">{item["desc"]}</p>
+                        </div>
+'''
+    
+    html += '''                    </div>
+                </div>
+            </div>
+        </section>
+
+        <!-- CTA -->
+        '''
+    html += layout.render(
+        'cta-banner',
+        section_class='section-alt',
+        cta_title='Ready to get your accounting sorted?',
+        cta_text="We'll ensure you're compliant and help minimise your tax liability.",
+    )
+    html += '''
+
+        <!-- Back to Structures -->
+        <section class="section">
+            <div class="section-container">
+                <div style="text-align: center; padding: var(--spacing-xl) 0;">
+                    <a href="/structures" class="btn btn-secondary">← Back to Structures</a>
+                </div>
+            </div>
+        </section>'''
+
+    return layout.render_page(f'{structure["title"]} - Black and White Accounting', html)
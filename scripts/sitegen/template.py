@@ -0,0 +1,139 @@
+"""
+Compiled page templates.
+
+A reference page is parsed once into literal segments and named slots.
+Rendering a page is then a single join of the precomputed literals with
+the slot values, instead of a chain of regex passes over the whole page.
+
+Slots are located with the locator helpers below. Each locator returns the
+(start, end) spans of the template it claims; a slot may claim several
+spans (every span is filled with the same value).
+"""
+
+import re
+
+from . import stats
+
+
+def literal(text, after=None):
+    """Every occurrence of an exact string (after an optional anchor string)"""
+    def locate(template):
+        spans = []
+        start = _anchor(template, after)
+        while True:
+            start = template.find(text, start)
+            if start == -1:
+                return spans
+            spans.append((start, start + len(text)))
+            start += len(text)
+    return locate
+
+
+def pattern(regex, flags=0, count=0, after=None):
+    """Matches of a regex - all of them, or the first `count`"""
+    compiled = re.compile(regex, flags)
+
+    def locate(template):
+        stats.count('regex_passes')
+        spans = [match.span() for match in compiled.finditer(template, _anchor(template, after))]
+        return spans[:count] if count else spans
+    return locate
+
+
+def between(start_marker, end_marker, after=None):
+    """The text between two markers (markers themselves are kept)"""
+    def locate(template):
+        start = template.find(start_marker, _anchor(template, after))
+        if start == -1:
+            return []
+        start += len(start_marker)
+        end = template.find(end_marker, start)
+        return [] if end == -1 else [(start, end)]
+    return locate
+
+
+def element(start_marker, after=None):
+    """A whole element, from its opening tag to the matching closing tag"""
+    tag = re.match(r'<([a-zA-Z0-9]+)', start_marker).group(1)
+    tags = re.compile(rf'<(/?){tag}\b[^>]*>')
+
+    def locate(template):
+        start = template.find(start_marker, _anchor(template, after))
+        if start == -1:
+            return []
+        stats.count('regex_passes')
+        depth = 0
+        for match in tags.finditer(template, start):
+            depth += -1 if match.group(1) else 1
+            if depth == 0:
+                return [(start, match.end())]
+        return []
+    return locate
+
+
+# {{ name }} placeholders in partials
+PLACEHOLDER = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+
+def placeholders(template):
+    """Locators for every {{ name }} placeholder in a template, keyed by name"""
+    spans = {}
+    for match in PLACEHOLDER.finditer(template):
+        spans.setdefault(match.group(1), []).append(match.span())
+    return {name: (lambda found: lambda template: found)(found) for name, found in spans.items()}
+
+
+def _anchor(template, after):
+    """Search start position: just past the anchor string, or 0"""
+    if after is None:
+        return 0
+    position = template.find(after)
+    if position == -1:
+        raise ValueError(f'anchor {after!r} not found in template')
+    return position + len(after)
+
+
+class CompiledTemplate:
+    """A template split into literal segments and named slots"""
+
+    def __init__(self, literals, slots):
+        # literals has one more entry than slots: lit0 slot0 lit1 slot1 ... litN
+        self.literals = literals
+        self.slots = slots
+
+    @classmethod
+    def compile(cls, template, locators):
+        """
+        Split a template on the spans claimed by each named locator.
+
+        locators maps slot name -> locator. Every slot must match at least
+        once and slots may not overlap - template drift is an error rather
+        than a silently unchanged page.
+        """
+        spans = []
+        for name, locate in locators.items():
+            found = locate(template)
+            if not found:
+                raise ValueError(f'slot {name!r} not found in template')
+            spans.extend((start, end, name) for start, end in found)
+        spans.sort()
+
+        literals = []
+        slots = []
+        position = 0
+        for start, end, name in spans:
+            if start < position:
+                raise ValueError(f'slot {name!r} overlaps slot {slots[-1]!r}')
+            literals.append(template[position:start])
+            slots.append(name)
+            position = end
+        literals.append(template[position:])
+        return cls(literals, slots)
+
+    def render(self, values):
+        """Join the literals with the slot values"""
+        parts = [self.literals[0]]
+        for name, text in zip(self.slots, self.literals[1:]):
+            parts.append(values[name])
+            parts.append(text)
+        return ''.join(parts)
@@ -0,0 +1,86 @@
+"""
+Topic detail pages for the accounts and tax services.
+"""
+
+from . import content, layout
+
+NAME = 'topics'
+TEMPLATE = None
+
+# One data/content/topics/<topic>.json per page
+SCHEMA = {
+    'filename': str,
+    'title': str,
+    'name': str,
+    'intro': str,
+    'parent_url': str,
+    'parent_name': str,
+    'content': str,
+    'cta_title?': str,
+    'cta_text?': str,
+}
+
+
+def load():
+    """Return the topic page records"""
+    return content.load_family(NAME, SCHEMA)
+
+
+def output_path(topic_data):
+    """Path of the generated page, relative to the site root"""
+    return topic_data['filename']
+
+
+def get_base_template():
+    """Get the main-content template (the layout partials supply the rest)"""
+    return '''        <!-- Breadcrumb -->
+        <section class="section" style="padding-top: var(--spacing-lg); padding-bottom: var(--spacing-sm);">
+            <div class="section-container">
+                <nav style="font-size: var(--font-size-sm); color: var(--text-secondary);">
+                    <a href="/" style="color: var(--text-secondary); text-decoration: none;">Home</a> / 
+                    <a href="{parent_url}" style="color: var(--text-secondary); text-decoration: none;">{parent_name}</a> / 
+                    <span style="color: var(--text-primary);">{topic_name}</span>
+                </nav>
+            </div>
+        </section>
+
+        <!-- Page Header -->
+        <section class="section">
+            <div class="section-container">
+                <div class="service-page-header">
+                    <h1>{topic_name}</h1>
+                    <p class="service-page-intro">{intro}</p>
+                </div>
+            </div>
+        </section>
+{content}
+        <!-- CTA -->
+        {cta}
+
+        <!-- Back to Services -->
+        <section class="section-alt">
+            <div class="section-container">
+                <div style="text-align: center; padding: var(--spacing-xl) 0;">
+                    <a href="{parent_url}" class="btn btn-secondary">← Back to {parent_name}</a>
+                </div>
+            </div>
+        </section>'''
+
+
+def render(topic_data, template=None):
+    """Create a topic page from topic data"""
+    cta = layout.render(
+        'cta-banner',
+        section_class='section',
+        cta_title=topic_data.get('cta_title', f"Ready to get started with {topic_data['name']}?"),
+        cta_text=topic_data.get('cta_text', f"Let us help you with {topic_data['name'].lower()} so you can focus on what matters most."),
+    )
+    content = get_base_template().format(
+        topic_name=topic_data['name'],
+        intro=topic_data['intro'],
+        parent_url=topic_data['parent_url'],
+        parent_name=topic_data['parent_name'],
+        content=topic_data['content'],
+        cta=cta,
+    )
+    return layout.render_page(f"{topic_data['title']} - Black and White Accounting", content)
@@ -0,0 +1,112 @@
+"""
+Watch mode - rebuild the pages affected by each edit.
+
+The watcher polls the inputs of the generated pages (data files, reference
+templates and partials) with os.stat. A burst of changes is coalesced: once
+something changes, it waits until the inputs have been quiet for the
+debounce interval and then runs one incremental build, which rebuilds only
+the pages whose inputs changed. Data files and partials are served from
+in-process caches, so a rebuild after a one-field edit reparses one file.
+"""
+
+import os
+import time
+
+from . import ROOT, content, layout
+from .pipeline import FAMILIES, build
+
+# Rebuilds slower than this (from the edit being saved) are flagged
+TARGET_MS = 200
+
+
+def watched_files(names):
+    """Every input file of the named families that exists right now"""
+    paths = []
+    for name in names:
+        family = FAMILIES[name]
+        paths.extend(content.record_paths(name))
+        paths.extend(os.path.join(ROOT, data_file) for data_file in getattr(family, 'DATA_FILES', ()))
+        if family.TEMPLATE:
+            paths.append(os.path.join(ROOT, family.TEMPLATE))
+    if os.path.isdir(layout.PARTIALS_DIR):
+        paths.extend(
+            os.path.join(layout.PARTIALS_DIR, name)
+            for name in sorted(os.listdir(layout.PARTIALS_DIR)) if name.endswith('.html')
+        )
+    return paths
+
+
+def snapshot(names):
+    """{path: (mtime_ns, size)} of the watched files"""
+    stats = {}
+    for path in watched_files(names):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        stats[path] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+def changed_paths(before, after):
+    """Paths added, removed or modified between two snapshots"""
+    return sorted(path for path in before.keys() | after.keys() if before.get(path) != after.get(path))
+
+
+def wait_for_changes(names, previous, interval, debounce):
+    """Block until the watched files change and then stay quiet for `debounce` seconds"""
+    while True:
+        time.sleep(interval)
+        current = snapshot(names)
+        if current != previous:
+            break
+    while True:
+        time.sleep(debounce)
+        latest = snapshot(names)
+        if latest == current:
+            return current
+        current = latest
+
+
+def rebuild(names, changed, jobs, minify=False):
+    """One incremental build after `changed` files were edited; returns the build summary"""
+    if any(os.path.dirname(path) == layout.PARTIALS_DIR for path in changed):
+        layout.clear_cache()
+    return build(names, jobs=jobs, minify=minify)
+
+
+def watch(names=None, jobs=1, interval=0.05, debounce=0.05, minify=False):
+    """
+    Build, then rebuild on every change until interrupted.
+
+    Rebuilds render in-process by default (jobs=1): starting a worker pool
+    costs more than rendering the handful of pages a typical edit touches.
+    """
+    names = names or list(FAMILIES)
+    summary = build(names, jobs=jobs, minify=minify)
+    print(f'✅ Built {len(summary["built"])} pages, {len(summary["skipped"])} up to date')
+    previous = snapshot(names)
+    print(f'👀 Watching {len(previous)} files (Ctrl+C to stop)')
+
+    try:
+        while True:
+            current = wait_for_changes(names, previous, interval, debounce)
+            changed = changed_paths(previous, current)
+            previous = current
+            # Latency is measured from the newest edit hitting the disk
+            edited = max((current[path][0] for path in changed if path in current), default=time.time_ns())
+            start = time.perf_counter()
+            try:
+                summary = rebuild(names, changed, jobs, minify)
+            except Exception as e:
+                print(f'❌ Rebuild failed: {e}')
+                continue
+            build_ms = (time.perf_counter() - start) * 1000
+            latency_ms = (time.time_ns() - edited) / 1e6
+
+            files = ', '.join(os.path.relpath(path, ROOT) for path in changed)
+            flag = '✅' if latency_ms < TARGET_MS else '⚠️'
+            print(f'{flag} {files}: rebuilt {len(summary["built"])} pages in {build_ms:.0f} ms '
+                  f'({latency_ms:.0f} ms after the edit)')
+    except KeyboardInterrupt:
+        print('\nStopped watching')
@@ -0,0 +1,317 @@
+"""
+Streaming WordPress (WXR) import.
+
+scripts/import-wordpress-xml.js parses the whole export into one object tree
+before converting it, so its memory grows with the export. Full-site exports
+carry every attachment, revision and page too, and get large. This reads the
+file with ElementTree.iterparse instead: each top-level element of <channel>
+is handled as soon as it closes, then cleared and detached, so only one
+<item> is in memory at a time.
+
+It takes two passes. Attachments can come after the posts that use them as
+featured images, so the first pass keeps just each attachment's URL and alt
+text, plus the category and tag names. The second converts the posts, in
+file order, into blog-posts.json records (the same fields as the Node
+importer), which write() streams to disk one at a time.
+
+Exports cut short (WordPress dying mid-export leaves an error page in the
+last item) are read up to the break and the parse error is reported. The
+item being read at the break is kept with the fields that came through.
+
+Image URLs are left as exported; downloading them into data/wp-media-cache/
+is still the Node importer's job.
+"""
+
+import json
+import math
+import os
+import re
+import tempfile
+import time
+import xml.etree.ElementTree as ElementTree
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from . import ROOT
+
+EXPORT_FILE = os.path.join(ROOT, 'data', 'blackandwhiteaccounting.WordPress.2026-01-07.xml')
+
+NAMESPACES = {
+    'wp': 'http://wordpress.org/export/1.2/',
+    'content': 'http://purl.org/rss/1.0/modules/content/',
+    'excerpt': 'http://wordpress.org/export/1.2/excerpt/',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+}
+
+# Depth of <channel>; its children are the items and terms
+CHANNEL_DEPTH = 2
+
+STATUSES = {'publish': 'published', 'draft': 'draft', 'future': 'scheduled', 'private': 'draft'}
+
+EXCERPT_LENGTH = 200
+WORDS_PER_MINUTE = 200
+
+# What the Node importer assumes for a post with no content
+DEFAULT_READING_TIME = 5
+
+EMPTY_DATE = '0000-00-00 00:00:00'
+
+# Zone of the export's local (non-GMT) dates
+SITE_TIMEZONE = ZoneInfo('Europe/London')
+
+TAG = re.compile(r'<[^>]*>')
+SLUG_JUNK = re.compile(r'[^\w\s-]', re.ASCII)
+SLUG_SEPARATORS = re.compile(r'[\s_-]+')
+
+
+def qualified(name):
+    """'wp:post_id' -> '{http://wordpress.org/export/1.2/}post_id'"""
+    prefix, _, local = name.rpartition(':')
+    return f'{{{NAMESPACES[prefix]}}}{local}' if prefix else name
+
+
+def child_text(element, name):
+    found = element.find(qualified(name))
+    return (found.text or '').strip() if found is not None else ''
+
+
+def postmeta(item):
+    """{meta_key: meta_value} of an item"""
+    meta = {}
+    for entry in item.iterfind(qualified('wp:postmeta')):
+        key = child_text(entry, 'wp:meta_key')
+        if key:
+            meta[key] = child_text(entry, 'wp:meta_value')
+    return meta
+
+
+def channel_elements(path, errors=None):
+    """
+    Yield the children of <channel> (<item>, <wp:category>, ...) as each one
+    closes. Once the caller moves on it is cleared and detached, so the tree
+    never holds more than the element being handled.
+
+    A malformed or truncated file ends the stream at the break, after the
+    partly read element (if any); the parse error is appended to errors when
+    a list is given.
+    """
+    depth = 0
+    channel = None
+    current = None
+    events = ElementTree.iterparse(path, events=('start', 'end'))
+    while True:
+        try:
+            event, element = next(events)
+        except StopIteration:
+            return
+        except ElementTree.ParseError as error:
+            if errors is not None:
+                errors.append(str(error))
+            if depth > CHANNEL_DEPTH and current is not None:
+                yield current
+            return
+        if event == 'start':
+            depth += 1
+            if depth == CHANNEL_DEPTH:
+                channel = element
+            elif depth == CHANNEL_DEPTH + 1:
+                current = element
+            continue
+        depth -= 1
+        if depth == CHANNEL_DEPTH:
+            yield element
+            element.clear()
+            channel.remove(element)
+            current = None
+
+
+def iso_date(value, zone=timezone.utc):
+    """'2021-03-27 17:57:52' in zone -> '2021-03-27T17:57:52.000Z' (None for WordPress's empty date)"""
+    if not value or value == EMPTY_DATE:
+        return None
+    try:
+        parsed = datetime.strptime(value, '%Y-%m-%d %H:%M:%S').replace(tzinfo=zone)
+    except ValueError:
+        return None
+    return parsed.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+def timestamp():
+    """The current time as an ISO string, like JavaScript's toISOString()"""
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def item_date(item, name):
+    """An item's GMT date field, falling back to its local one, or now"""
+    return iso_date(child_text(item, f'{name}_gmt')) or iso_date(child_text(item, name), SITE_TIMEZONE) or timestamp()
+
+
+def slugify(title):
+    slug = SLUG_SEPARATORS.sub('-', SLUG_JUNK.sub('', title.lower().strip()))
+    return slug.strip('-')
+
+
+def excerpt(content, limit=EXCERPT_LENGTH):
+    """The content's text, cut at the last space before limit characters"""
+    text = ' '.join(TAG.sub(' ', content).split())
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    space = cut.rfind(' ')
+    return (cut[:space] if space > 0 else cut) + '...'
+
+
+def reading_time(content):
+    if not content:
+        return DEFAULT_READING_TIME
+    return max(1, math.ceil(len(TAG.sub(' ', content).split()) / WORDS_PER_MINUTE))
+
+
+def item_terms(item):
+    """(domain, slug, name) for each <category> of an item"""
+    for element in item.iterfind('category'):
+        slug = element.get('nicename')
+        if slug:
+            yield element.get('domain'), slug, (element.text or '').strip()
+
+
+def scan(path=EXPORT_FILE):
+    """
+    First pass: the attachments and taxonomy.
+
+    Returns {'attachments': {id: (url, alt)}, 'categories': {slug: name},
+    'tags': {slug: name}, 'items': n, 'error': parse error or None}.
+    """
+    attachments = {}
+    terms = {'category': {}, 'post_tag': {}}
+    items = 0
+    errors = []
+    for element in channel_elements(path, errors):
+        if element.tag == qualified('wp:category'):
+            slug = child_text(element, 'wp:category_nicename')
+            if slug:
+                terms['category'][slug] = child_text(element, 'wp:cat_name') or slug
+        elif element.tag == qualified('wp:tag'):
+            slug = child_text(element, 'wp:tag_slug')
+            if slug:
+                terms['post_tag'][slug] = child_text(element, 'wp:tag_name') or slug
+        elif element.tag == 'item':
+            items += 1
+            if child_text(element, 'wp:post_type') == 'attachment':
+                url = child_text(element, 'wp:attachment_url')
+                if url:
+                    alt = postmeta(element).get('_wp_attachment_image_alt') or None
+                    attachments[child_text(element, 'wp:post_id')] = (url, alt)
+            for domain, slug, name in item_terms(element):
+                if domain in terms and name:
+                    terms[domain][slug] = name
+    return {
+        'attachments': attachments,
+        'categories': terms['category'],
+        'tags': terms['post_tag'],
+        'items': items,
+        'error': errors[0] if errors else None,
+    }
+
+
+def post_record(item, attachments):
+    """The blog-posts.json record for a post <item>"""
+    title = child_text(item, 'title') or 'Untitled'
+    content = child_text(item, 'content:encoded')
+    wp_status = child_text(item, 'wp:status') or 'draft'
+    created = item_date(item, 'wp:post_date')
+    meta = postmeta(item)
+    featured = attachments.get(meta.get('_thumbnail_id'), (None, None))
+    categories = [slug for domain, slug, _ in item_terms(item) if domain == 'category']
+    return {
+        'legacy_wp_id': child_text(item, 'wp:post_id'),
+        'legacy_wp_url': child_text(item, 'link'),
+        'title': title,
+        'slug': child_text(item, 'wp:post_name') or slugify(title),
+        'excerpt': child_text(item, 'excerpt:encoded') or excerpt(content),
+        'content': content,
+        'status': STATUSES.get(wp_status, 'draft'),
+        'published_at': created if wp_status in ('publish', 'future') else None,
+        'created_at': created,
+        'updated_at': item_date(item, 'wp:post_modified'),
+        'author_name': child_text(item, 'dc:creator'),
+        'category_slug': categories[0] if categories else None,
+        'tag_slugs': [slug for domain, slug, _ in item_terms(item) if domain == 'post_tag'],
+        'featured_image_url': featured[0],
+        'featured_image_alt': featured[1],
+        'meta_title': meta.get('_yoast_wpseo_title') or meta.get('rank_math_title') or None,
+        'meta_description': meta.get('_yoast_wpseo_metadesc') or meta.get('rank_math_description') or None,
+        'reading_time_minutes': reading_time(content),
+    }
+
+
+def posts(path, attachments):
+    """Second pass: yield the record of every post, in file order"""
+    for element in channel_elements(path):
+        if element.tag == 'item' and child_text(element, 'wp:post_type') == 'post':
+            yield post_record(element, attachments)
+
+
+def _indented(value, prefix):
+    return json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n' + prefix)
+
+
+def write(path, records, categories, tags):
+    """
+    Stream {'posts': [...], 'categories': [...], 'tags': [...]} to path, one
+    record at a time, through a temp file renamed over it. Laid out like
+    JSON.stringify(data, null, 2). Returns the number of posts written.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(path))
+    count = 0
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write('{\n  "posts": [')
+            for record in records:
+                f.write((',\n    ' if count else '\n    ') + _indented(record, '    '))
+                count += 1
+            f.write('\n  ]' if count else ']')
+            f.write(',\n  "categories": ' + _indented(categories, '  '))
+            f.write(',\n  "tags": ' + _indented(tags, '  ') + '\n}')
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return count
+
+
+def terms_list(terms):
+    return [{'slug': slug, 'name': name} for slug, name in terms.items()]
+
+
+def import_export(path=EXPORT_FILE, output=None):
+    """
+    Convert a WXR export, writing the records to output (or just counting
+    them when output is None).
+
+    Returns {'items': n, 'posts': n, 'attachments': n, 'categories': n,
+    'tags': n, 'error': parse error or None, 'bytes': export size,
+    'scan_seconds': s, 'seconds': total}.
+    """
+    start = time.perf_counter()
+    found = scan(path)
+    scanned = time.perf_counter()
+    records = posts(path, found['attachments'])
+    if output:
+        count = write(output, records, terms_list(found['categories']), terms_list(found['tags']))
+    else:
+        count = sum(1 for _ in records)
+    return {
+        'items': found['items'],
+        'posts': count,
+        'attachments': len(found['attachments']),
+        'categories': len(found['categories']),
+        'tags': len(found['tags']),
+        'error': found['error'],
+        'bytes': os.path.getsize(path),
+        'scan_seconds': scanned - start,
+        'seconds': time.perf_counter() - start,
+    }
@@ -0,0 +1,65 @@
+"""
+Inline styles the minifier turns into utility classes, on a throwaway site root.
+
+Run from the project root: python3 -m pytest scripts/tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sitegen import minify
+
+PAGE = '''<html><head><link rel="stylesheet" href="/styles.css"></head><body>
+<div class="banner"><h2 style="margin-bottom: 1rem; color: red">One</h2></div>
+<h2 style="margin-bottom: 1rem; color: red">Two</h2>
+<p class="note" style="color: blue">Three</p>
+<p class="note" style="color: blue">Four</p>
+</body></html>'''
+
+
+class UtilityClassTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        patcher = mock.patch.object(minify, 'ROOT', self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def stylesheet(self, text):
+        with open(os.path.join(self.root, 'styles.css'), 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_repeated_styles_become_classes(self):
+        self.stylesheet('.note { font-weight: bold; }\n')
+        small = minify.minify(PAGE)
+        self.assertNotIn('style="', small.partition('</head>')[2])
+
+    def test_more_specific_rule_keeps_style_inline(self):
+        self.stylesheet('.banner h2 { margin: 0; }\n')
+        small = minify.minify(PAGE)
+        self.assertEqual(small.count('style="margin-bottom: 1rem; color: red"'), 2)
+        self.assertNotIn('style="color: blue"', small)
+
+    def test_rule_on_other_properties_allows_class(self):
+        self.stylesheet('.banner h2 { font-size: 2rem; }\n')
+        small = minify.minify(PAGE)
+        self.assertNotIn('style="margin-bottom: 1rem; color: red"', small)
+
+    def test_rule_for_classes_missing_from_page_is_ignored(self):
+        self.stylesheet('.sidebar h2 { margin: 0; }\n')
+        small = minify.minify(PAGE)
+        self.assertNotIn('style="margin-bottom: 1rem; color: red"', small)
+
+    def test_style_attribute_selector_keeps_style_inline(self):
+        self.stylesheet('[data-theme="dark"] [style*="color: blue"] { color: white; }\n')
+        small = minify.minify(PAGE)
+        self.assertEqual(small.count('style="color: blue"'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Incremental build behaviour of the page pipeline, on a throwaway site root.
+
+Run from the project root: python3 -m pytest scripts/tests
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sitegen import manifest, pipeline
+
+
+class PipelineTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self.manifest_file = os.path.join(self.root, '.sitegen-cache', 'manifest.json')
+
+        module = os.path.join(self.root, 'generator', 'posts.py')
+        os.makedirs(os.path.dirname(module))
+        with open(module, 'w', encoding='utf-8') as f:
+            f.write('# posts family\n')
+        self.posts = [
+            {'slug': 'first', 'title': 'First', 'status': 'published'},
+            {'slug': 'second', 'title': 'Second', 'status': 'published'},
+        ]
+        family = types.SimpleNamespace(
+            __file__=module,
+            NAME='posts',
+            TEMPLATE=None,
+            load=lambda: [post for post in self.posts if post['status'] == 'published'],
+            output_path=lambda post: f'blog/{post["slug"]}.html',
+            render=lambda post, template: f'<h1>{post["title"]}</h1>\n',
+        )
+
+        self.code_dir = os.path.join(self.root, 'sitegen')
+        os.makedirs(self.code_dir)
+        self.write_module('template.py', '# template engine\n')
+
+        for patch in (
+            mock.patch.object(pipeline, 'ROOT', self.root),
+            mock.patch.object(pipeline, 'CODE_DIR', self.code_dir),
+            mock.patch.object(manifest, 'ROOT', self.root),
+            mock.patch.object(pipeline, 'FAMILIES', {'posts': family}),
+            mock.patch.object(pipeline, 'load_manifest', lambda: manifest.load_manifest(self.manifest_file)),
+            mock.patch.object(pipeline, 'save_manifest', lambda data: manifest.save_manifest(data, self.manifest_file)),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def write_module(self, name, text):
+        with open(os.path.join(self.code_dir, name), 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def build(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return pipeline.build(jobs=1)
+
+    def output(self, path):
+        return os.path.join(self.root, path)
+
+    def test_unpublished_post_page_is_removed(self):
+        self.build()
+        self.assertTrue(os.path.exists(self.output('blog/second.html')))
+
+        self.posts[1]['status'] = 'draft'
+        summary = self.build()
+
+        self.assertEqual(summary['removed'], ['blog/second.html'])
+        self.assertEqual(summary['skipped'], ['blog/first.html'])
+        self.assertFalse(os.path.exists(self.output('blog/second.html')))
+        self.assertTrue(os.path.exists(self.output('blog/first.html')))
+        self.assertNotIn('blog/second.html', manifest.load_manifest(self.manifest_file))
+
+        # Nothing left to remove on the next run
+        self.assertEqual(self.build()['removed'], [])
+
+    def test_dry_run_keeps_withdrawn_pages(self):
+        self.build()
+        del self.posts[1]
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = pipeline.build(jobs=1, dry_run=True)
+
+        self.assertEqual(summary['removed'], ['blog/second.html'])
+        self.assertTrue(os.path.exists(self.output('blog/second.html')))
+        self.assertIn('blog/second.html', manifest.load_manifest(self.manifest_file))
+
+    def test_editing_shared_module_rebuilds_pages(self):
+        self.build()
+        self.assertEqual(len(self.build()['skipped']), 2)
+
+        self.write_module('template.py', '# template engine, fixed\n')
+        stale, _, _ = pipeline.plan()
+        self.assertEqual([changed for *_, changed in stale], [[pipeline.CODE_INPUT]] * 2)
+        self.assertEqual(sorted(self.build()['built']), ['blog/first.html', 'blog/second.html'])
+
+        # A new shared module counts too
+        self.write_module('helpers.py', '# helpers\n')
+        self.assertEqual(len(self.build()['built']), 2)
+        self.assertEqual(len(self.build()['skipped']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,15 @@ import { defineConfig } from 'vite';
 import { copyFileSync, existsSync, mkdirSync, readdirSync, statSync } from 'fs';
 import { join } from 'path';
 
+// Pre-rendered blog posts (python scripts/generate-pages.py blog)
+const blogPosts = existsSync('blog')
+  ? Object.fromEntries(
+      readdirSync('blog')
+        .filter(name => name.endsWith('.html'))
+        .map(name => [`blog/${name.slice(0, -'.html'.length)}`, `./blog/${name}`])
+    )
+  : {};
+
 export default defineConfig({
   server: {
     port: 3000,
@@ -100,7 +109,8 @@ export default defineConfig({
         'services-advisory/business-valuation': './services-advisory/business-valuation.html',
         'services-advisory/exit-succession-planning': './services-advisory/exit-succession-planning.html',
         'services-advisory/company-secretarial': './services-advisory/company-secretarial.html',
-        'services-advisory/software-systems-advisory': './services-advisory/software-systems-advisory.html'
+        'services-advisory/software-systems-advisory': './services-advisory/software-systems-advisory.html',
+        ...blogPosts
       }
     }
   },
@@ -109,8 +119,8 @@ export default defineConfig({
     {
       name: 'copy-static-assets',
       writeBundle() {
-        // Copy script.js, styles.css, blog-data.js, admin-auth.js, and Supabase config files to dist root
-        const filesToCopy = ['script.js', 'styles.css', 'blog-data.js', 'admin-auth.js', 'supabase-config.js', 'blog-data-supabase.js', 'triage-data-supabase.js', 'white logo.png'];
+        // Copy script.js, styles.css, blog-data.js, blog-search.js, admin-auth.js, and Supabase config files to dist root
+        const filesToCopy = ['script.js', 'styles.css', 'blog-data.js', 'blog-search.js', 'admin-auth.js', 'supabase-config.js', 'blog-data-supabase.js', 'triage-data-supabase.js', 'white logo.png'];
         filesToCopy.forEach(file => {
           const src = join(process.cwd(), file);
           const dest = join(process.cwd(), 'dist', file);